@@ -0,0 +1,4 @@
+"""Load-testing benchmarks for the LinkedIn MCP server against a local stand-in API.
+
+Run ``python -m benchmarks.run --help`` for options.
+"""
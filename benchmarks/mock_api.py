@@ -0,0 +1,183 @@
+"""Local stand-in for the LinkedIn REST API with configurable latency and fault injection."""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+@dataclass
+class MockOptions:
+    latency: float = 0.0       # base response delay in seconds
+    jitter: float = 0.0        # extra uniform random delay in seconds
+    error_rate: float = 0.0    # fraction of requests answered with 503
+    throttle_rate: float = 0.0 # fraction of requests answered with 429 + Retry-After
+    total_items: int = 120     # size of paged collections (posts, comments)
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+def create_app(options: MockOptions) -> Starlette:
+    """Build the mock API. All LinkedIn endpoints live under /v2, uploads under /upload, images under /images."""
+    ids = itertools.count(1)
+
+    def faulty(handler: Handler) -> Handler:
+        async def wrapped(request: Request) -> Response:
+            delay = options.latency + random.uniform(0, options.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            roll = random.random()
+            if roll < options.throttle_rate:
+                return JSONResponse({"message": "Throttled (injected)"}, status_code=429, headers={"Retry-After": "1"})
+            if roll < options.throttle_rate + options.error_rate:
+                return JSONResponse({"message": "Service unavailable (injected)"}, status_code=503)
+            return await handler(request)
+        return wrapped
+
+    def page(request: Request, make: Callable[[int], dict]) -> JSONResponse:
+        start = int(request.query_params.get("start", 0))
+        count = int(request.query_params.get("count", 10))
+        end = min(start + count, options.total_items)
+        elements = [make(i) for i in range(start, end)]
+        return JSONResponse({"elements": elements, "paging": {"start": start, "count": count, "total": options.total_items}})
+
+    async def userinfo(request: Request) -> Response:
+        return JSONResponse({
+            "sub": "bench-user", "name": "Bench User", "given_name": "Bench", "family_name": "User",
+            "email": "bench@example.com", "email_verified": True, "picture": None, "locale": "en_US",
+        })
+
+    async def ugc_posts(request: Request) -> Response:
+        if request.method == "POST":
+            await request.json()
+            post_id = f"urn:li:share:{next(ids)}"
+            return JSONResponse({"id": post_id}, status_code=201, headers={"X-RestLi-Id": post_id})
+        return page(request, lambda i: {
+            "id": f"urn:li:share:{i}",
+            "created": {"time": 1700000000000 + i},
+            "specificContent": {"com.linkedin.ugc.ShareContent": {"shareCommentary": {"text": f"Post {i}"}}},
+            "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
+        })
+
+    async def ugc_post(request: Request) -> Response:
+        return Response(status_code=204)
+
+    async def register_upload(request: Request) -> Response:
+        await request.json()
+        asset_id = next(ids)
+        upload_url = str(request.base_url).rstrip("/") + f"/upload/{asset_id}"
+        return JSONResponse({"value": {
+            "asset": f"urn:li:digitalmediaAsset:{asset_id}",
+            "uploadMechanism": {
+                "com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest": {"uploadUrl": upload_url}
+            },
+        }})
+
+    async def asset(request: Request) -> Response:
+        return Response(status_code=204)
+
+    async def upload(request: Request) -> Response:
+        async for _ in request.stream():
+            pass
+        return Response(status_code=201)
+
+    async def image(request: Request) -> Response:
+        # 64 KiB that depend only on the name, so the same URL always hashes the same
+        digest = hashlib.sha256(request.path_params["name"].encode()).digest()
+        return Response(digest * 2048, media_type="application/octet-stream")
+
+    async def comments(request: Request) -> Response:
+        if request.method == "POST":
+            await request.json()
+            return JSONResponse({"id": str(next(ids))}, status_code=201)
+        return page(request, lambda i: {
+            "id": str(i),
+            "actor": f"urn:li:person:member{i % 7}",
+            "message": {"text": f"Comment {i}"},
+            "created": {"time": 1700000000000 + i},
+        })
+
+    async def comment(request: Request) -> Response:
+        return Response(status_code=204)
+
+    def organization_doc(urn: str) -> dict:
+        org_id = urn.rsplit(":", 1)[-1]
+        return {
+            "id": org_id,
+            "localizedName": f"Company {org_id}",
+            "vanityName": f"company-{org_id}",
+            "localizedDescription": "Stand-in organization. " * 20,
+            "locations": [{"address": {"city": "Springfield", "country": "US"}}],
+            "staffCountRange": "SIZE_51_TO_200",
+        }
+
+    async def organizations(request: Request) -> Response:
+        raw = request.query_params.get("ids", "")
+        keys = [k for k in raw.removeprefix("List(").removesuffix(")").split(",") if k]
+        return JSONResponse({"results": {k: organization_doc(k) for k in keys}, "errors": {}})
+
+    async def organization(request: Request) -> Response:
+        urn = request.path_params["urn"]
+        etag = f'"org-{urn}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(organization_doc(urn), headers={"ETag": etag})
+
+    async def job(request: Request) -> Response:
+        urn = request.path_params["urn"]
+        return JSONResponse({"id": urn, "title": "Engineer", "description": "Stand-in job. " * 30, "location": "Remote"})
+
+    async def person(request: Request) -> Response:
+        urn = request.path_params["urn"]
+        return JSONResponse({"id": urn, "localizedFirstName": "Ada", "localizedLastName": "Lovelace", "headline": "Engineer"})
+
+    def search(kind: str) -> Handler:
+        async def handler(request: Request) -> Response:
+            keywords = request.query_params.get("keywords", "")
+            elements = [{"id": f"urn:li:{kind}:{i}", "name": f"{keywords} {kind} {i}"} for i in range(10)]
+            return JSONResponse({"elements": elements, "paging": {"start": 0, "count": 10, "total": 10}})
+        return handler
+
+    routes = [
+        Route("/v2/userinfo", faulty(userinfo)),
+        Route("/v2/ugcPosts", faulty(ugc_posts), methods=["GET", "POST"]),
+        Route("/v2/ugcPosts/{urn:path}", faulty(ugc_post), methods=["DELETE"]),
+        Route("/v2/assets", faulty(register_upload), methods=["POST"]),
+        Route("/v2/assets/{asset_id}", faulty(asset), methods=["DELETE"]),
+        Route("/upload/{asset_id}", faulty(upload), methods=["PUT"]),
+        Route("/images/{name}", faulty(image)),
+        Route("/v2/socialActions/{urn}/comments", faulty(comments), methods=["GET", "POST"]),
+        Route("/v2/socialActions/{urn}/comments/{comment_id}", faulty(comment), methods=["DELETE"]),
+        Route("/v2/organizations", faulty(organizations)),
+        Route("/v2/organizations/{urn:path}", faulty(organization)),
+        Route("/v2/jobs/{urn:path}", faulty(job)),
+        Route("/v2/people/{urn:path}", faulty(person)),
+        Route("/v2/companySearch", faulty(search("organization"))),
+        Route("/v2/jobSearch", faulty(search("job"))),
+        Route("/v2/peopleSearch", faulty(search("person"))),
+    ]
+    return Starlette(routes=routes)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the stand-in LinkedIn API on its own.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    options = MockOptions(args.latency, args.jitter, args.error_rate, args.throttle_rate)
+    print(f"Mock LinkedIn API on http://{args.host}:{args.port} (set API_BASE=http://{args.host}:{args.port}/v2)")
+    uvicorn.run(create_app(options), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
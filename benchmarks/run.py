@@ -0,0 +1,173 @@
+"""
+Drive the MCP tools against the local stand-in API and report throughput and latency.
+
+    python -m benchmarks.run --concurrency 32 --requests 500 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .mock_api import MockOptions, create_app
+
+DISTINCT = 50  # distinct URNs per read scenario, so caches see realistic reuse
+
+def _scenarios(image_path: str) -> Dict[str, Callable[[int], Dict[str, Any]]]:
+    """Tool name -> arguments for the i-th call."""
+    return {
+        "linkedin_get_my_profile": lambda i: {},
+        "linkedin_get_member_profile": lambda i: {"member_urn": f"urn:li:person:{i % DISTINCT}"},
+        "linkedin_get_member_profiles": lambda i: {"member_urns": [f"urn:li:person:{(i + k) % DISTINCT}" for k in range(5)]},
+        "linkedin_create_post": lambda i: {"text": f"Benchmark post {i}"},
+        "linkedin_create_image_post": lambda i: {"text": f"Benchmark image {i}", "image_source": image_path},
+        "linkedin_create_multi_image_post": lambda i: {"text": f"Benchmark carousel {i}", "image_sources": [image_path] * 4},
+        "linkedin_update_post": lambda i: {"post_urn": f"urn:li:share:{i}", "text": f"Updated {i}"},
+        "linkedin_delete_post": lambda i: {"post_urn": f"urn:li:share:{i}"},
+        "linkedin_delete_posts": lambda i: {"post_urns": [f"urn:li:share:{i}-{k}" for k in range(10)]},
+        "linkedin_update_posts": lambda i: {"items": [{"post_urn": f"urn:li:share:{i}-{k}", "text": f"Updated {i}"} for k in range(5)]},
+        "linkedin_get_recent_posts": lambda i: {"max_items": 50},
+        "linkedin_create_comment": lambda i: {"object_urn": "urn:li:share:1", "text": f"Comment {i}"},
+        "linkedin_get_post_comments": lambda i: {"object_urn": f"urn:li:share:{i % DISTINCT}", "max_items": 100},
+        "linkedin_sync_comments": lambda i: {"object_urns": [f"urn:li:share:{(i + k) % DISTINCT}" for k in range(5)]},
+        "linkedin_delete_comment": lambda i: {"comment_urn": str(i), "object_urn": "urn:li:share:1"},
+        "linkedin_get_company_profile": lambda i: {"company_urn": f"urn:li:organization:{i % DISTINCT}"},
+        "linkedin_get_company_profiles": lambda i: {"company_urns": [f"urn:li:organization:{(i + k) % DISTINCT}" for k in range(10)]},
+        "linkedin_search_companies": lambda i: {"keywords": f"acme {i % DISTINCT}"},
+        "linkedin_search_jobs": lambda i: {"keywords": f"python {i % DISTINCT}", "location": "Remote"},
+        "linkedin_get_job_details": lambda i: {"job_urn": f"urn:li:job:{i % DISTINCT}"},
+        "linkedin_get_job_details_batch": lambda i: {"job_urns": [f"urn:li:job:{(i + k) % DISTINCT}" for k in range(5)]},
+        "linkedin_search_people": lambda i: {"keywords": f"engineer {i % DISTINCT}"},
+    }
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def _start_mock(options: MockOptions, port: int):
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_app(options), host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.ensure_future(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    return server, task
+
+async def _drive(client: Any, tool: str, make_args: Callable[[int], Dict[str, Any]], requests: int, concurrency: int) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, make_args(i), raise_on_error=False)
+                failed = result.is_error
+            except Exception:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            if failed:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "tool": tool,
+        "calls": requests,
+        "errors": errors,
+        "throughput": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+def _print_table(rows: List[Dict[str, Any]]) -> None:
+    header = f"{'tool':<34} {'calls':>6} {'errors':>6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['tool']:<34} {row['calls']:>6} {row['errors']:>6} {row['throughput']:>9.1f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from linkedin_mcp_server.config import settings
+
+    port = _free_port()
+    workdir = tempfile.mkdtemp(prefix="linkedin-mcp-bench-")
+    # Point every upstream call at the stand-in API and keep local state out of the repo
+    settings.api_base = f"http://127.0.0.1:{port}/v2"
+    settings.linkedin_access_token = "bench-token"
+    settings.token_env_path = os.path.join(workdir, ".env")
+    settings.data_dir = workdir
+    settings.cache_enabled = not args.no_cache
+    settings.rate_limit_enabled = args.rate_limit
+    settings.retry_backoff_base = 0.05
+
+    from fastmcp import Client
+    from linkedin_mcp_server.server import mcp
+
+    image_path = os.path.join(workdir, "image.bin")
+    with open(image_path, "wb") as f:
+        f.write(os.urandom(args.image_kb * 1024))
+
+    scenarios = _scenarios(image_path)
+    tools = args.tools.split(",") if args.tools else list(scenarios)
+    unknown = [tool for tool in tools if tool not in scenarios]
+    if unknown:
+        raise SystemExit(f"Unknown tools: {', '.join(unknown)}")
+
+    options = MockOptions(args.latency, args.jitter, args.error_rate, args.throttle_rate)
+    server, task = await _start_mock(options, port)
+    rows = []
+    try:
+        async with Client(mcp) as client:
+            for tool in tools:
+                rows.append(await _drive(client, tool, scenarios[tool], args.requests, args.concurrency))
+    finally:
+        server.should_exit = True
+        await task
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MCP tools against a local stand-in LinkedIn API.")
+    parser.add_argument("--requests", type=int, default=200, help="calls per tool")
+    parser.add_argument("--concurrency", type=int, default=16, help="calls in flight per tool")
+    parser.add_argument("--tools", default="", help="comma-separated tool names (default: all)")
+    parser.add_argument("--latency", type=float, default=0.02, help="mock API base latency, seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="mock API random extra latency, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of mock responses that are 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of mock responses that are 429")
+    parser.add_argument("--image-kb", type=int, default=256, help="image size for image-post scenarios")
+    parser.add_argument("--no-cache", action="store_true", help="disable the response cache")
+    parser.add_argument("--rate-limit", action="store_true", help="keep the client-side rate limiter on")
+    parser.add_argument("--json", dest="json_path", default="", help="also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(run(args))
+    _print_table(rows)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"args": vars(args), "results": rows}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure cold import time of the server in fresh interpreters and fail over budget.
+The budget is the recorded baseline (startup_baseline.json) plus a small margin;
+re-record it on a new machine or after an intended change.
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --runs 9 --record
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# What an MCP client pays per stdio launch, and what a plain library user pays
+TARGETS: Dict[str, str] = {
+    "package": "linkedin_mcp_server",
+    "server": "linkedin_mcp_server.server",
+}
+BUDGETED = "server"
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+DEFAULT_MARGIN = 0.15
+
+_PROBE = "import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+
+def import_ms(module: str) -> float:
+    """Import `module` in a fresh interpreter and return the time it took in milliseconds."""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+def slowest_imports(module: str, top: int) -> List[tuple]:
+    """(self µs, cumulative µs, name) for the slowest imports, from `python -X importtime`."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+def load_baseline(path: str) -> Optional[float]:
+    """Recorded median server import in milliseconds, or None if nothing was recorded."""
+    try:
+        with open(path) as f:
+            return float(json.load(f)[BUDGETED])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark with a time budget.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per target")
+    parser.add_argument(
+        "--budget-ms", type=float, default=float(os.environ["STARTUP_BUDGET_MS"]) if "STARTUP_BUDGET_MS" in os.environ else None,
+        help="fail if the median server import exceeds this (default: $STARTUP_BUDGET_MS, else baseline + margin)",
+    )
+    parser.add_argument(
+        "--margin", type=float, default=DEFAULT_MARGIN, help="allowed slowdown over the baseline (default: 0.15)"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file (default: benchmarks/startup_baseline.json)")
+    parser.add_argument("--record", action="store_true", help="save this run's medians as the new baseline")
+    parser.add_argument("--profile", type=int, default=0, metavar="N", help="also list the N slowest imports")
+    args = parser.parse_args(argv)
+
+    medians = {}
+    print(f"{'target':<10} {'min ms':>9} {'median ms':>10} {'max ms':>9}")
+    for label, module in TARGETS.items():
+        samples = [import_ms(module) for _ in range(args.runs)]
+        medians[label] = statistics.median(samples)
+        print(f"{label:<10} {min(samples):>9.1f} {medians[label]:>10.1f} {max(samples):>9.1f}")
+
+    if args.profile:
+        print(f"\nSlowest imports of {TARGETS[BUDGETED]} (self ms, cumulative ms):")
+        for self_us, cumulative_us, name in slowest_imports(TARGETS[BUDGETED], args.profile):
+            print(f"  {self_us / 1000:>8.1f} {cumulative_us / 1000:>9.1f}  {name}")
+
+    if args.record:
+        with open(args.baseline, "w") as f:
+            json.dump({label: round(ms, 1) for label, ms in medians.items()}, f, indent=2)
+            f.write("\n")
+        print(f"\nRecorded baseline: {BUDGETED} import {medians[BUDGETED]:.1f}ms -> {args.baseline}")
+        return 0
+
+    budget = args.budget_ms
+    if budget is None:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            print(f"\nNo baseline at {args.baseline}; run with --record first or pass --budget-ms")
+            return 2
+        budget = baseline * (1 + args.margin)
+        print(f"\nBudget: baseline {baseline:.1f}ms + {args.margin:.0%}")
+    if medians[BUDGETED] > budget:
+        print(f"FAIL: {BUDGETED} import {medians[BUDGETED]:.1f}ms exceeds budget {budget:.0f}ms")
+        return 1
+    print(f"OK: {BUDGETED} import {medians[BUDGETED]:.1f}ms within budget {budget:.0f}ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
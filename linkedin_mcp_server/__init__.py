@@ -8,6 +8,11 @@ __version__ = "1.0.0"
 __author__ = "SARAM ALI"
 __email__ = "saramali15792@gmail.com"
 
-from .server import mcp
+def __getattr__(name):
+    # Importing the package stays cheap; FastMCP and the tool registry load on first use
+    if name == "mcp":
+        from .server import mcp
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = ["mcp", "__version__"]
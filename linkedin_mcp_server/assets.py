@@ -0,0 +1,88 @@
+import hashlib
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+from .config import settings
+from .storage import LazyStore, connect, data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    content_hash TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    asset_urn TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, owner)
+);
+CREATE INDEX IF NOT EXISTS idx_assets_urn ON assets (asset_urn);
+"""
+
+class AssetCache:
+    """
+    SQLite map of (image content SHA-256, owner URN) -> uploaded asset URN, so an
+    identical image is registered and uploaded once per owner and reused until
+    it expires or LinkedIn rejects it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+
+    def get(self, content_hash: str, owner: str, max_age: float) -> Optional[str]:
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT asset_urn FROM assets WHERE content_hash = ? AND owner = ? AND created_at >= ?",
+                (content_hash, owner, time.time() - max_age),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row["asset_urn"]
+
+    def put(self, content_hash: str, owner: str, asset_urn: str, size: int) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO assets (content_hash, owner, asset_urn, size, created_at) VALUES (?, ?, ?, ?, ?)",
+                (content_hash, owner, asset_urn, size, time.time()),
+            )
+
+    def forget(self, asset_urns: Iterable[str]) -> int:
+        """Drop entries for assets LinkedIn rejected or that were deleted."""
+        with connect(self.path) as conn:
+            cur = conn.executemany("DELETE FROM assets WHERE asset_urn = ?", [(urn,) for urn in asset_urns])
+            return cur.rowcount
+
+    def purge(self, max_age: float) -> int:
+        """Delete expired entries."""
+        with connect(self.path) as conn:
+            cur = conn.execute("DELETE FROM assets WHERE created_at < ?", (time.time() - max_age,))
+            return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with connect(self.path) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+def _open_asset_cache() -> AssetCache:
+    cache = AssetCache(settings.asset_cache_db_path or data_path("assets.db"))
+    cache.purge(settings.asset_cache_ttl)
+    return cache
+
+# The process-wide asset cache, pruned when its database is first opened
+get_asset_cache = LazyStore(_open_asset_cache)
+
+def hash_file(path: str, chunk_size: int) -> Tuple[str, int]:
+    """SHA-256 hex digest and size of a local file, read in chunks (blocking)."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
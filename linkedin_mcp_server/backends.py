@@ -0,0 +1,194 @@
+import asyncio
+import hashlib
+import importlib
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Set
+from .config import settings
+from .storage import connect, data_path
+
+def token_scope(authorization: str) -> str:
+    """Stable short key for an Authorization header, so shared stores never hold the token itself."""
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+class SharedBackend(ABC):
+    """
+    State shared by every worker process: a TTL key-value store (response and identity
+    caches) and token buckets that are refilled and drawn from atomically. Subclass it to
+    plug in another store and point STATE_BACKEND at 'package.module:factory'.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete_prefix(self, namespace: str, prefix: str) -> None:
+        ...
+
+    @abstractmethod
+    async def take(self, bucket: str, rate: float, capacity: int) -> float:
+        """Take one token; returns 0 on success, else the seconds to wait before trying again."""
+
+    @abstractmethod
+    async def pause(self, bucket: str, seconds: float) -> None:
+        """Hold a bucket for every worker (e.g. after a 429 with Retry-After)."""
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_kv_expires ON kv (expires_at);
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    blocked_until REAL NOT NULL
+);
+"""
+
+class SQLiteBackend(SharedBackend):
+    """
+    Shared state in one SQLite file (WAL), for several workers on one machine.
+    Bucket updates run in BEGIN IMMEDIATE transactions, so workers never overdraw a bucket.
+    Expired entries are never returned; each worker deletes them every PURGE_INTERVAL seconds.
+    """
+
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._next_purge = 0.0
+        with connect(self.path) as conn:
+            conn.executescript(SQLITE_SCHEMA)
+
+    def _get(self, namespace: str, key: str) -> Optional[Any]:
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, key, time.time()),
+            ).fetchone()
+        return json.loads(row["value"]) if row is not None else None
+
+    def _set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), time.time() + ttl),
+            )
+            now = time.time()
+            if now >= self._next_purge:
+                self._next_purge = now + self.PURGE_INTERVAL
+                conn.execute("DELETE FROM kv WHERE expires_at <= ?", (now,))
+
+    def _delete_prefix(self, namespace: str, prefix: str) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "DELETE FROM kv WHERE namespace = ? AND substr(key, 1, ?) = ?", (namespace, len(prefix), prefix)
+            )
+
+    def _take(self, bucket: str, rate: float, capacity: int) -> float:
+        with connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute("SELECT * FROM buckets WHERE key = ?", (bucket,)).fetchone()
+                if row is None:
+                    tokens, blocked_until = float(capacity), 0.0
+                else:
+                    tokens = min(capacity, row["tokens"] + max(0.0, now - row["updated"]) * rate)
+                    blocked_until = row["blocked_until"]
+                wait = 0.0
+                if now < blocked_until:
+                    wait = blocked_until - now
+                elif tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / rate
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated, blocked_until) VALUES (?, ?, ?, ?)",
+                    (bucket, tokens, now, blocked_until),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def _pause(self, bucket: str, seconds: float) -> None:
+        with connect(self.path) as conn:
+            now = time.time()
+            conn.execute(
+                "INSERT INTO buckets (key, tokens, updated, blocked_until) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET tokens = 0, updated = excluded.updated, "
+                "blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (bucket, now, now + seconds),
+            )
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get, namespace, key)
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        await asyncio.to_thread(self._set, namespace, key, value, ttl)
+
+    async def delete_prefix(self, namespace: str, prefix: str) -> None:
+        await asyncio.to_thread(self._delete_prefix, namespace, prefix)
+
+    async def take(self, bucket: str, rate: float, capacity: int) -> float:
+        return await asyncio.to_thread(self._take, bucket, rate, capacity)
+
+    async def pause(self, bucket: str, seconds: float) -> None:
+        await asyncio.to_thread(self._pause, bucket, seconds)
+
+BACKENDS: Dict[str, Callable[[], SharedBackend]] = {
+    "sqlite": lambda: SQLiteBackend(settings.state_db_path or data_path("state.db")),
+}
+
+_backend: Optional[SharedBackend] = None
+_loaded = False
+
+def get_shared_backend() -> Optional[SharedBackend]:
+    """
+    The configured shared backend, or None for 'memory' (state stays in this process).
+    STATE_BACKEND is 'memory', a name in BACKENDS, or 'package.module:factory'.
+    """
+    global _backend, _loaded
+    if not _loaded:
+        name = settings.state_backend
+        if name == "memory":
+            _backend = None
+        elif name in BACKENDS:
+            _backend = BACKENDS[name]()
+        elif ":" in name:
+            module, factory = name.split(":", 1)
+            _backend = getattr(importlib.import_module(module), factory)()
+        else:
+            raise ValueError(f"Unknown STATE_BACKEND {name!r}; use 'memory', 'sqlite' or 'package.module:factory'.")
+        _loaded = True
+    return _backend
+
+_background: Set[asyncio.Future] = set()
+
+def forget_shared(authorization: str) -> None:
+    """Drop a token's shared cache entries in the background (callable from sync code)."""
+    backend = get_shared_backend()
+    if backend is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    scope = token_scope(authorization)
+    for namespace in ("response", "identity"):
+        task = loop.create_task(backend.delete_prefix(namespace, scope))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
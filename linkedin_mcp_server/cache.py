@@ -0,0 +1,153 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from .backends import SharedBackend, get_shared_backend, token_scope
+from .client import get_client
+from .config import settings
+from .singleflight import SingleFlight
+
+@dataclass
+class CacheEntry:
+    data: Any
+    etag: Optional[str]
+    expires_at: float
+
+class ResponseCache:
+    """
+    Bounded LRU cache of upstream JSON documents, scoped per access token.
+    Stale entries with an ETag are revalidated with If-None-Match instead of refetched.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        # Coalesces concurrent upstream GETs for the same (token, URL)
+        self.upstream = SingleFlight()
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries if self._max_entries is not None else settings.cache_max_entries
+
+    def get(self, key: Tuple[str, str]) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[str, str], entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, authorization: Optional[str] = None) -> None:
+        """Drop every entry for one Authorization header, or the whole cache."""
+        if authorization is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == authorization]:
+            del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "coalesced": self.upstream.coalesced,
+            "in_flight": self.upstream.in_flight(),
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+response_cache = ResponseCache()
+
+def _ttl(endpoint: str) -> float:
+    return settings.cache_ttls.get(endpoint, settings.cache_default_ttl)
+
+def prime_json(url: str, headers: Dict[str, str], endpoint: str, data: Any) -> None:
+    """Seed the cache with a document obtained another way (e.g. from a BATCH_GET)."""
+    if settings.cache_enabled:
+        key = (headers["Authorization"], url)
+        response_cache.put(key, CacheEntry(data=data, etag=None, expires_at=time.monotonic() + _ttl(endpoint)))
+
+async def cached_get_json(url: str, headers: Dict[str, str], endpoint: str) -> Any:
+    """
+    GET `url` and return its JSON body, served from the response cache when fresh.
+    `endpoint` selects the TTL from settings.cache_ttls (e.g. 'organizations').
+    Concurrent identical GETs (same URL and token) share one upstream request.
+    """
+    key = (headers["Authorization"], url)
+    if settings.cache_enabled:
+        entry = response_cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            response_cache.hits += 1
+            return entry.data
+    return await response_cache.upstream.do(key, lambda: _fetch(key, url, headers, endpoint))
+
+async def _fetch(key: Tuple[str, str], url: str, headers: Dict[str, str], endpoint: str) -> Any:
+    client = get_client()
+    if not settings.cache_enabled:
+        resp = await client.get(url, headers=headers)
+        resp.raise_for_status()
+        return resp.json()
+
+    entry = response_cache.get(key)
+    shared = get_shared_backend()
+    if entry is None and shared is not None:
+        # Another worker may already hold this document (fresh, or stale with an ETag)
+        entry = await _load_shared(shared, key)
+        if entry is not None:
+            response_cache.put(key, entry)
+            if entry.expires_at > time.monotonic():
+                response_cache.hits += 1
+                return entry.data
+    request_headers = headers
+    if entry is not None and entry.etag:
+        request_headers = {**headers, "If-None-Match": entry.etag}
+
+    resp = await client.get(url, headers=request_headers)
+    now = time.monotonic()
+    if resp.status_code == 304 and entry is not None:
+        # Unchanged upstream: extend the stale entry instead of re-downloading
+        response_cache.hits += 1
+        response_cache.revalidations += 1
+        entry.expires_at = now + _ttl(endpoint)
+        if shared is not None:
+            await _store_shared(shared, key, entry, endpoint)
+        return entry.data
+
+    response_cache.misses += 1
+    resp.raise_for_status()
+    data = resp.json()
+    entry = CacheEntry(data=data, etag=resp.headers.get("ETag"), expires_at=now + _ttl(endpoint))
+    response_cache.put(key, entry)
+    if shared is not None:
+        await _store_shared(shared, key, entry, endpoint)
+    return data
+
+def _shared_key(key: Tuple[str, str]) -> str:
+    authorization, url = key
+    return f"{token_scope(authorization)}|{url}"
+
+async def _load_shared(shared: SharedBackend, key: Tuple[str, str]) -> Optional[CacheEntry]:
+    doc = await shared.get("response", _shared_key(key))
+    if doc is None:
+        return None
+    # Workers share wall-clock time; entries in this process use the monotonic clock
+    expires_at = time.monotonic() + (doc["fresh_until"] - time.time())
+    return CacheEntry(data=doc["data"], etag=doc["etag"], expires_at=expires_at)
+
+async def _store_shared(shared: SharedBackend, key: Tuple[str, str], entry: CacheEntry, endpoint: str) -> None:
+    fresh_until = time.time() + (entry.expires_at - time.monotonic())
+    doc = {"data": entry.data, "etag": entry.etag, "fresh_until": fresh_until}
+    # Kept for another TTL once stale, so other workers can still revalidate by ETag
+    await shared.set("response", _shared_key(key), doc, 2 * _ttl(endpoint))
@@ -0,0 +1,72 @@
+import importlib.util
+import httpx
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+from .config import settings
+from .ratelimit import RateLimitTransport
+from .resilience import ResilienceTransport
+from .metrics import MetricsTransport
+
+# One pooled client per process so tool calls reuse TCP/TLS connections
+_client: Optional[httpx.AsyncClient] = None
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional 'h2' package (pip install httpx[http2])."""
+    return importlib.util.find_spec("h2") is not None
+
+def _wrap_transport(transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """
+    Layer the shared request policies over a raw transport: retries and the
+    circuit breaker on the outside, so an open circuit never queues for a token,
+    and metrics innermost, so every physical attempt is counted. Outermost, a
+    rejected token's cached data is dropped once its final 401 comes back.
+    """
+    # Imported here: tokens needs this module for its own refresh requests
+    from .tokens import UnauthorizedTransport
+    if settings.metrics_enabled:
+        transport = MetricsTransport(transport)
+    limiters = None
+    if settings.multi_tenant:
+        # Each tenant spends its own rate-limit budget over the shared pool
+        from .tenants import tenant_registry
+        limiters = tenant_registry.limiter_for
+    return UnauthorizedTransport(ResilienceTransport(RateLimitTransport(transport, limiters=limiters)))
+
+def _build_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    timeout = httpx.Timeout(settings.http_timeout, connect=settings.http_connect_timeout)
+    transport = httpx.AsyncHTTPTransport(
+        http2=settings.http_http2 and _http2_available(),
+        limits=limits,
+    )
+    return httpx.AsyncClient(transport=_wrap_transport(transport), timeout=timeout)
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+    Scripts that call tool functions directly (outside the server) get one lazily.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+async def close_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+@asynccontextmanager
+async def lifespan(server: Any) -> AsyncIterator[dict]:
+    """FastMCP lifespan: open the connection pool at startup, close it at shutdown."""
+    get_client()
+    try:
+        yield {}
+    finally:
+        await close_client()
@@ -0,0 +1,101 @@
+import time
+from typing import Any, Dict, List
+from .config import settings
+from .storage import LazyStore, connect, data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS comments (
+    scope TEXT NOT NULL,
+    object_urn TEXT NOT NULL,
+    id TEXT NOT NULL,
+    actor TEXT,
+    text TEXT,
+    created INTEGER,
+    PRIMARY KEY (scope, object_urn, id)
+);
+CREATE TABLE IF NOT EXISTS comment_sync (
+    scope TEXT NOT NULL,
+    object_urn TEXT NOT NULL,
+    cursor INTEGER NOT NULL,
+    high_water INTEGER,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (scope, object_urn)
+);
+"""
+
+class CommentStore:
+    """
+    Local copy of each post's comments plus its sync state: the paging cursor to
+    resume from and the high-water mark (latest `created` time, epoch ms) seen so far.
+    Everything is kept per token scope, so each caller syncs (and gets deltas) on its own.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with connect(self.path) as conn:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(comment_sync)")}
+            if columns and "scope" not in columns:
+                # Stores from before per-token scoping can't be attributed to a caller; start over
+                conn.executescript("DROP TABLE comments; DROP TABLE comment_sync;")
+            conn.executescript(SCHEMA)
+
+    def state(self, scope: str, object_urn: str) -> Dict[str, Any]:
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT * FROM comment_sync WHERE scope = ? AND object_urn = ?", (scope, object_urn)
+            ).fetchone()
+        if row is None:
+            return {"cursor": 0, "high_water": None, "synced_at": None}
+        return dict(row)
+
+    def save(self, scope: str, object_urn: str, comments: List[Dict[str, Any]], cursor: int) -> List[Dict[str, Any]]:
+        """
+        Store comments not seen before and advance the sync state, in one transaction.
+        Returns the newly stored comments (the delta), oldest first.
+        """
+        with connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT high_water FROM comment_sync WHERE scope = ? AND object_urn = ?", (scope, object_urn)
+                ).fetchone()
+                high_water = row["high_water"] if row is not None else None
+                added = []
+                for comment in comments:
+                    created = comment.get("created")
+                    # Older than the mark means already synced; at the mark, only an unseen ID is new
+                    if high_water is not None and created is not None and created < high_water:
+                        continue
+                    cur = conn.execute(
+                        "INSERT OR IGNORE INTO comments (scope, object_urn, id, actor, text, created) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (scope, object_urn, str(comment["id"]), comment.get("actor"), comment.get("text"), created),
+                    )
+                    if cur.rowcount:
+                        added.append(comment)
+                created_times = [c["created"] for c in added if c.get("created") is not None]
+                if created_times:
+                    high_water = max([high_water or 0] + created_times)
+                conn.execute(
+                    "INSERT INTO comment_sync (scope, object_urn, cursor, high_water, synced_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (scope, object_urn) DO UPDATE SET "
+                    "cursor = excluded.cursor, high_water = excluded.high_water, synced_at = excluded.synced_at",
+                    (scope, object_urn, cursor, high_water, time.time()),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return sorted(added, key=lambda c: c.get("created") or 0)
+
+    def count(self, scope: str, object_urn: str) -> int:
+        with connect(self.path) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM comments WHERE scope = ? AND object_urn = ?", (scope, object_urn)
+            ).fetchone()[0]
+
+def _open_comment_store() -> CommentStore:
+    return CommentStore(settings.comment_store_db_path or data_path("comments.db"))
+
+# The process-wide comment store
+get_comment_store = LazyStore(_open_comment_store)
@@ -1,21 +1,157 @@
-import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-load_dotenv()
-
 class Settings(BaseSettings):
-    linkedin_client_id: Optional[str] = os.getenv("LINKEDIN_CLIENT_ID")
-    linkedin_client_secret: Optional[str] = os.getenv("LINKEDIN_CLIENT_SECRET")
-    linkedin_access_token: Optional[str] = os.getenv("LINKEDIN_ACCESS_TOKEN")
-    linkedin_redirect_uri: str = os.getenv("LINKEDIN_REDIRECT_URI", "http://localhost:8000")
+    linkedin_client_id: Optional[str] = None
+    linkedin_client_secret: Optional[str] = None
+    linkedin_access_token: Optional[str] = None
+    linkedin_refresh_token: Optional[str] = None
+    linkedin_token_expires_at: Optional[float] = None
+    linkedin_redirect_uri: str = "http://localhost:8000"
     server_host: str = "127.0.0.1"
     server_port: int = 8000
     
     # API Config
     api_base: str = "https://api.linkedin.com/v2"
+
+    # Deployment: "sse" (one process) or "http" (stateless streamable HTTP, SERVER_WORKERS processes)
+    server_transport: str = "sse"
+    server_workers: int = 1
+    http_path: str = "/mcp"
+
+    # State shared between workers (response/identity caches, rate limits): "memory", "sqlite"
+    # or "package.module:factory" for a custom backends.SharedBackend
+    state_backend: str = "memory"
+    state_db_path: Optional[str] = None
+
+    # Multi-tenant mode: each MCP session brings its own LinkedIn token
+    multi_tenant: bool = False
+    tenant_token_header: str = "X-LinkedIn-Token"
+    tenant_max_tenants: int = 1000
+    tenant_idle_timeout: float = 3600.0
+
+    # Token Store
+    token_env_path: str = ".env"
+    token_refresh_margin: float = 24 * 3600
+
+    # HTTP Client (shared connection pool)
+    http_timeout: float = 30.0
+    http_connect_timeout: float = 10.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_http2: bool = True
+
+    # Rate Limiting (requests/second per endpoint family; 429s are queued, not failed)
+    rate_limit_enabled: bool = True
+    rate_limits: Dict[str, float] = {
+        "posts": 1.0,
+        "social_actions": 2.0,
+        "search": 2.0,
+        "organizations": 5.0,
+        "default": 10.0,
+    }
+    rate_limit_burst: int = 10
+    rate_limit_default_backoff: float = 5.0
+    rate_limit_max_wait: float = 60.0
+    rate_limit_max_retries: int = 3
+
+    # Retries (idempotent GET/DELETE only) and per-host circuit breaker
+    retry_max_attempts: int = 3
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 8.0
+    retry_deadline: float = 30.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+
+    # Metrics (served at /metrics on the SSE server)
+    metrics_enabled: bool = True
+
+    # Tool Output: the JSON text sent next to structuredContent (compact = no indentation, orjson when installed)
+    compact_json: bool = True
+
+    # Pagination (posts, comments)
+    page_size: int = 50
+    page_max_items: int = 1000
+
+    # Batch Tools
+    batch_concurrency: int = 8
+    batch_max_ids: int = 50
+
+    # Local Storage (SQLite databases for queues, caches and indexes)
+    data_dir: str = ".linkedin_mcp"
+
+    # Local full-text index of search results (jobs, companies, people)
+    search_index_enabled: bool = True
+    search_index_db_path: Optional[str] = None
+    search_index_max_results: int = 50
+    search_index_refresh_limit: int = 5
+
+    # Comment Sync (local per-post comment store)
+    comment_store_db_path: Optional[str] = None
+    comment_sync_overlap: int = 10
+
+    # Scheduled Posts
+    schedule_db_path: Optional[str] = None
+    schedule_workers: int = 4
+    schedule_poll_interval: float = 15.0
+    schedule_lease: float = 600.0
+
+    # Background Tasks (long-running tools called with background=true)
+    task_concurrency: int = 4
+    task_max_active: int = 100
+    task_retention: float = 3600.0
+
+    # Idempotency keys for write tools (results remembered for the window, in seconds)
+    idempotency_window: float = 24 * 3600
+    idempotency_lease: float = 300.0
+    idempotency_db_path: Optional[str] = None
+
+    # Image Upload
+    upload_chunk_size: int = 64 * 1024
+    upload_concurrency: int = 4
+
+    # Uploaded-image cache (content hash + owner -> asset URN), TTL in seconds
+    asset_cache_enabled: bool = True
+    asset_cache_ttl: float = 7 * 24 * 3600
+    asset_cache_db_path: Optional[str] = None
+
+    # Response Cache (read-only tools), TTLs in seconds per endpoint
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_default_ttl: float = 300.0
+    cache_ttls: Dict[str, float] = {
+        "organizations": 3600.0,
+        "jobs": 900.0,
+        "people": 3600.0,
+        "companySearch": 300.0,
+        "jobSearch": 300.0,
+        "peopleSearch": 300.0,
+    }
     
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load .env into the environment and build the settings, once, on first use."""
+    load_dotenv()
+    return Settings()
+
+class LazySettings:
+    """
+    Proxy for the shared Settings instance. Importing a module that holds `settings`
+    costs nothing; the environment and .env are only read on the first attribute access.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+settings = LazySettings()
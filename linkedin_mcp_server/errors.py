@@ -0,0 +1,86 @@
+from typing import Optional
+import httpx
+from fastmcp.exceptions import ToolError
+from .ratelimit import retry_after_seconds
+
+class LinkedInError(ToolError):
+    """
+    A failed tool call. FastMCP returns it to the client as an error result (isError) carrying
+    the message; in-process callers branch on `code` instead of parsing text.
+    """
+
+    code = "error"
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+class Unauthorized(LinkedInError):
+    code = "unauthorized"
+
+class Forbidden(LinkedInError):
+    code = "forbidden"
+
+class NotFound(LinkedInError):
+    code = "not_found"
+
+class RateLimited(LinkedInError):
+    code = "rate_limited"
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message, 429)
+        self.retry_after = retry_after
+
+class InvalidRequest(LinkedInError):
+    """Bad arguments, or a tool that isn't configured or available in this deployment."""
+
+    code = "invalid_request"
+
+class Unavailable(LinkedInError):
+    """LinkedIn can't be reached (circuit open, connection failure) or the server is at capacity."""
+
+    code = "unavailable"
+
+class Conflict(LinkedInError):
+    """An earlier call with the same idempotency key may already have reached LinkedIn."""
+
+    code = "conflict"
+
+class ApiError(LinkedInError):
+    code = "api_error"
+
+def api_error(e: Exception) -> LinkedInError:
+    """Map an exception raised while calling LinkedIn to the typed error reported for it."""
+    if isinstance(e, LinkedInError):
+        return e
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        try:
+            error_details = e.response.json()
+            message = error_details.get("message", e.response.text)
+        except:
+            message = e.response.text
+
+        if status == 401:
+            # The client's transport has already dropped what was cached under the rejected token
+            return Unauthorized(
+                "Unauthorized (401). Your access token might be invalid or expired. Please re-authenticate.", status
+            )
+        if status == 403:
+            return Forbidden(f"Forbidden (403). You lack permissions for this action. Message: {message}", status)
+        if status == 404:
+            return NotFound(f"Not found (404): {message}", status)
+        if status == 429:
+            # Only reached once the shared limiter has already queued and retried the call
+            delay = retry_after_seconds(e.response)
+            if delay is not None:
+                return RateLimited(f"Rate limit exceeded. LinkedIn asked to retry after {delay:.0f} seconds.", delay)
+            return RateLimited("Rate limit exceeded. Please wait a moment.")
+
+        return ApiError(f"API request failed ({status}): {message}", status)
+
+    if isinstance(e, httpx.TransportError):
+        return Unavailable(str(e))
+    if isinstance(e, (ValueError, FileNotFoundError)):
+        return InvalidRequest(str(e))
+    return LinkedInError(str(e))
@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+import httpx
+from pydantic import BaseModel
+from .config import settings
+from .errors import Conflict, InvalidRequest, LinkedInError
+from .resilience import CircuitOpenError
+from .singleflight import SingleFlight
+from .storage import LazyStore, connect, data_path
+
+M = TypeVar("M", bound=BaseModel)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    owner TEXT NOT NULL,
+    key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (owner, key)
+);
+"""
+
+class IdempotencyStore:
+    """
+    SQLite record of write-tool calls by (owner URN, idempotency key): 'pending' while the
+    first call runs, then 'done' with its result, or 'unknown' if it failed after the request
+    may have reached LinkedIn, for settings.idempotency_window seconds.
+    Claims are atomic, so workers sharing the file never run the same key twice.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.replays = 0
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+
+    def claim(self, owner: str, key: str, fingerprint: str, window: float, lease: float) -> Tuple[str, Optional[str]]:
+        """
+        Returns ('claimed', None) when the caller should run the call, ('done', result) for a
+        remembered result, ('pending', None) while another worker runs it, ('unknown', None) when
+        the first call's outcome is unknown, or ('mismatch', None) when the key was used with
+        different arguments.
+        """
+        with connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT * FROM idempotency_keys WHERE owner = ? AND key = ?", (owner, key)
+                ).fetchone()
+                expired = row is not None and row["status"] != "pending" and row["created_at"] < now - window
+                if row is None or expired:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO idempotency_keys (owner, key, fingerprint, status, result, created_at) "
+                        "VALUES (?, ?, ?, 'pending', NULL, ?)",
+                        (owner, key, fingerprint, now),
+                    )
+                    outcome = ("claimed", None)
+                elif row["fingerprint"] != fingerprint:
+                    outcome = ("mismatch", None)
+                elif row["status"] == "pending" and row["created_at"] < now - lease:
+                    # A claim this old belongs to a worker that died mid-call, maybe after sending
+                    conn.execute(
+                        "UPDATE idempotency_keys SET status = 'unknown', created_at = ? WHERE owner = ? AND key = ?",
+                        (now, owner, key),
+                    )
+                    outcome = ("unknown", None)
+                else:
+                    outcome = (row["status"], row["result"])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if outcome[0] == "done":
+            self.replays += 1
+        return outcome
+
+    def complete(self, owner: str, key: str, result: str) -> None:
+        with connect(self.path) as conn:
+            conn.execute(
+                "UPDATE idempotency_keys SET status = 'done', result = ?, created_at = ? WHERE owner = ? AND key = ?",
+                (result, time.time(), owner, key),
+            )
+
+    def mark_unknown(self, owner: str, key: str) -> None:
+        """Block the key for the window: its call may have published even though it failed."""
+        with connect(self.path) as conn:
+            conn.execute(
+                "UPDATE idempotency_keys SET status = 'unknown', created_at = ? WHERE owner = ? AND key = ?",
+                (time.time(), owner, key),
+            )
+
+    def release(self, owner: str, key: str) -> None:
+        """Forget a claim whose call failed, so the key can be retried."""
+        with connect(self.path) as conn:
+            conn.execute(
+                "DELETE FROM idempotency_keys WHERE owner = ? AND key = ? AND status = 'pending'", (owner, key)
+            )
+
+    def purge(self, window: float) -> int:
+        """Delete results older than the window."""
+        with connect(self.path) as conn:
+            cur = conn.execute(
+                "DELETE FROM idempotency_keys WHERE status != 'pending' AND created_at < ?", (time.time() - window,)
+            )
+            return cur.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with connect(self.path) as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM idempotency_keys").fetchone()[0]
+        return {"entries": entries, "replays": self.replays}
+
+def _open_idempotency_store() -> IdempotencyStore:
+    store = IdempotencyStore(settings.idempotency_db_path or data_path("idempotency.db"))
+    store.purge(settings.idempotency_window)
+    return store
+
+# The process-wide idempotency store, pruned when its database is first opened
+get_idempotency_store = LazyStore(_open_idempotency_store)
+
+# Concurrent calls with one key in this process wait on the first; other workers poll the claim.
+# A write whose callers were all cancelled is cancelled too, rather than publishing unseen.
+_calls = SingleFlight(cancel_abandoned=True)
+
+POLL_INTERVAL = 0.2
+
+def fingerprint(tool: str, arguments: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps([tool, arguments], sort_keys=True).encode()).hexdigest()
+
+def never_sent(e: BaseException) -> bool:
+    """
+    True only for failures known to come before the write reached LinkedIn, or that LinkedIn
+    rejected: the tool's own checks, a missing image file, no connection, an open circuit, or
+    a 4xx answer. Anything else may have published: timeouts after sending, dropped
+    connections, 5xx, a response that couldn't be read, cancellation.
+    """
+    if isinstance(e, LinkedInError):
+        if e.__cause__ is None or e.__cause__ is e:
+            # Raised by the tool itself, before or instead of the write
+            return e.status is None or 400 <= e.status < 500
+        e = e.__cause__
+    if isinstance(e, httpx.HTTPStatusError):
+        return 400 <= e.response.status_code < 500
+    return isinstance(
+        e, (CircuitOpenError, httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, FileNotFoundError)
+    )
+
+async def idempotent(
+    key: Optional[str],
+    owner: str,
+    tool: str,
+    arguments: Dict[str, Any],
+    fn: Callable[[], Awaitable[M]],
+    model: Type[M],
+) -> M:
+    """
+    Run a write once per (owner, key): a repeated key within settings.idempotency_window
+    returns the first call's result (marked replayed) without calling LinkedIn. A call that
+    failed before reaching LinkedIn can be retried with its key; one that may have published
+    (timeout, 5xx) makes retries fail with Conflict instead. Without a key, just runs `fn`.
+    """
+    if not key:
+        return await fn()
+    store = await asyncio.to_thread(get_idempotency_store)
+    digest = fingerprint(tool, arguments)
+
+    async def run() -> Tuple[M, bool]:
+        while True:
+            status, result = await asyncio.to_thread(
+                store.claim, owner, key, digest, settings.idempotency_window, settings.idempotency_lease
+            )
+            if status == "done":
+                return model.model_validate_json(result), True
+            if status == "mismatch":
+                raise InvalidRequest(f"Idempotency key {key!r} was already used with different arguments.")
+            if status == "unknown":
+                raise Conflict(
+                    f"An earlier call with idempotency key {key!r} failed after it may have reached LinkedIn. "
+                    "Check whether it was published before retrying with a new key."
+                )
+            if status == "claimed":
+                break
+            await asyncio.sleep(POLL_INTERVAL)
+
+        try:
+            created = await fn()
+        except BaseException as e:
+            await asyncio.to_thread(store.release if never_sent(e) else store.mark_unknown, owner, key)
+            raise
+        await asyncio.to_thread(store.complete, owner, key, created.model_dump_json())
+        return created, False
+
+    # Callers that join an in-flight call don't cause a LinkedIn request either
+    joined = _calls.running((owner, key))
+    created, replayed = await _calls.do((owner, key), run)
+    return created.model_copy(update={"replayed": True}) if replayed or joined else created
@@ -0,0 +1,60 @@
+from typing import Dict, Optional
+from .backends import get_shared_backend, token_scope
+from .client import get_client
+from .config import settings
+from .singleflight import SingleFlight
+
+# How long other workers may reuse an identity looked up by one of them
+SHARED_IDENTITY_TTL = 24 * 3600.0
+
+class IdentityCache:
+    """
+    Caches the OIDC /userinfo document per access token, backed by the shared
+    backend when workers share state. Concurrent first-time callers share a single
+    in-flight lookup.
+    """
+
+    def __init__(self) -> None:
+        self._userinfo: Dict[str, dict] = {}
+        self._lookups = SingleFlight()
+
+    async def get_userinfo(self, headers: Dict[str, str]) -> dict:
+        key = headers["Authorization"]
+        cached = self._userinfo.get(key)
+        if cached is not None:
+            return cached
+        return await self._lookups.do(key, lambda: self._fetch(key, headers))
+
+    async def _fetch(self, key: str, headers: Dict[str, str]) -> dict:
+        shared = get_shared_backend()
+        if shared is not None:
+            info = await shared.get("identity", token_scope(key))
+            if info is not None:
+                self._userinfo[key] = info
+                return info
+
+        resp = await get_client().get(f"{settings.api_base}/userinfo", headers=headers)
+        resp.raise_for_status()
+        info = resp.json()
+        self._userinfo[key] = info
+        if shared is not None:
+            await shared.set("identity", token_scope(key), info, SHARED_IDENTITY_TTL)
+        return info
+
+    def invalidate(self, authorization: Optional[str] = None) -> None:
+        """Drop the cached identity for one Authorization header, or all of them."""
+        if authorization is None:
+            self._userinfo.clear()
+        else:
+            self._userinfo.pop(authorization, None)
+
+identity_cache = IdentityCache()
+
+async def get_userinfo(headers: Dict[str, str]) -> dict:
+    """Return the (cached) /userinfo document for the token in `headers`."""
+    return await identity_cache.get_userinfo(headers)
+
+async def get_person_urn(headers: Dict[str, str]) -> str:
+    """Return the authenticated member's URN, e.g. 'urn:li:person:abc123'."""
+    info = await identity_cache.get_userinfo(headers)
+    return f"urn:li:person:{info.get('sub')}"
@@ -0,0 +1,143 @@
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import httpx
+from .ratelimit import api_endpoint
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Counter:
+    """Monotonic counter; `fn` reports a running total kept elsewhere (unlabelled) instead of inc()."""
+
+    def __init__(
+        self, name: str, doc: str, labelnames: Sequence[str] = (), fn: Optional[Callable[[], float]] = None
+    ) -> None:
+        self.name, self.doc, self.labelnames, self._fn = name, doc, tuple(labelnames), fn
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} counter"]
+        if self._fn is not None:
+            return lines + [f"{self.name} {self._fn():g}"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value:g}")
+        return lines
+
+class Gauge:
+    def __init__(self, name: str, doc: str, fn: Optional[Callable[[], float]] = None) -> None:
+        self.name, self.doc, self._fn = name, doc, fn
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def render(self) -> List[str]:
+        value = self._fn() if self._fn is not None else self.value
+        return [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} gauge", f"{self.name} {value:g}"]
+
+class Histogram:
+    def __init__(
+        self, name: str, doc: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name, self.doc, self.labelnames = name, doc, tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., sum, count]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[i] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            for i, bound in enumerate(self.buckets):
+                le = _labels(self.labelnames, labels, 'le="%g"' % bound)
+                lines.append(f"{self.name}_bucket{le} {series[i]:g}")
+            le = _labels(self.labelnames, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {series[-1]:g}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {series[-2]:g}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {series[-1]:g}")
+        return lines
+
+class Registry:
+    """Minimal Prometheus text-format registry (exposition format 0.0.4)."""
+
+    def __init__(self) -> None:
+        self._metrics: list = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+TOOL_CALLS = registry.register(Counter(
+    "linkedin_mcp_tool_calls_total", "MCP tool calls by tool and outcome (ok/error).", ("tool", "outcome")
+))
+TOOL_DURATION = registry.register(Histogram(
+    "linkedin_mcp_tool_duration_seconds", "MCP tool call latency.", ("tool",)
+))
+TOOLS_IN_FLIGHT = registry.register(Gauge(
+    "linkedin_mcp_tool_calls_in_flight", "MCP tool calls currently executing."
+))
+UPSTREAM_REQUESTS = registry.register(Counter(
+    "linkedin_mcp_upstream_requests_total", "Upstream HTTP requests by endpoint, method and status code.",
+    ("endpoint", "method", "status"),
+))
+UPSTREAM_DURATION = registry.register(Histogram(
+    "linkedin_mcp_upstream_request_duration_seconds", "Upstream HTTP latency (time to response headers).",
+    ("endpoint",),
+))
+UPSTREAM_IN_FLIGHT = registry.register(Gauge(
+    "linkedin_mcp_upstream_requests_in_flight", "Upstream HTTP requests currently awaiting a response."
+))
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """Counts and times every physical upstream request (each retry attempt included)."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = api_endpoint(request.url) or request.url.host
+        status = "error"
+        UPSTREAM_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            UPSTREAM_IN_FLIGHT.dec()
+            UPSTREAM_DURATION.observe(time.perf_counter() - start, endpoint)
+            UPSTREAM_REQUESTS.inc(endpoint, request.method, status)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
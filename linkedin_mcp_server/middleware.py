@@ -0,0 +1,48 @@
+import time
+from typing import Any
+from fastmcp.server.middleware import Middleware, MiddlewareContext, CallNext
+from fastmcp.server.dependencies import get_http_headers
+from .config import settings
+from .metrics import TOOL_CALLS, TOOL_DURATION, TOOLS_IN_FLIGHT
+from .tenants import tenant_registry, use_tenant
+
+class MetricsMiddleware(Middleware):
+    """Records per-tool call counts, outcome, latency and in-flight calls."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        tool = context.message.name
+        outcome = "error"
+        TOOLS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            # Failed tools raise (errors.LinkedInError), so reaching here means success
+            result = await call_next(context)
+            outcome = "ok"
+            return result
+        finally:
+            TOOLS_IN_FLIGHT.dec()
+            TOOL_DURATION.observe(time.perf_counter() - start, tool)
+            TOOL_CALLS.inc(tool, outcome)
+
+class TenantMiddleware(Middleware):
+    """
+    Multi-tenant mode: resolves the calling session's LinkedIn token, from the
+    configured request header or a login made through the auth tools, to its tenant.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        session_id = None
+        if context.fastmcp_context is not None:
+            try:
+                session_id = context.fastmcp_context.session_id
+            except RuntimeError:
+                pass
+
+        token = get_http_headers(include_all=True).get(settings.tenant_token_header.lower())
+        if token and token.lower().startswith("bearer "):
+            token = token[len("bearer "):]
+        token = token or tenant_registry.session_token(session_id)
+
+        tenant = tenant_registry.resolve(token) if token else None
+        with use_tenant(tenant, session_id):
+            return await call_next(context)
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+from .client import get_client
+from .config import settings
+
+class Pager:
+    """
+    Walks a Rest.li collection (start/count paging) one page at a time.
+    The next page is requested while the caller is still processing the current one.
+    After iteration, `next_start` is the cursor to resume from, or None when exhausted.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        start: int = 0,
+        count: Optional[int] = None,
+        max_items: Optional[int] = None,
+    ) -> None:
+        self.url = url
+        self.headers = headers
+        self.start = max(0, start)
+        self.count = max(1, count or settings.page_size)
+        self.max_items = max(1, min(max_items or settings.page_max_items, settings.page_max_items))
+        self.next_start: Optional[int] = None
+
+    async def _fetch(self, start: int) -> Dict[str, Any]:
+        sep = "&" if "?" in self.url else "?"
+        resp = await get_client().get(f"{self.url}{sep}start={start}&count={self.count}", headers=self.headers)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        start = self.start
+        remaining = self.max_items
+        pending: Optional[asyncio.Future] = asyncio.ensure_future(self._fetch(start))
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+
+                elements = data.get("elements", [])
+                total = data.get("paging", {}).get("total")
+                end = start + len(elements)
+                if total is not None:
+                    more = bool(elements) and end < total
+                else:
+                    more = len(elements) >= self.count
+
+                if len(elements) >= remaining:
+                    # max_items reached: stop here and hand back a resume cursor
+                    cut = len(elements) > remaining
+                    elements = elements[:remaining]
+                    self.next_start = start + remaining if (cut or more) else None
+                    yield elements
+                    return
+
+                remaining -= len(elements)
+                self.next_start = end if more else None
+                if more:
+                    pending = asyncio.ensure_future(self._fetch(end))
+                start = end
+                yield elements
+        finally:
+            if pending is not None:
+                pending.cancel()
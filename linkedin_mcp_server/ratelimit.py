@@ -0,0 +1,200 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import httpx
+from .backends import get_shared_backend
+from .config import settings
+
+# First path segment under api_base -> endpoint family sharing one bucket
+FAMILIES = {
+    "ugcPosts": "posts",
+    "shares": "posts",
+    "posts": "posts",
+    "assets": "posts",
+    "socialActions": "social_actions",
+    "companySearch": "search",
+    "jobSearch": "search",
+    "peopleSearch": "search",
+    "organizations": "organizations",
+}
+
+def api_endpoint(url: httpx.URL) -> Optional[str]:
+    """First path segment under api_base (e.g. 'organizations'), or None for other hosts."""
+    base = urlsplit(settings.api_base)
+    if url.host != base.hostname or not url.path.startswith(base.path):
+        return None
+    return url.path[len(base.path):].lstrip("/").split("/", 1)[0]
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/second up to `capacity`.
+    Waiters are served in FIFO order; `pause()` holds everyone until a Retry-After passes.
+    With a shared backend the tokens live there under `key`, so all workers draw on one budget.
+    """
+
+    def __init__(self, rate: float, capacity: int, key: Optional[str] = None) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiting = 0
+        self.key = key
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        self.waiting += 1
+        try:
+            async with self._lock:
+                shared = get_shared_backend() if self.key is not None else None
+                while shared is not None:
+                    wait = await shared.take(self.key, self.rate, self.capacity)
+                    if wait <= 0:
+                        return
+                    await asyncio.sleep(wait)
+                while True:
+                    now = time.monotonic()
+                    if now < self.blocked_until:
+                        await asyncio.sleep(self.blocked_until - now)
+                        continue
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for `seconds` (e.g. after a 429 with Retry-After)."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    async def pause_everywhere(self, seconds: float) -> None:
+        """`pause()`, and also hold the shared bucket so other workers back off too."""
+        self.pause(seconds)
+        shared = get_shared_backend() if self.key is not None else None
+        if shared is not None:
+            await shared.pause(self.key, seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self.tokens, 2),
+            "queue_depth": self.waiting,
+            "paused_for": round(max(0.0, self.blocked_until - now), 2),
+        }
+
+def _worker_share() -> float:
+    """
+    Fraction of each configured rate this process may use. Workers that can't
+    coordinate through a shared backend split the budget evenly instead.
+    """
+    if settings.server_transport == "http" and settings.state_backend == "memory":
+        return 1.0 / max(1, settings.server_workers)
+    return 1.0
+
+class RateLimiter:
+    """Set of token buckets, one per LinkedIn endpoint family, for one credential `scope`."""
+
+    def __init__(self, scope: str = "global") -> None:
+        self.scope = scope
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def family_for(self, url: httpx.URL) -> Optional[str]:
+        """Endpoint family for an api_base URL, or None for other hosts (OAuth, uploads)."""
+        endpoint = api_endpoint(url)
+        if endpoint is None:
+            return None
+        return FAMILIES.get(endpoint, "default")
+
+    def bucket(self, family: str) -> TokenBucket:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            rate = settings.rate_limits.get(family, settings.rate_limits.get("default", 10.0)) * _worker_share()
+            bucket = self._buckets[family] = TokenBucket(
+                rate, settings.rate_limit_burst, key=f"ratelimit:{self.scope}:{family}"
+            )
+        return bucket
+
+    def queue_depth(self) -> int:
+        return sum(bucket.waiting for bucket in self._buckets.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": settings.state_backend,
+            "queue_depth": self.queue_depth(),
+            "families": {family: bucket.stats() for family, bucket in self._buckets.items()},
+        }
+
+rate_limiter = RateLimiter()
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """
+    Passes every LinkedIn API request through its family's token bucket.
+    A 429 (or any Retry-After) pauses the bucket so queued calls wait instead of
+    failing; 429s on replayable requests are re-sent once the pause has passed.
+    `limiters` picks the limiter per request (e.g. per tenant) instead of `limiter`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: RateLimiter = rate_limiter,
+        limiters: Optional[Callable[[httpx.Request], RateLimiter]] = None,
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+        self._limiters = limiters
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self._limiters(request) if self._limiters is not None else self._limiter
+        family = limiter.family_for(request.url) if settings.rate_limit_enabled else None
+        if family is None:
+            return await self._transport.handle_async_request(request)
+
+        bucket = limiter.bucket(family)
+        attempts = 0
+        while True:
+            await bucket.acquire()
+            response = await self._transport.handle_async_request(request)
+            delay = retry_after_seconds(response)
+            if response.status_code == 429 and delay is None:
+                delay = settings.rate_limit_default_backoff
+            if delay is not None:
+                await bucket.pause_everywhere(delay)
+            if response.status_code != 429:
+                return response
+
+            # Streamed bodies (image uploads) can't be sent twice
+            replayable = isinstance(request.stream, httpx.ByteStream)
+            if not replayable or attempts >= settings.rate_limit_max_retries or delay > settings.rate_limit_max_wait:
+                return response
+            await response.aclose()
+            attempts += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
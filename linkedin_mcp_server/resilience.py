@@ -0,0 +1,141 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+import httpx
+from .config import settings
+from .ratelimit import retry_after_seconds
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "DELETE"}
+RETRYABLE_STATUS = {500, 502, 503, 504}
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised without touching the network while a host's circuit is open."""
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `threshold` consecutive failures (5xx or transport
+    errors) the circuit opens and calls fail fast. Once `reset_timeout` has passed
+    a single probe request is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        self.threshold = max(1, threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.probing or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self.failures, "retry_in": round(self.retry_in(), 2)}
+
+class CircuitBreakers:
+    """Process-wide breakers keyed by host."""
+
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                settings.circuit_failure_threshold, settings.circuit_reset_timeout
+            )
+        return breaker
+
+    def stats(self) -> Dict[str, Any]:
+        return {host: breaker.stats() for host, breaker in self._breakers.items()}
+
+circuit_breakers = CircuitBreakers()
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given (0-based) retry attempt."""
+    cap = min(settings.retry_backoff_max, settings.retry_backoff_base * (2 ** attempt))
+    return random.uniform(0, cap)
+
+class ResilienceTransport(httpx.AsyncBaseTransport):
+    """
+    Retries idempotent requests (GET/DELETE) on transport errors and 5xx responses,
+    with jittered exponential backoff bounded by a per-call deadline, and fails
+    fast through the host's circuit breaker while LinkedIn is down.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breakers: CircuitBreakers = circuit_breakers) -> None:
+        self._transport = transport
+        self._breakers = breakers
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        breaker = self._breakers.for_host(request.url.host)
+        retryable = request.method in IDEMPOTENT_METHODS and isinstance(request.stream, httpx.ByteStream)
+        max_attempts = max(1, settings.retry_max_attempts) if retryable else 1
+        deadline = time.monotonic() + settings.retry_deadline
+        attempt = 0
+
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"{request.url.host} is unavailable (circuit open); retrying in {breaker.retry_in():.0f}s",
+                    request=request,
+                )
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                breaker.record_failure()
+                delay = backoff_delay(attempt)
+                attempt += 1
+                if attempt >= max_attempts or time.monotonic() + delay > deadline:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled mid-probe: free the half-open slot for the next caller
+                breaker.probing = False
+                raise
+
+            if response.status_code not in RETRYABLE_STATUS:
+                breaker.record_success()
+                return response
+
+            breaker.record_failure()
+            delay = max(backoff_delay(attempt), retry_after_seconds(response) or 0.0)
+            attempt += 1
+            if attempt >= max_attempts or time.monotonic() + delay > deadline:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
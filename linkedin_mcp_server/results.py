@@ -0,0 +1,125 @@
+from typing import Annotated, Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+# Tool result models. They live apart from the tool modules so server.py can declare
+# output schemas without importing the tools before their first call.
+
+# Set on the results of write tools that take an idempotency_key
+Replayed = Annotated[
+    bool, Field(description="True if this is the stored result of an earlier call with the same idempotency_key.")
+]
+
+# --- Authentication ---
+
+class AuthorizationUrl(BaseModel):
+    url: str = Field(..., description="LinkedIn authorization page to open in a browser.")
+    instructions: str
+
+class LoginResult(BaseModel):
+    stored_in: Literal["session", "env"] = Field(
+        ..., description="'session' (multi-tenant, kept in memory for this MCP session) or 'env' (saved to .env)."
+    )
+    expires_in: Optional[int] = Field(default=None, description="Token lifetime in seconds.")
+
+# --- Profile ---
+
+class Profile(BaseModel):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    given_name: Optional[str] = None
+    family_name: Optional[str] = None
+    email: Optional[str] = None
+    email_verified: Optional[bool] = None
+    picture: Optional[str] = None
+    # LinkedIn sends {"country": ..., "language": ...}; other OIDC providers a plain tag
+    locale: Any = None
+
+# --- Posts and Comments ---
+
+class PostCreated(BaseModel):
+    id: str = Field(..., description="URN of the new post.")
+    asset_urns: List[str] = Field(default_factory=list, description="Image assets attached to the post.")
+    replayed: Replayed = False
+
+class PostUpdated(BaseModel):
+    old_id: str
+    new_id: str
+    old_deleted: bool = Field(..., description="False if the new post was created but the old one could not be deleted.")
+    error: Optional[str] = Field(default=None, description="Why the old post could not be deleted.")
+    replayed: Replayed = False
+
+class Deleted(BaseModel):
+    urn: str
+
+class CommentCreated(BaseModel):
+    id: str
+    replayed: Replayed = False
+
+class PostPage(BaseModel):
+    posts: List[Dict[str, Any]] = Field(..., description="id, text, created and visibility of each post.")
+    next_start: Optional[int] = Field(default=None, description="Cursor for the next call; null when exhausted.")
+
+class CommentPage(BaseModel):
+    comments: List[Dict[str, Any]] = Field(..., description="id, actor, text and created of each comment.")
+    next_start: Optional[int] = Field(default=None, description="Cursor for the next call; null when exhausted.")
+
+class BatchResult(BaseModel):
+    results: Dict[str, Any] = Field(default_factory=dict, description="Outcome per URN.")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Error message per failed URN.")
+
+# --- Scheduled Posts ---
+
+class ScheduleReceipt(BaseModel):
+    schedule_id: int
+    status: str
+    publish_at: Optional[str] = None
+    warning: Optional[str] = None
+    replayed: Replayed = False
+
+class ScheduledPost(BaseModel):
+    schedule_id: int
+    status: str = Field(..., description="pending, running, published, failed or cancelled.")
+    publish_at: Optional[str] = None
+    kind: str
+    text: Optional[str] = None
+    image_source: Optional[str] = None
+    visibility: Optional[str] = None
+    result: Optional[str] = Field(default=None, description="The post URN once published, or why publishing failed.")
+
+class ScheduledPosts(BaseModel):
+    posts: List[ScheduledPost]
+
+# --- Background Tasks ---
+
+class TaskStarted(BaseModel):
+    task_id: str = Field(..., description="Pass to linkedin_get_task_status or linkedin_cancel_task.")
+    status: str = "pending"
+
+class TaskProgress(BaseModel):
+    done: Optional[float] = None
+    total: Optional[float] = None
+    message: str
+
+class TaskError(BaseModel):
+    code: str = Field(..., description="e.g. unauthorized, forbidden, not_found, rate_limited, api_error.")
+    message: str
+
+class TaskStatus(BaseModel):
+    task_id: str
+    tool: str
+    status: str = Field(..., description="pending, running, completed, failed or cancelled.")
+    progress: TaskProgress
+    result: Any = Field(default=None, description="The tool's result once completed.")
+    error: Optional[TaskError] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+class TaskList(BaseModel):
+    tasks: List[TaskStatus]
+
+class TaskCancelled(BaseModel):
+    task_id: str
+    status: Literal["cancelled", "requested"] = Field(
+        ..., description="'requested' when another worker runs the task; it stops at its next step."
+    )
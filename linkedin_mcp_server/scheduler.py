@@ -0,0 +1,257 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import socket
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+from .config import settings
+from .storage import LazyStore, connect, data_path
+
+logger = logging.getLogger(__name__)
+
+# Longest pause after repeated queue errors (e.g. "database is locked")
+MAX_ERROR_BACKOFF = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    publish_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    claimed_by TEXT,
+    claimed_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_scheduled_posts_due ON scheduled_posts (status, publish_at);
+"""
+
+# Columns added after the first release, for queues created before them
+MIGRATIONS = {
+    "claimed_by": "ALTER TABLE scheduled_posts ADD COLUMN claimed_by TEXT",
+    "claimed_at": "ALTER TABLE scheduled_posts ADD COLUMN claimed_at REAL",
+}
+
+class PostQueue:
+    """
+    SQLite-backed queue of posts waiting to be published.
+    Statuses: pending -> running -> published | failed, or pending -> cancelled.
+    A running post is leased to the worker that claimed it (claimed_by) and the lease is
+    renewed while it publishes (claimed_at); only expired leases are taken back, so several
+    server processes can share one queue.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(scheduled_posts)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+
+    def add(self, kind: str, payload: Dict[str, Any], publish_at: float) -> int:
+        now = time.time()
+        with connect(self.path) as conn:
+            cur = conn.execute(
+                "INSERT INTO scheduled_posts (kind, payload, publish_at, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, json.dumps(payload), publish_at, now, now),
+            )
+            return cur.lastrowid
+
+    def claim_due(self, now: float, owner: str, lease: float) -> Optional[Dict[str, Any]]:
+        """
+        Atomically lease the oldest due post to `owner` and return it: a pending one, or a
+        running one whose worker stopped renewing its lease (crashed process).
+        """
+        with connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT * FROM scheduled_posts WHERE (status = 'pending' AND publish_at <= ?) "
+                    "OR (status = 'running' AND COALESCE(claimed_at, updated_at) < ?) "
+                    "ORDER BY publish_at LIMIT 1",
+                    (now, now - lease),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE scheduled_posts SET status = 'running', claimed_by = ?, claimed_at = ?, updated_at = ? "
+                        "WHERE id = ?",
+                        (owner, now, now, row["id"]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return dict(row) if row is not None else None
+
+    def renew(self, post_id: int, owner: str) -> bool:
+        """Extend `owner`'s lease on a running post. Returns False if the lease was lost."""
+        with connect(self.path) as conn:
+            cur = conn.execute(
+                "UPDATE scheduled_posts SET claimed_at = ? WHERE id = ? AND status = 'running' AND claimed_by = ?",
+                (time.time(), post_id, owner),
+            )
+            return cur.rowcount > 0
+
+    def finish(self, post_id: int, owner: str, status: str, result: str) -> None:
+        """Record the outcome, unless another worker has taken the post over since."""
+        with connect(self.path) as conn:
+            conn.execute(
+                "UPDATE scheduled_posts SET status = ?, result = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'running' AND claimed_by = ?",
+                (status, result, time.time(), post_id, owner),
+            )
+
+    def cancel(self, post_id: int) -> bool:
+        """Cancel a post that hasn't started publishing. Returns False otherwise."""
+        with connect(self.path) as conn:
+            cur = conn.execute(
+                "UPDATE scheduled_posts SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'pending'",
+                (time.time(), post_id),
+            )
+            return cur.rowcount > 0
+
+    def list(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM scheduled_posts"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        query += " ORDER BY publish_at LIMIT ?"
+        with connect(self.path) as conn:
+            rows = conn.execute(query, args + (limit,)).fetchall()
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["payload"] = json.loads(item["payload"])
+            items.append(item)
+        return items
+
+    def next_due_at(self) -> Optional[float]:
+        with connect(self.path) as conn:
+            row = conn.execute("SELECT MIN(publish_at) FROM scheduled_posts WHERE status = 'pending'").fetchone()
+        return row[0]
+
+    def recover(self, lease: float) -> int:
+        """Return posts whose lease expired (their process crashed) to the queue."""
+        now = time.time()
+        with connect(self.path) as conn:
+            cur = conn.execute(
+                "UPDATE scheduled_posts SET status = 'pending', claimed_by = NULL, claimed_at = NULL, updated_at = ? "
+                "WHERE status = 'running' AND COALESCE(claimed_at, updated_at) < ?",
+                (now, now - lease),
+            )
+            return cur.rowcount
+
+def _open_queue() -> PostQueue:
+    return PostQueue(settings.schedule_db_path or data_path("scheduled_posts.db"))
+
+# The process-wide post queue
+get_queue = LazyStore(_open_queue)
+
+class Scheduler:
+    """
+    Pool of async workers that publish due posts with bounded concurrency.
+    Every server process runs one; the queue's leases keep them from publishing a post twice.
+    """
+
+    def __init__(self) -> None:
+        self.id = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+        self._workers: List[asyncio.Task] = []
+        self._wake: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        queue = await asyncio.to_thread(get_queue)
+        await asyncio.to_thread(queue.recover, settings.schedule_lease)
+        self._wake = asyncio.Event()
+        self._workers = [
+            asyncio.ensure_future(self._worker()) for _ in range(max(1, settings.schedule_workers))
+        ]
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._wake = None
+
+    def notify(self) -> None:
+        """Wake idle workers, e.g. after a post was scheduled for right now."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _worker(self) -> None:
+        queue = await asyncio.to_thread(get_queue)
+        errors = 0
+        while True:
+            try:
+                item = await asyncio.to_thread(queue.claim_due, time.time(), self.id, settings.schedule_lease)
+                if item is not None:
+                    await self._run(queue, item)
+                    errors = 0
+                    continue
+                next_due = await asyncio.to_thread(queue.next_due_at)
+            except sqlite3.Error:
+                # A busy or briefly unavailable database mustn't end the worker; a post whose
+                # outcome wasn't recorded is taken back after its lease and replayed by key
+                errors += 1
+                delay = min(MAX_ERROR_BACKOFF, settings.schedule_poll_interval * 2 ** (errors - 1))
+                logger.exception("Scheduled-post queue error; retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+                continue
+            errors = 0
+
+            timeout = settings.schedule_poll_interval
+            if next_due is not None:
+                timeout = max(0.0, min(timeout, next_due - time.time()))
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _run(self, queue: PostQueue, item: Dict[str, Any]) -> None:
+        """Publish a claimed post, renewing its lease meanwhile, and record the outcome."""
+        heartbeat = asyncio.ensure_future(self._renew(queue, item["id"]))
+        try:
+            status, result = await self._publish(item)
+        finally:
+            heartbeat.cancel()
+        await asyncio.to_thread(queue.finish, item["id"], self.id, status, result)
+
+    async def _renew(self, queue: PostQueue, post_id: int) -> None:
+        while True:
+            await asyncio.sleep(settings.schedule_lease / 4)
+            try:
+                await asyncio.to_thread(queue.renew, post_id, self.id)
+            except sqlite3.Error:
+                logger.exception("Could not renew the lease on scheduled post %s", post_id)
+
+    async def _publish(self, item: Dict[str, Any]) -> tuple:
+        from .tools import post
+
+        payload = json.loads(item["payload"])
+        # A post re-run after a crash or lost lease replays the first publish instead of repeating it
+        payload["idempotency_key"] = f"scheduled-post:{item['id']}:{item['created_at']}"
+        try:
+            if item["kind"] == "image":
+                created = await post.create_image_post(post.ImagePostParams(**payload))
+            else:
+                created = await post.create_post(post.PostParams(**payload))
+        except Exception as e:
+            return "failed", str(e)
+        return "published", created.id
+
+scheduler = Scheduler()
@@ -0,0 +1,202 @@
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Set
+from .backends import token_scope
+from .cache import cached_get_json, prime_json
+from .client import get_client
+from .config import settings
+from .singleflight import SingleFlight
+from .storage import LazyStore, connect, data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    scope TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    urn TEXT NOT NULL,
+    body TEXT NOT NULL,
+    text TEXT NOT NULL,
+    source TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    UNIQUE (scope, kind, urn)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(text, content='documents', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO documents_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+def _element_urn(element: Dict[str, Any]) -> Optional[str]:
+    for key in ("id", "urn", "entityUrn", "$URN"):
+        value = element.get(key)
+        if value is not None:
+            return str(value)
+    return None
+
+def _strings(value: Any) -> List[str]:
+    """Every string inside a JSON document, for full-text indexing."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [s for item in value.values() for s in _strings(item)]
+    if isinstance(value, list):
+        return [s for item in value for s in _strings(item)]
+    return []
+
+def _match_expression(query: str, operator: str) -> str:
+    # Quoted prefix terms: punctuation can't break the FTS syntax and 'dev' matches 'developer'
+    return f" {operator} ".join(f'"{word}"*' for word in re.findall(r"\w+", query.lower()))
+
+class SearchIndex:
+    """
+    SQLite FTS5 index of search-result elements, keyed by (token scope, kind, URN).
+    Each element remembers when it was fetched and the search URL that returned it,
+    so stale entries can be refreshed by re-running that search.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+
+    def add(self, scope: str, kind: str, source: str, elements: List[Any]) -> int:
+        now = time.time()
+        rows = []
+        for element in elements:
+            urn = _element_urn(element) if isinstance(element, dict) else None
+            if urn is not None:
+                rows.append((scope, kind, urn, json.dumps(element), " ".join(_strings(element)), source, now))
+        with connect(self.path) as conn:
+            conn.executemany(
+                "INSERT INTO documents (scope, kind, urn, body, text, source, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (scope, kind, urn) DO UPDATE SET "
+                "body = excluded.body, text = excluded.text, source = excluded.source, fetched_at = excluded.fetched_at",
+                rows,
+            )
+        return len(rows)
+
+    def search(self, scope: str, kind: str, query: str, limit: int, any_term: bool = True) -> List[Dict[str, Any]]:
+        """Best matches first: every term must match, falling back to any term unless `any_term` is False."""
+        with connect(self.path) as conn:
+            if not re.search(r"\w", query):
+                rows = conn.execute(
+                    "SELECT urn, body, source, fetched_at FROM documents WHERE scope = ? AND kind = ? "
+                    "ORDER BY fetched_at DESC LIMIT ?",
+                    (scope, kind, limit),
+                ).fetchall()
+                return [dict(row) for row in rows]
+            for operator in ("AND", "OR") if any_term else ("AND",):
+                rows = conn.execute(
+                    "SELECT d.urn, d.body, d.source, d.fetched_at FROM documents_fts "
+                    "JOIN documents d ON d.id = documents_fts.rowid "
+                    "WHERE documents_fts MATCH ? AND d.scope = ? AND d.kind = ? "
+                    "ORDER BY bm25(documents_fts) LIMIT ?",
+                    (_match_expression(query, operator), scope, kind, limit),
+                ).fetchall()
+                if rows:
+                    break
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        with connect(self.path) as conn:
+            rows = conn.execute("SELECT kind, COUNT(*), MIN(fetched_at) FROM documents GROUP BY kind").fetchall()
+        now = time.time()
+        return {kind: {"entries": count, "oldest_age": round(now - oldest, 1)} for kind, count, oldest in rows}
+
+def _open_search_index() -> SearchIndex:
+    return SearchIndex(settings.search_index_db_path or data_path("search_index.db"))
+
+# The process-wide search index
+get_search_index = LazyStore(_open_search_index)
+
+def _scope(headers: Dict[str, str]) -> str:
+    # Results are only shared between callers using the same token; the token itself isn't stored
+    return token_scope(headers["Authorization"])
+
+_refreshes = SingleFlight()
+_background: Set[asyncio.Task] = set()
+
+async def _refresh(scope: str, kind: str, url: str, headers: Dict[str, str], endpoint: str) -> None:
+    try:
+        resp = await get_client().get(url, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
+        prime_json(url, headers, endpoint, data)
+        index = await asyncio.to_thread(get_search_index)
+        await asyncio.to_thread(index.add, scope, kind, url, data.get("elements", []))
+    except Exception:
+        # Stale entries stay servable; the next stale hit tries again
+        pass
+
+def _refresh_in_background(scope: str, kind: str, urls: List[str], headers: Dict[str, str], endpoint: str) -> None:
+    for url in urls[:max(0, settings.search_index_refresh_limit)]:
+        task = asyncio.ensure_future(
+            _refreshes.do((scope, url), lambda url=url: _refresh(scope, kind, url, headers, endpoint))
+        )
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+async def indexed_search(
+    kind: str,
+    url: str,
+    headers: Dict[str, str],
+    endpoint: str,
+    query: str,
+    local_only: bool = False,
+    max_age: Optional[float] = None,
+) -> Any:
+    """
+    Run a search through the local index.
+    - Default: live (response-cached) search; its elements are indexed.
+    - max_age: answer from the index when it holds a match for every term fetched within
+      max_age seconds; matches older than that are refreshed in the background by re-running
+      their search.
+    - local_only: answer from the index only (falling back to any-term matches), never calling LinkedIn.
+    """
+    if not settings.search_index_enabled:
+        if local_only:
+            raise ValueError("The local search index is disabled (SEARCH_INDEX_ENABLED=false).")
+        return await cached_get_json(url, headers, endpoint)
+
+    index = await asyncio.to_thread(get_search_index)
+    scope = _scope(headers)
+    if local_only or max_age is not None:
+        # Partial (any-term) matches can't stand in for a live search, only for an offline one
+        hits = await asyncio.to_thread(
+            index.search, scope, kind, query, settings.search_index_max_results, local_only
+        )
+        now = time.time()
+        fresh = [hit for hit in hits if max_age is None or now - hit["fetched_at"] <= max_age]
+        if local_only or fresh:
+            stale_sources: List[str] = []
+            if max_age is not None:
+                stale_sources = list(dict.fromkeys(hit["source"] for hit in hits if hit not in fresh))
+                _refresh_in_background(scope, kind, stale_sources, headers, endpoint)
+            return {
+                "elements": [json.loads(hit["body"]) for hit in hits],
+                "paging": {"start": 0, "count": len(hits), "total": len(hits)},
+                "index": {
+                    "source": "local",
+                    "oldest_age_seconds": round(max((now - hit["fetched_at"] for hit in hits), default=0.0), 1),
+                    "stale": len(hits) - len(fresh),
+                    "refreshing": min(len(stale_sources), max(0, settings.search_index_refresh_limit)),
+                },
+            }
+
+    data = await cached_get_json(url, headers, endpoint)
+    try:
+        await asyncio.to_thread(index.add, scope, kind, url, data.get("elements", []))
+    except sqlite3.Error:
+        # Indexing is best effort; the live answer is what matters here
+        pass
+    return data
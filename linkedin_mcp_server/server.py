@@ -1,97 +1,304 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Union
+import pydantic_core
 from fastmcp import FastMCP
+from fastmcp.tools.tool import ToolResult
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 from .config import settings
-from .tools import auth, profile, post, company, search, job
+from .results import (
+    AuthorizationUrl, BatchResult, CommentCreated, CommentPage, Deleted, LoginResult, PostCreated, PostPage,
+    PostUpdated, Profile, ScheduledPosts, ScheduleReceipt, TaskCancelled, TaskList, TaskStarted, TaskStatus,
+)
+
+# Infrastructure (client, caches, limiter, stores, scheduler) is imported where it's used,
+# and settings are only read once the server starts, so importing this module builds neither.
+
+class LazyToolModule:
+    """
+    A tools/ module imported on first attribute access, so starting the server only
+    pays for the tool registry and each implementation loads with its first call.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = f"{__package__}.tools.{name}"
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+auth = LazyToolModule("auth")
+profile = LazyToolModule("profile")
+post = LazyToolModule("post")
+company = LazyToolModule("company")
+search = LazyToolModule("search")
+job = LazyToolModule("job")
+schedule = LazyToolModule("schedule")
+task = LazyToolModule("task")
+
+_configured = False
+
+def configure(server: FastMCP) -> None:
+    """
+    Add the middleware and metrics the settings ask for. Runs once, when the server starts
+    (every transport enters the lifespan), rather than when this module is imported.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    from .middleware import MetricsMiddleware, TenantMiddleware
+
+    if settings.multi_tenant:
+        server.add_middleware(TenantMiddleware())
+    if not settings.metrics_enabled:
+        return
+
+    from .cache import response_cache
+    from .metrics import Counter, Gauge, registry
+    from .ratelimit import rate_limiter
+    from .tasks import task_manager
+    from .tenants import tenant_registry
+
+    server.add_middleware(MetricsMiddleware())
+    registry.register(Gauge(
+        "linkedin_mcp_rate_limit_queue_depth", "Calls waiting for a rate-limit token.", rate_limiter.queue_depth
+    ))
+    registry.register(Counter(
+        "linkedin_mcp_cache_hits_total", "Response cache hits since start.", fn=lambda: response_cache.hits
+    ))
+    registry.register(Counter(
+        "linkedin_mcp_cache_misses_total", "Response cache misses since start.", fn=lambda: response_cache.misses
+    ))
+    registry.register(Gauge(
+        "linkedin_mcp_background_tasks", "Background tasks pending or running.", task_manager.active
+    ))
+    if settings.multi_tenant:
+        registry.register(Gauge(
+            "linkedin_mcp_tenants", "Tenants with a live session.", lambda: tenant_registry.stats()["tenants"]
+        ))
+
+@asynccontextmanager
+async def lifespan(server: Any) -> AsyncIterator[dict]:
+    """Open the connection pool, then start the scheduled-post workers; cancel background tasks on exit."""
+    from .client import lifespan as client_lifespan
+    from .scheduler import scheduler
+    from .tasks import task_manager
+
+    configure(server)
+    async with client_lifespan(server):
+        await scheduler.start()
+        try:
+            yield {}
+        finally:
+            await task_manager.stop()
+            await scheduler.stop()
+
+def serialize_result(data: Any) -> str:
+    """Text copy of a structured tool result (compact unless COMPACT_JSON=false)."""
+    from .utils import dump_json
+
+    return dump_json(pydantic_core.to_jsonable_python(data))
 
 # Initialize MCP Server
-mcp = FastMCP("linkedin_custom_mcp")
+mcp = FastMCP("linkedin_custom_mcp", lifespan=lifespan, tool_serializer=serialize_result)
+
+# --- Metrics ---
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus text-format metrics for tools and upstream calls."""
+    from .metrics import registry
+
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 # --- Authentication Tools ---
 
 @mcp.tool(name="linkedin_get_oauth_url", annotations={"title": "Get LinkedIn Auth URL"})
-async def linkedin_get_oauth_url() -> str:
+async def linkedin_get_oauth_url() -> AuthorizationUrl:
     """Generate the LinkedIn OAuth 2.0 authorization URL for browser login."""
     return await auth.get_oauth_url()
 
 @mcp.tool(name="linkedin_exchange_code", annotations={"title": "Exchange Auth Code"})
-async def linkedin_exchange_code(code: str) -> str:
+async def linkedin_exchange_code(code: str) -> LoginResult:
     """Exchange the browser-provided authorization code for a persistent access token."""
     return await auth.exchange_code(code)
 
 # --- Profile Tools ---
 
 @mcp.tool(name="linkedin_get_my_profile", annotations={"title": "Get My Profile"})
-async def linkedin_get_my_profile() -> str:
+async def linkedin_get_my_profile() -> Profile:
     """Fetch the authenticated user's profile information (Name, Email, Picture)."""
     return await profile.get_my_profile()
 
 @mcp.tool(name="linkedin_get_member_profile", annotations={"title": "Get Member Profile"})
-async def linkedin_get_member_profile(member_urn: str) -> str:
-    """Fetch a specific member's profile by their URN (e.g., 'urn:li:person:123')."""
-    return await search.get_member_profile(member_urn)
+async def linkedin_get_member_profile(member_urn: str, fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch a specific member's profile by their URN (e.g., 'urn:li:person:123').
+    Args:
+        member_urn: The member's person URN.
+        fields: Optional dotted paths to keep (e.g. ['localizedFirstName', 'localizedLastName']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    """
+    return await search.get_member_profile(member_urn, fields, compact)
+
+@mcp.tool(name="linkedin_get_member_profiles", annotations={"title": "Get Member Profiles (Batch)"})
+async def linkedin_get_member_profiles(member_urns: List[str], fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch many members' profiles in one call.
+    Args:
+        member_urns: Person URNs (e.g., ['urn:li:person:123', 'urn:li:person:456']).
+        fields: Optional dotted paths to keep (e.g. ['localizedFirstName', 'localizedLastName']), applied to each profile.
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    Returns a map of results and per-URN errors.
+    """
+    return await search.get_member_profiles(member_urns, fields, compact)
 
 # --- Post Tools ---
 
 @mcp.tool(name="linkedin_create_post", annotations={"title": "Create Feed Post"})
-async def linkedin_create_post(text: str, visibility: str = "PUBLIC") -> str:
+async def linkedin_create_post(text: str, visibility: str = "PUBLIC", idempotency_key: str = None) -> PostCreated:
     """
     Create a new text-based update on the user LinkedIn feed.
     Args:
         text: The content of the post.
         visibility: 'PUBLIC' or 'CONNECTIONS'.
+        idempotency_key: Optional key; repeating a call with it returns the first result instead of posting again.
     """
-    params = post.PostParams(text=text, visibility=visibility)
+    params = post.PostParams(text=text, visibility=visibility, idempotency_key=idempotency_key)
     return await post.create_post(params)
 
 @mcp.tool(name="linkedin_create_image_post", annotations={"title": "Create Image Post"})
-async def linkedin_create_image_post(text: str, image_source: str, visibility: str = "PUBLIC") -> str:
+async def linkedin_create_image_post(
+    text: str, image_source: str, visibility: str = "PUBLIC", background: bool = False, idempotency_key: str = None
+) -> Union[PostCreated, TaskStarted]:
     """
     Create a post with an image.
     Args:
         text: Post caption.
         image_source: Local file path or public URL of the image.
         visibility: 'PUBLIC' or 'CONNECTIONS'.
+        background: Return a task ID at once and post in the background (see linkedin_get_task_status).
+        idempotency_key: Optional key; repeating a call with it returns the first result instead of posting again.
     """
-    params = post.ImagePostParams(text=text, image_source=image_source, visibility=visibility)
+    params = post.ImagePostParams(text=text, image_source=image_source, visibility=visibility, idempotency_key=idempotency_key)
+    if background:
+        return await task.start_task("linkedin_create_image_post", lambda: post.create_image_post(params))
     return await post.create_image_post(params)
 
+@mcp.tool(name="linkedin_create_multi_image_post", annotations={"title": "Create Multi-Image Post"})
+async def linkedin_create_multi_image_post(
+    text: str, image_sources: List[str], visibility: str = "PUBLIC", background: bool = False, idempotency_key: str = None
+) -> Union[PostCreated, TaskStarted]:
+    """
+    Create one post with 2-20 images, uploaded in parallel.
+    If any image fails to upload, no post is created and the uploaded images are removed.
+    Args:
+        text: Post caption.
+        image_sources: Local file paths or public URLs of the images, in display order.
+        visibility: 'PUBLIC' or 'CONNECTIONS'.
+        background: Return a task ID at once and post in the background (see linkedin_get_task_status).
+        idempotency_key: Optional key; repeating a call with it returns the first result instead of posting again.
+    """
+    params = post.MultiImagePostParams(
+        text=text, image_sources=image_sources, visibility=visibility, idempotency_key=idempotency_key
+    )
+    if background:
+        return await task.start_task("linkedin_create_multi_image_post", lambda: post.create_multi_image_post(params))
+    return await post.create_multi_image_post(params)
+
 @mcp.tool(name="linkedin_update_post", annotations={"title": "Update Post"})
-async def linkedin_update_post(post_urn: str, text: str, visibility: str = "PUBLIC") -> str:
+async def linkedin_update_post(post_urn: str, text: str, visibility: str = "PUBLIC", idempotency_key: str = None) -> PostUpdated:
     """
     Update a post's text.
-    ⚠️ Warning: This deletes the old post and creates a new one with a new ID,
+    ⚠️ Warning: This creates a new post with a new ID and then deletes the old one,
     as LinkedIn does not support editing published posts via API.
+    Args:
+        post_urn: The URN of the post to update.
+        text: The new text.
+        visibility: 'PUBLIC' or 'CONNECTIONS'.
+        idempotency_key: Optional key; repeating a call with it returns the first result instead of posting again.
     """
-    params = post.UpdatePostParams(post_urn=post_urn, text=text, visibility=visibility)
+    params = post.UpdatePostParams(post_urn=post_urn, text=text, visibility=visibility, idempotency_key=idempotency_key)
     return await post.update_post(params)
 
 @mcp.tool(name="linkedin_delete_post", annotations={"title": "Delete Post"})
-async def linkedin_delete_post(post_urn: str) -> str:
+async def linkedin_delete_post(post_urn: str) -> Deleted:
     """Delete a LinkedIn post by its URN (e.g., 'urn:li:share:123')."""
     return await post.delete_post(post_urn)
 
+@mcp.tool(name="linkedin_delete_posts", annotations={"title": "Delete Posts (Bulk)"})
+async def linkedin_delete_posts(post_urns: List[str]) -> BatchResult:
+    """
+    Delete many posts at once. Returns per-URN results and errors.
+    Args:
+        post_urns: Post URNs to delete (e.g. ['urn:li:share:1', 'urn:li:share:2']).
+    """
+    return await post.delete_posts(post_urns)
+
+@mcp.tool(name="linkedin_update_posts", annotations={"title": "Update Posts (Bulk)"})
+async def linkedin_update_posts(items: List[Dict[str, str]]) -> BatchResult:
+    """
+    Update many posts' text at once. Each new post is created before its old one is deleted,
+    so a failure never loses a post. Returns per-URN new IDs and errors; an invalid item
+    only fails itself, and a URN listed twice is updated once.
+    Args:
+        items: Objects with 'post_urn', 'text' and optional 'visibility' ('PUBLIC' or 'CONNECTIONS').
+    """
+    return await post.update_posts(items)
+
 @mcp.tool(name="linkedin_get_recent_posts", annotations={"title": "Get Recent Posts"})
-async def linkedin_get_recent_posts() -> str:
-    """List the user's recent posts (Requires 'r_member_social' permission)."""
-    return await post.get_recent_posts()
+async def linkedin_get_recent_posts(start: int = 0, count: int = None, max_items: int = None) -> PostPage:
+    """
+    List the user's recent posts (Requires 'r_member_social' permission).
+    Args:
+        start: Offset to resume from (pass the previous result's 'next_start').
+        count: Page size requested from LinkedIn.
+        max_items: Stop after this many posts.
+    """
+    return await post.get_recent_posts(start, count, max_items)
 
 @mcp.tool(name="linkedin_create_comment", annotations={"title": "Create Comment"})
-async def linkedin_create_comment(object_urn: str, text: str) -> str:
+async def linkedin_create_comment(object_urn: str, text: str, idempotency_key: str = None) -> CommentCreated:
     """
     Create a comment on a LinkedIn share, article, or video.
     Args:
         object_urn: The URN of the content to comment on (e.g., 'urn:li:share:123').
         text: The text of the comment.
+        idempotency_key: Optional key; repeating a call with it returns the first result instead of posting again.
     """
-    params = post.CommentParams(object_urn=object_urn, text=text)
+    params = post.CommentParams(object_urn=object_urn, text=text, idempotency_key=idempotency_key)
     return await post.create_comment(params)
 
 @mcp.tool(name="linkedin_get_post_comments", annotations={"title": "Get Comments"})
-async def linkedin_get_post_comments(object_urn: str) -> str:
-    """Get comments for a specific post/share."""
-    return await post.get_post_comments(object_urn)
+async def linkedin_get_post_comments(object_urn: str, start: int = 0, count: int = None, max_items: int = None) -> CommentPage:
+    """
+    Get comments for a specific post/share.
+    Args:
+        object_urn: The URN of the post/share.
+        start: Offset to resume from (pass the previous result's 'next_start').
+        count: Page size requested from LinkedIn.
+        max_items: Stop after this many comments.
+    """
+    return await post.get_post_comments(object_urn, start, count, max_items)
+
+@mcp.tool(name="linkedin_sync_comments", annotations={"title": "Sync Comments"})
+async def linkedin_sync_comments(object_urns: List[str], max_items: int = None) -> BatchResult:
+    """
+    Sync comments for one or more posts into the local store and return only the new ones
+    since the last sync. Call it repeatedly to monitor engagement cheaply.
+    Args:
+        object_urns: Post/share URNs to sync (synced concurrently).
+        max_items: Max comments to fetch per post in this call; 'more' in the result means call again.
+    """
+    return await post.sync_comments(object_urns, max_items)
 
 @mcp.tool(name="linkedin_delete_comment", annotations={"title": "Delete Comment"})
-async def linkedin_delete_comment(comment_urn: str, object_urn: str) -> str:
+async def linkedin_delete_comment(comment_urn: str, object_urn: str) -> Deleted:
     """
     Delete a specific comment.
     Args:
@@ -100,41 +307,224 @@ async def linkedin_delete_comment(comment_urn: str, object_urn: str) -> str:
     """
     return await post.delete_comment(comment_urn, object_urn)
 
+# --- Scheduled Post Tools ---
+
+@mcp.tool(name="linkedin_schedule_post", annotations={"title": "Schedule Post"})
+async def linkedin_schedule_post(
+    text: str, publish_at: str = None, image_source: str = None, visibility: str = "PUBLIC", idempotency_key: str = None
+) -> ScheduleReceipt:
+    """
+    Queue a text or image post to be published later by the server's background workers.
+    Returns immediately with a schedule ID; the queue survives restarts.
+    Args:
+        text: The content of the post.
+        publish_at: ISO 8601 time, e.g. '2025-01-31T09:00:00Z' (naive = UTC). Omit to publish ASAP.
+        image_source: Optional local file path or public URL of an image.
+        visibility: 'PUBLIC' or 'CONNECTIONS'.
+        idempotency_key: Optional key; repeating a call with it returns the first schedule ID instead of queueing again.
+    """
+    params = schedule.SchedulePostParams(
+        text=text, publish_at=publish_at, image_source=image_source, visibility=visibility,
+        idempotency_key=idempotency_key,
+    )
+    return await schedule.schedule_post(params)
+
+@mcp.tool(name="linkedin_list_scheduled_posts", annotations={"title": "List Scheduled Posts"})
+async def linkedin_list_scheduled_posts(status: str = None, limit: int = 100) -> ScheduledPosts:
+    """List scheduled posts, optionally filtered by status (pending, running, published, failed, cancelled)."""
+    return await schedule.list_scheduled_posts(status, limit)
+
+@mcp.tool(name="linkedin_cancel_scheduled_post", annotations={"title": "Cancel Scheduled Post"})
+async def linkedin_cancel_scheduled_post(schedule_id: int) -> ScheduleReceipt:
+    """Cancel a scheduled post that has not started publishing yet."""
+    return await schedule.cancel_scheduled_post(schedule_id)
+
 # --- Company Tools ---
 
 @mcp.tool(name="linkedin_get_company_profile", annotations={"title": "Get Company Profile"})
-async def linkedin_get_company_profile(company_urn: str) -> str:
-    """Fetch a company's profile information by its URN (e.g., 'urn:li:organization:123')."""
-    return await company.get_company_profile(company_urn)
+async def linkedin_get_company_profile(company_urn: str, fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch a company's profile information by its URN (e.g., 'urn:li:organization:123').
+    Args:
+        company_urn: The organization URN.
+        fields: Optional dotted paths to keep (e.g. ['localizedName', 'locations.address.city']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    """
+    return await company.get_company_profile(company_urn, fields, compact)
+
+@mcp.tool(name="linkedin_get_company_profiles", annotations={"title": "Get Company Profiles (Batch)"})
+async def linkedin_get_company_profiles(company_urns: List[str], fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch many companies' profiles in one call.
+    Args:
+        company_urns: Organization URNs (e.g., ['urn:li:organization:123', 'urn:li:organization:456']).
+        fields: Optional dotted paths to keep (e.g. ['localizedName', 'locations.address.city']), applied to each profile.
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    Returns a map of results and per-URN errors.
+    """
+    return await company.get_company_profiles(company_urns, fields, compact)
 
 @mcp.tool(name="linkedin_search_companies", annotations={"title": "Search Companies"})
-async def linkedin_search_companies(keywords: str) -> str:
-    """Search for companies on LinkedIn by keywords."""
-    return await company.search_companies(keywords)
+async def linkedin_search_companies(
+    keywords: str, fields: List[str] = None, compact: bool = None, local_only: bool = False, max_age: float = None
+) -> ToolResult:
+    """
+    Search for companies on LinkedIn by keywords.
+    Args:
+        keywords: Search terms.
+        fields: Optional dotted paths to keep; 'elements.<field>' selects from each result item
+            (e.g. ['elements.id', 'elements.name', 'paging.total']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+        local_only: Answer only from the local index of earlier results (no LinkedIn call).
+        max_age: Answer from the local index if it has matches fetched within this many seconds;
+            older matches are refreshed in the background.
+    """
+    return await company.search_companies(keywords, fields, compact, local_only, max_age)
 
 # --- Job Tools ---
 
 @mcp.tool(name="linkedin_search_jobs", annotations={"title": "Search Jobs"})
-async def linkedin_search_jobs(keywords: str, location: str = None) -> str:
-    """Search for jobs on LinkedIn by keywords and optional location."""
-    return await job.search_jobs(keywords, location)
+async def linkedin_search_jobs(
+    keywords: str,
+    location: str = None,
+    fields: List[str] = None,
+    compact: bool = None,
+    local_only: bool = False,
+    max_age: float = None,
+) -> ToolResult:
+    """
+    Search for jobs on LinkedIn by keywords and optional location.
+    Args:
+        keywords: Search terms.
+        location: Optional location filter.
+        fields: Optional dotted paths to keep; 'elements.<field>' selects from each result item
+            (e.g. ['elements.id', 'elements.name', 'paging.total']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+        local_only: Answer only from the local index of earlier results (no LinkedIn call).
+        max_age: Answer from the local index if it has matches fetched within this many seconds;
+            older matches are refreshed in the background.
+    """
+    return await job.search_jobs(keywords, location, fields, compact, local_only, max_age)
 
 @mcp.tool(name="linkedin_get_job_details", annotations={"title": "Get Job Details"})
-async def linkedin_get_job_details(job_urn: str) -> str:
-    """Fetch details for a specific job posting by its URN."""
-    return await job.get_job_details(job_urn)
+async def linkedin_get_job_details(job_urn: str, fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch details for a specific job posting by its URN.
+    Args:
+        job_urn: The job URN.
+        fields: Optional dotted paths to keep (e.g. ['title', 'location']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    """
+    return await job.get_job_details(job_urn, fields, compact)
+
+@mcp.tool(name="linkedin_get_job_details_batch", annotations={"title": "Get Job Details (Batch)"})
+async def linkedin_get_job_details_batch(job_urns: List[str], fields: List[str] = None, compact: bool = None) -> ToolResult:
+    """
+    Fetch details for many job postings in one call.
+    Args:
+        job_urns: Job URNs (e.g., ['urn:li:job:123', 'urn:li:job:456']).
+        fields: Optional dotted paths to keep (e.g. ['title', 'location']), applied to each job.
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+    Returns a map of results and per-URN errors.
+    """
+    return await job.get_job_details_batch(job_urns, fields, compact)
 
 # --- Search Tools ---
 
 @mcp.tool(name="linkedin_search_people", annotations={"title": "Search People"})
-async def linkedin_search_people(keywords: str) -> str:
-    """Search for people on LinkedIn by keywords."""
-    return await search.search_people(keywords)
+async def linkedin_search_people(
+    keywords: str, fields: List[str] = None, compact: bool = None, local_only: bool = False, max_age: float = None
+) -> ToolResult:
+    """
+    Search for people on LinkedIn by keywords.
+    Args:
+        keywords: Search terms.
+        fields: Optional dotted paths to keep; 'elements.<field>' selects from each result item
+            (e.g. ['elements.id', 'elements.name', 'paging.total']).
+        compact: Unindented JSON text (default, COMPACT_JSON); false indents it for reading.
+        local_only: Answer only from the local index of earlier results (no LinkedIn call).
+        max_age: Answer from the local index if it has matches fetched within this many seconds;
+            older matches are refreshed in the background.
+    """
+    return await search.search_people(keywords, fields, compact, local_only, max_age)
+
+# --- Background Task Tools ---
+
+@mcp.tool(name="linkedin_get_task_status", annotations={"title": "Get Task Status"})
+async def linkedin_get_task_status(task_id: str) -> TaskStatus:
+    """
+    Report a background task's status (pending, running, completed, failed, cancelled),
+    its current step and, once finished, the tool's result.
+    """
+    return await task.get_task_status(task_id)
+
+@mcp.tool(name="linkedin_list_tasks", annotations={"title": "List Background Tasks"})
+async def linkedin_list_tasks(status: str = None) -> TaskList:
+    """List background tasks started on this server process, newest first, optionally filtered by status."""
+    return await task.list_tasks(status)
+
+@mcp.tool(name="linkedin_cancel_task", annotations={"title": "Cancel Background Task"})
+async def linkedin_cancel_task(task_id: str) -> TaskCancelled:
+    """Cancel a background task that has not finished. Images it already uploaded are kept."""
+    return await task.cancel_task(task_id)
+
+# --- Diagnostics ---
+
+@mcp.tool(name="linkedin_get_cache_stats", annotations={"title": "Get Cache Stats"})
+async def linkedin_get_cache_stats() -> Dict[str, Any]:
+    """Report response-cache hit/miss statistics, uploaded-image reuse, local search-index size and idempotency keys."""
+    from .assets import get_asset_cache
+    from .cache import response_cache
+    from .idempotency import get_idempotency_store
+    from .search_index import get_search_index
+
+    stats = response_cache.stats()
+    if settings.asset_cache_enabled:
+        stats["assets"] = await asyncio.to_thread(lambda: get_asset_cache().stats())
+    if settings.search_index_enabled:
+        stats["search_index"] = await asyncio.to_thread(lambda: get_search_index().stats())
+    stats["idempotency"] = await asyncio.to_thread(lambda: get_idempotency_store().stats())
+    return stats
+
+@mcp.tool(name="linkedin_get_rate_limit_status", annotations={"title": "Get Rate Limit Status"})
+async def linkedin_get_rate_limit_status() -> Dict[str, Any]:
+    """Report rate-limit buckets, queue depth, Retry-After pauses and per-host circuit-breaker state."""
+    from .ratelimit import rate_limiter
+    from .resilience import circuit_breakers
+    from .tenants import current_tenant, tenant_registry
+
+    tenant = current_tenant()
+    limiter = tenant.limiter if tenant is not None else rate_limiter
+    status = {**limiter.stats(), "circuits": circuit_breakers.stats()}
+    if settings.multi_tenant:
+        status["tenants"] = tenant_registry.stats()
+    return status
 
 # --- Main Entry Point ---
 
+def http_app() -> Any:
+    """
+    Stateless streamable-HTTP app: every request stands alone, so any worker can serve
+    any client. Used as a uvicorn factory by main() when SERVER_TRANSPORT=http.
+    """
+    return mcp.http_app(path=settings.http_path, transport="http", stateless_http=True)
+
 def main():
     print(f"LinkedIn MCP Server | {settings.server_host}:{settings.server_port}")
+    if settings.server_transport == "http":
+        import uvicorn
+
+        if settings.server_workers > 1 and settings.state_backend == "memory":
+            print(f"⚠️ STATE_BACKEND=memory: each of the {settings.server_workers} workers gets its own cache "
+                  f"and 1/{settings.server_workers} of every rate limit. Use STATE_BACKEND=sqlite to share them.")
+        uvicorn.run(
+            "linkedin_mcp_server.server:http_app",
+            factory=True,
+            host=settings.server_host,
+            port=settings.server_port,
+            workers=settings.server_workers,
+        )
+        return
     mcp.run(transport="sse", host=settings.server_host, port=settings.server_port)
 
 if __name__ == "__main__":
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight coroutine.
+    The shared call runs as its own task, so a cancelled caller never cancels
+    the work the other callers are waiting on. With cancel_abandoned, cancelling
+    the last waiting caller cancels the shared call too (and waits for it to unwind),
+    for work that must not carry on once nobody wants it.
+    """
+
+    def __init__(self, cancel_abandoned: bool = False) -> None:
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiting: Dict[asyncio.Task, int] = {}
+        self.cancel_abandoned = cancel_abandoned
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            self.coalesced += 1
+        self._waiting[task] = self._waiting.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self.cancel_abandoned and self._waiting[task] == 1 and not task.done():
+                task.cancel()
+                await asyncio.wait([task])
+            raise
+        finally:
+            self._waiting[task] -= 1
+            if not self._waiting[task]:
+                del self._waiting[task]
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def running(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def in_flight(self) -> int:
+        return len(self._calls)
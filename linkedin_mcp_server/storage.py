@@ -0,0 +1,50 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+from .config import settings
+
+S = TypeVar("S")
+
+def data_path(name: str) -> str:
+    """Path of a file inside settings.data_dir, creating the directory on first use."""
+    os.makedirs(settings.data_dir, exist_ok=True)
+    return os.path.join(settings.data_dir, name)
+
+@contextmanager
+def connect(path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Open (and always close) a SQLite connection in autocommit mode, tuned for
+    several readers plus one writer (WAL journal, busy timeout), rows by column name.
+    """
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        yield conn
+    finally:
+        conn.close()
+
+class LazyStore(Generic[S]):
+    """
+    Process-wide SQLite-backed store, opened by `open_store` on first call.
+    Opening and every method of the store block, so call both through asyncio.to_thread.
+    """
+
+    def __init__(self, open_store: Callable[[], S]) -> None:
+        self._open = open_store
+        self._instance: Optional[S] = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> S:
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._open()
+            return self._instance
+
+    def reset(self) -> None:
+        """Forget the open store so the next call reopens it (e.g. after settings change)."""
+        with self._lock:
+            self._instance = None
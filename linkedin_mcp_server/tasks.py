@@ -0,0 +1,169 @@
+import asyncio
+import secrets
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import pydantic_core
+from .backends import get_shared_backend
+from .config import settings
+from .errors import api_error
+
+FINISHED = {"completed", "failed", "cancelled"}
+
+class BackgroundTask:
+    """
+    One tool call running detached from the MCP request that started it.
+    Statuses: pending (waiting for a slot) -> running -> completed | failed | cancelled.
+    """
+
+    def __init__(self, tool: str, owner: Optional[str]) -> None:
+        self.id = secrets.token_hex(8)
+        self.tool = tool
+        self.owner = owner
+        self.status = "pending"
+        self.progress: Dict[str, Any] = {"done": None, "total": None, "message": "Waiting for a free slot"}
+        self.result: Any = None
+        self.error: Optional[Dict[str, str]] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Optional[asyncio.Task] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.id,
+            "tool": self.tool,
+            "owner": self.owner,
+            "status": self.status,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+_current: ContextVar[Optional[BackgroundTask]] = ContextVar("linkedin_background_task", default=None)
+
+class TaskManager:
+    """
+    Runs tool calls in the background, at most settings.task_concurrency at a time.
+    Finished tasks are kept for settings.task_retention seconds. With a shared state backend,
+    snapshots and cancel requests go through it, so any worker can answer for any task.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, BackgroundTask] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _prune(self) -> None:
+        cutoff = time.time() - settings.task_retention
+        for task_id in [t.id for t in self._tasks.values() if t.finished_at is not None and t.finished_at < cutoff]:
+            del self._tasks[task_id]
+
+    def active(self) -> int:
+        return sum(1 for task in self._tasks.values() if task.status not in FINISHED)
+
+    def submit(self, tool: str, fn: Callable[[], Awaitable[Any]], owner: Optional[str] = None) -> Optional[BackgroundTask]:
+        """Start `fn` in the background; returns None when settings.task_max_active tasks are unfinished."""
+        self._prune()
+        if self.active() >= settings.task_max_active:
+            return None
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(max(1, settings.task_concurrency))
+        task = BackgroundTask(tool, owner)
+        self._tasks[task.id] = task
+        # The task inherits this context, so it runs as the caller's tenant
+        task.future = asyncio.ensure_future(self._run(task, fn))
+        return task
+
+    async def _run(self, task: BackgroundTask, fn: Callable[[], Awaitable[Any]]) -> None:
+        _current.set(task)
+        try:
+            await self.publish(task)
+            async with self._slots:
+                task.status = "running"
+                task.started_at = time.time()
+                task.progress = {"done": None, "total": None, "message": "Started"}
+                await self.publish(task)
+                task.result = pydantic_core.to_jsonable_python(await fn())
+            task.status = "completed"
+        except asyncio.CancelledError:
+            task.status = "cancelled"
+        except Exception as e:
+            error = api_error(e)
+            task.status = "failed"
+            task.error = {"code": error.code, "message": str(error)}
+        task.finished_at = time.time()
+        await self.publish(task)
+
+    async def publish(self, task: BackgroundTask) -> None:
+        backend = get_shared_backend()
+        if backend is not None:
+            await backend.set("tasks", task.id, task.snapshot(), settings.task_retention)
+
+    async def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of a task started by this worker or, with a shared backend, by any worker."""
+        task = self._tasks.get(task_id)
+        if task is not None:
+            return task.snapshot()
+        backend = get_shared_backend()
+        return await backend.get("tasks", task_id) if backend is not None else None
+
+    def list(self, owner: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """This worker's tasks for `owner`, newest first."""
+        self._prune()
+        tasks = [t for t in self._tasks.values() if t.owner == owner and (status is None or t.status == status)]
+        return [t.snapshot() for t in sorted(tasks, key=lambda t: t.created_at, reverse=True)]
+
+    async def cancel(self, task_id: str) -> Optional[str]:
+        """
+        Cancel an unfinished task: 'cancelled' for one on this worker, 'requested' for one on
+        another worker (it stops at its next progress step), None if neither applies.
+        """
+        task = self._tasks.get(task_id)
+        if task is not None:
+            if task.status in FINISHED:
+                return None
+            task.future.cancel()
+            await asyncio.wait([task.future])
+            return "cancelled"
+        backend = get_shared_backend()
+        if backend is None:
+            return None
+        await backend.set("task_cancel", task_id, True, settings.task_retention)
+        return "requested"
+
+    async def cancel_requested(self, task: BackgroundTask) -> bool:
+        backend = get_shared_backend()
+        return backend is not None and bool(await backend.get("task_cancel", task.id))
+
+    async def stop(self) -> None:
+        """Cancel every unfinished task (server shutdown)."""
+        futures = [t.future for t in self._tasks.values() if t.status not in FINISHED]
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        counts = {"pending": 0, "running": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        for task in self._tasks.values():
+            counts[task.status] += 1
+        return counts
+
+task_manager = TaskManager()
+
+async def report_progress(message: str, done: Optional[float] = None, total: Optional[float] = None) -> None:
+    """
+    Record a step of the background task running this code (a no-op in a normal tool call).
+    Also where a cancel request from another worker takes effect.
+    """
+    task = _current.get()
+    if task is None:
+        return
+    task.progress = {"done": done, "total": total, "message": message}
+    if await task_manager.cancel_requested(task):
+        # Cancel the whole task, including concurrent steps, rather than just this one
+        task.future.cancel()
+        return
+    await task_manager.publish(task)
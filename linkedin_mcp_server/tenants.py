@@ -0,0 +1,126 @@
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+import httpx
+from .cache import response_cache
+from .config import settings
+from .identity import identity_cache
+from .ratelimit import RateLimiter, rate_limiter
+from .tokens import auth_headers
+
+class Tenant:
+    """One LinkedIn account served by this process: prebuilt headers and its own rate-limit budget."""
+
+    def __init__(self, token: str) -> None:
+        self.id = hashlib.sha256(token.encode()).hexdigest()[:12]
+        self.headers = auth_headers(token)
+        self.authorization = self.headers["Authorization"]
+        self.limiter = RateLimiter(scope=self.id)
+        self.last_used = time.monotonic()
+
+class TenantRegistry:
+    """
+    Maps session credentials to tenants. Tenants, and tokens bound to sessions by the auth
+    tools, are kept in LRU order and dropped (tenants with their cached identity and
+    responses) once idle or over `tenant_max_tenants`.
+    All tenants share the one pooled HTTP client; credentials travel per request.
+    """
+
+    def __init__(self) -> None:
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+        # Tokens obtained through the auth tools, keyed by MCP session ID: (token, last used)
+        self._sessions: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.evictions = 0
+
+    def resolve(self, token: str) -> Tenant:
+        """Return the tenant for a token, registering it on first sight."""
+        authorization = f"Bearer {token}"
+        tenant = self._tenants.get(authorization)
+        if tenant is None:
+            tenant = self._tenants[authorization] = Tenant(token)
+        self._tenants.move_to_end(authorization)
+        tenant.last_used = time.monotonic()
+        self._evict()
+        return tenant
+
+    def _evict(self) -> None:
+        idle_before = time.monotonic() - settings.tenant_idle_timeout
+        while self._tenants:
+            authorization, oldest = next(iter(self._tenants.items()))
+            if len(self._tenants) <= settings.tenant_max_tenants and oldest.last_used >= idle_before:
+                break
+            del self._tenants[authorization]
+            identity_cache.invalidate(authorization)
+            response_cache.invalidate(authorization)
+            self.evictions += 1
+
+    def limiter_for(self, request: httpx.Request) -> RateLimiter:
+        """Rate limiter for the tenant whose credential a request carries."""
+        tenant = self._tenants.get(request.headers.get("Authorization", ""))
+        return tenant.limiter if tenant is not None else rate_limiter
+
+    def bind_session(self, session_id: str, token: str) -> None:
+        self._sessions[session_id] = (token, time.monotonic())
+        self._sessions.move_to_end(session_id)
+        self._evict_sessions()
+
+    def session_token(self, session_id: Optional[str]) -> Optional[str]:
+        """The token a session logged in with, unless it has been idle past tenant_idle_timeout."""
+        self._evict_sessions()
+        entry = self._sessions.get(session_id) if session_id else None
+        if entry is None:
+            return None
+        self._sessions[session_id] = (entry[0], time.monotonic())
+        self._sessions.move_to_end(session_id)
+        return entry[0]
+
+    def _evict_sessions(self) -> None:
+        # Sessions are kept in LRU order, so the idle and the surplus ones are at the front
+        idle_before = time.monotonic() - settings.tenant_idle_timeout
+        while self._sessions:
+            _, last_used = next(iter(self._sessions.values()))
+            if len(self._sessions) <= settings.tenant_max_tenants and last_used >= idle_before:
+                break
+            self._sessions.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tenants": len(self._tenants),
+            "sessions_with_login": len(self._sessions),
+            "evictions": self.evictions,
+        }
+
+tenant_registry = TenantRegistry()
+
+_current_tenant: ContextVar[Optional[Tenant]] = ContextVar("linkedin_tenant", default=None)
+_current_session: ContextVar[Optional[str]] = ContextVar("linkedin_session", default=None)
+
+@contextmanager
+def use_tenant(tenant: Optional[Tenant], session_id: Optional[str] = None) -> Iterator[None]:
+    """Run the enclosed tool call as `tenant` (tasks spawned inside inherit it)."""
+    tenant_token = _current_tenant.set(tenant)
+    session_token = _current_session.set(session_id)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(tenant_token)
+        _current_session.reset(session_token)
+
+def current_tenant() -> Optional[Tenant]:
+    return _current_tenant.get()
+
+def current_session() -> Optional[str]:
+    return _current_session.get()
+
+def tenant_headers() -> Dict[str, str]:
+    """Headers for the tenant of the current tool call."""
+    tenant = _current_tenant.get()
+    if tenant is None:
+        raise ValueError(
+            f"No LinkedIn credential for this session. Send your access token in the "
+            f"{settings.tenant_token_header} header or use the auth tools to login first."
+        )
+    return dict(tenant.headers)
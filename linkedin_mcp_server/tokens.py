@@ -0,0 +1,201 @@
+import asyncio
+import os
+import tempfile
+import time
+import httpx
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from .backends import forget_shared
+from .client import get_client
+from .config import settings
+from .identity import identity_cache
+from .cache import response_cache
+from .singleflight import SingleFlight
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+TOKEN_URL = "https://www.linkedin.com/oauth/v2/accessToken"
+
+def auth_headers(token: str) -> Dict[str, str]:
+    """Request headers for a LinkedIn access token."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "X-Restli-Protocol-Version": "2.0.0"
+    }
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive advisory lock on `<path>.lock`, held across processes."""
+    with open(f"{path}.lock", "a+") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _write_env(path: str, values: Dict[str, Optional[str]]) -> None:
+    """Update KEY=value lines in an env file via temp file + rename, under a file lock."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with _file_lock(path):
+        lines = []
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                lines = f.read().splitlines()
+
+        remaining = dict(values)
+        out = []
+        for line in lines:
+            key = line.split("=", 1)[0].strip()
+            if key in remaining:
+                value = remaining.pop(key)
+                if value is not None:
+                    out.append(f"{key}={value}")
+            else:
+                out.append(line)
+        out.extend(f"{key}={value}" for key, value in remaining.items() if value is not None)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".env.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(out) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o600
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+class TokenStore:
+    """
+    Holds the current access token, its expiry and prebuilt request headers in memory.
+    Loaded once from settings; new tokens are persisted atomically to the env file.
+    With a refresh token, the access token is refreshed in the background shortly
+    before it expires, so the request path never touches the filesystem.
+    """
+
+    def __init__(self) -> None:
+        self._token: Optional[str] = None
+        self._refresh_token: Optional[str] = None
+        self._expires_at: Optional[float] = None
+        self._headers: Optional[Dict[str, str]] = None
+        self._refreshes = SingleFlight()
+        self._background: Optional[asyncio.Task] = None
+        self._retry_refresh_at = 0.0
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        if settings.linkedin_access_token:
+            self._apply(settings.linkedin_access_token, settings.linkedin_token_expires_at, settings.linkedin_refresh_token)
+
+    def _apply(self, token: str, expires_at: Optional[float], refresh_token: Optional[str]) -> None:
+        previous = self._headers["Authorization"] if self._headers else None
+        self._token = token
+        self._expires_at = expires_at
+        self._refresh_token = refresh_token
+        self._headers = auth_headers(token)
+        settings.linkedin_access_token = token
+        if previous and previous != self._headers["Authorization"]:
+            # Anything cached under the old token belongs to the old token
+            forget_token(previous)
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return self._expires_at
+
+    async def get_headers(self) -> Dict[str, str]:
+        if not self._loaded:
+            self._load()
+        if self._headers is None:
+            raise ValueError("LinkedIn Access Token missing. Please use the auth tools to login first.")
+
+        if self._refresh_token and self._expires_at is not None:
+            remaining = self._expires_at - time.time()
+            if remaining <= 0:
+                await self.refresh()
+            elif remaining <= settings.token_refresh_margin and self._can_refresh_in_background():
+                # Refresh ahead of expiry without holding up this request
+                self._background = asyncio.ensure_future(self._refresh_quietly())
+        return dict(self._headers)
+
+    async def set_token(
+        self, token: str, expires_in: Optional[float] = None, refresh_token: Optional[str] = None
+    ) -> None:
+        """Swap in a new token and persist it (atomically) to the env file."""
+        expires_at = time.time() + float(expires_in) if expires_in else None
+        self._loaded = True
+        self._apply(token, expires_at, refresh_token or self._refresh_token)
+        await asyncio.to_thread(_write_env, settings.token_env_path, {
+            "LINKEDIN_ACCESS_TOKEN": token,
+            "LINKEDIN_TOKEN_EXPIRES_AT": str(int(expires_at)) if expires_at else None,
+            "LINKEDIN_REFRESH_TOKEN": self._refresh_token,
+        })
+
+    async def refresh(self) -> None:
+        """Exchange the refresh token for a new access token (one request at a time)."""
+        await self._refreshes.do("refresh", self._refresh)
+
+    async def _refresh(self) -> None:
+        if not self._refresh_token:
+            raise ValueError("No refresh token available. Please re-authenticate.")
+        resp = await get_client().post(TOKEN_URL, data={
+            "grant_type": "refresh_token",
+            "refresh_token": self._refresh_token,
+            "client_id": settings.linkedin_client_id,
+            "client_secret": settings.linkedin_client_secret
+        })
+        resp.raise_for_status()
+        data = resp.json()
+        await self.set_token(data["access_token"], data.get("expires_in"), data.get("refresh_token"))
+
+    def _can_refresh_in_background(self) -> bool:
+        if self._background is not None and not self._background.done():
+            return False
+        return time.monotonic() >= self._retry_refresh_at
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            # The current token is still valid; try again in a minute
+            self._retry_refresh_at = time.monotonic() + 60.0
+
+token_store = TokenStore()
+
+def forget_token(authorization: str) -> None:
+    """Drop everything cached under a token: its identity, cached responses and shared entries."""
+    identity_cache.invalidate(authorization)
+    response_cache.invalidate(authorization)
+    forget_shared(authorization)
+
+class UnauthorizedTransport(httpx.AsyncBaseTransport):
+    """Forgets what was cached under a token as soon as LinkedIn rejects it with a 401."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        authorization = request.headers.get("Authorization")
+        if response.status_code == 401 and authorization:
+            forget_token(authorization)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -1,10 +1,14 @@
-import httpx
+from ..client import get_client
 from ..config import settings
+from ..errors import InvalidRequest, api_error
+from ..results import AuthorizationUrl, LoginResult
+from ..tenants import current_session, tenant_registry
+from ..tokens import token_store, TOKEN_URL
 
-async def get_oauth_url() -> str:
+async def get_oauth_url() -> AuthorizationUrl:
     """Generate the LinkedIn OAuth 2.0 authorization URL."""
     if not settings.linkedin_client_id:
-        return "Error: LINKEDIN_CLIENT_ID not configured in .env"
+        raise InvalidRequest("LINKEDIN_CLIENT_ID not configured in .env")
         
     # Extended scopes for maximum functionality
     # openid, profile, email: Standard OIDC
@@ -23,55 +27,50 @@ async def get_oauth_url() -> str:
         f"&scope={scope_encoded}"
     )
     
-    return (
-        f"# LinkedIn Authorization\n\n"
-        f"1. [Click here to authorize]({url})\n"
-        f"2. After login, copy the `code` parameter from the redirect URL.\n"
-        f"3. Use the `linkedin_exchange_code` tool with that code."
+    return AuthorizationUrl(
+        url=url,
+        instructions=(
+            "Open the URL and authorize. After login, copy the `code` parameter from the redirect URL "
+            "and use the `linkedin_exchange_code` tool with that code."
+        ),
     )
 
-async def exchange_code(code: str) -> str:
+async def exchange_code(code: str) -> LoginResult:
     """Exchange authorization code for an access token."""
     if not settings.linkedin_client_id or not settings.linkedin_client_secret:
-        return "Error: Missing client credentials (ID or Secret)."
+        raise InvalidRequest("Missing client credentials (ID or Secret).")
         
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.post("https://www.linkedin.com/oauth/v2/accessToken", data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": settings.linkedin_redirect_uri,
-                "client_id": settings.linkedin_client_id,
-                "client_secret": settings.linkedin_client_secret
-            })
+    client = get_client()
+    try:
+        resp = await client.post(TOKEN_URL, data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": settings.linkedin_redirect_uri,
+            "client_id": settings.linkedin_client_id,
+            "client_secret": settings.linkedin_client_secret
+        })
             
-            if resp.status_code != 200:
-                return f"Error exchanging code: {resp.text}"
+        if resp.status_code != 200:
+            raise InvalidRequest(f"Could not exchange code: {resp.text}", resp.status_code)
                 
-            token = resp.json().get("access_token")
-            expires = resp.json().get("expires_in")
+        data = resp.json()
+        token = data.get("access_token")
+        expires = data.get("expires_in")
             
-            # Save to .env
-            env_path = ".env"
-            lines = []
-            if os.path.exists(env_path):
-                with open(env_path, "r") as f:
-                    lines = f.readlines()
-            
-            with open(env_path, "w") as f:
-                found = False
-                for line in lines:
-                    if line.startswith("LINKEDIN_ACCESS_TOKEN"):
-                        f.write(f"LINKEDIN_ACCESS_TOKEN={token}\n")
-                        found = True
-                    else:
-                        f.write(line)
-                if not found:
-                    f.write(f"\nLINKEDIN_ACCESS_TOKEN={token}")
+        if settings.multi_tenant:
+            # Shared process: the token belongs to this session only and is never written to disk
+            session_id = current_session()
+            if session_id is None:
+                raise InvalidRequest(
+                    f"No MCP session to attach the token to. Send it in the {settings.tenant_token_header} header instead."
+                )
+            tenant_registry.bind_session(session_id, token)
+            return LoginResult(stored_in="session", expires_in=expires)
+
+        # Use it immediately and save it to .env (atomic write, file-locked)
+        await token_store.set_token(token, expires, data.get("refresh_token"))
                     
-            return f"✅ Success! Access Token saved. Expires in {expires} seconds."
-            
-        except Exception as e:
-            return f"Error: {str(e)}"
+        return LoginResult(stored_in="env", expires_in=expires)
             
-import os
+    except Exception as e:
+        raise api_error(e) from e
@@ -1,42 +1,114 @@
-import json
 import httpx
-from ..utils import get_headers, handle_api_error
+from typing import Any, Dict, List, Optional
+from fastmcp.tools.tool import ToolResult
+from ..errors import api_error
+from ..utils import (
+    get_headers, batch_fetch, gather_limited, project, project_results, tool_result,
+)
+from ..cache import cached_get_json, prime_json
+from ..search_index import indexed_search
 from ..config import settings
 from urllib.parse import quote
 
-async def get_company_profile(company_urn: str) -> str:
+async def get_company_profile(
+    company_urn: str, fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
     """
     Fetch a company's profile information by its URN.
     Example URN: 'urn:li:organization:12345'
     """
     try:
         headers = await get_headers()
-        # The URN must be URL encoded
-        encoded_urn = quote(company_urn)
-        url = f"{settings.api_base}/organizations/{encoded_urn}"
-        
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        data = await cached_get_json(_company_url(company_urn), headers, "organizations")
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def search_companies(keywords: str) -> str:
+async def get_company_profiles(
+    company_urns: List[str], fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
+    """
+    Fetch several companies' profiles at once.
+    Numeric organization URNs go through Rest.li BATCH_GET (ids=List(...)) in chunks
+    of settings.batch_max_ids; anything else is looked up individually with bounded
+    concurrency. Returns one map of results and per-URN errors.
+    """
+    try:
+        headers = await get_headers()
+        urns = list(dict.fromkeys(company_urns))
+        ids = {urn.rsplit(":", 1)[-1]: urn for urn in urns}
+        if not all(org_id.isdigit() for org_id in ids):
+            result = await batch_fetch(urns, lambda urn: _fetch_company(headers, urn))
+            return tool_result(project_results(result, fields), compact)
+
+        keys = list(ids)
+        size = max(1, settings.batch_max_ids)
+        chunks = [{k: ids[k] for k in keys[i:i + size]} for i in range(0, len(keys), size)]
+        outcomes = await gather_limited(chunks, lambda chunk: _batch_get(headers, chunk), settings.batch_concurrency)
+
+        result: Dict[str, Dict[str, Any]] = {"results": {}, "errors": {}}
+        for outcome in outcomes:
+            result["results"].update(outcome["results"])
+            result["errors"].update(outcome["errors"])
+        return tool_result(project_results(result, fields), compact)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def search_companies(
+    keywords: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    local_only: bool = False,
+    max_age: Optional[float] = None,
+) -> ToolResult:
     """
     Search for companies by keywords.
     Note: This often requires specialized LinkedIn Marketing permissions.
+    `local_only`/`max_age` answer from the local search index (see search_index.indexed_search).
     """
     try:
         headers = await get_headers()
         # Standard search endpoint
         url = f"{settings.api_base}/companySearch?q=search&keywords={quote(keywords)}"
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        data = await indexed_search("organization", url, headers, "companySearch", keywords, local_only, max_age)
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
+
+def _company_url(company_urn: str) -> str:
+    # The URN must be URL encoded
+    return f"{settings.api_base}/organizations/{quote(company_urn)}"
+
+async def _fetch_company(headers: Dict[str, str], company_urn: str) -> Any:
+    return await cached_get_json(_company_url(company_urn), headers, "organizations")
+
+async def _batch_get(headers: Dict[str, str], ids: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """BATCH_GET one chunk of organization IDs (id -> URN), priming the per-URN cache."""
+    url = f"{settings.api_base}/organizations?ids=List({','.join(ids)})"
+    try:
+        data = await cached_get_json(url, headers, "organizations")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (401, 429):
+            raise
+        # BATCH_GET not available to this app: fall back to individual lookups
+        return await batch_fetch(list(ids.values()), lambda urn: _fetch_company(headers, urn))
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for key, doc in data.get("results", {}).items():
+        urn = ids.get(str(key))
+        if urn:
+            results[urn] = doc
+            prime_json(_company_url(urn), headers, "organizations", doc)
+    for key, err in data.get("errors", {}).items():
+        urn = ids.get(str(key))
+        if urn:
+            errors[urn] = f"Error: API request failed ({err.get('status')}): {err.get('message')}"
+    for urn in ids.values():
+        if urn not in results and urn not in errors:
+            errors[urn] = "Error: Not returned by the batch lookup."
+    return {"results": results, "errors": errors}
@@ -1,12 +1,23 @@
-import json
-import httpx
-from ..utils import get_headers, handle_api_error
+from typing import Any, Dict, List, Optional
+from fastmcp.tools.tool import ToolResult
+from ..errors import api_error
+from ..utils import get_headers, batch_fetch, project, project_results, tool_result
+from ..cache import cached_get_json
+from ..search_index import indexed_search
 from ..config import settings
 from urllib.parse import quote
 
-async def search_jobs(keywords: str, location: Optional[str] = None) -> str:
+async def search_jobs(
+    keywords: str,
+    location: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    local_only: bool = False,
+    max_age: Optional[float] = None,
+) -> ToolResult:
     """
     Search for jobs on LinkedIn.
+    `local_only`/`max_age` answer from the local search index (see search_index.indexed_search).
     """
     try:
         headers = await get_headers()
@@ -14,29 +25,44 @@ async def search_jobs(keywords: str, location: Optional[str] = None) -> str:
         if location:
             url += f"&location={quote(location)}"
             
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        query = f"{keywords} {location}" if location else keywords
+        data = await indexed_search("job", url, headers, "jobSearch", query, local_only, max_age)
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def get_job_details(job_urn: str) -> str:
+async def get_job_details(
+    job_urn: str, fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
     """
     Fetch details for a specific job posting.
     """
     try:
         headers = await get_headers()
-        encoded_urn = quote(job_urn)
-        url = f"{settings.api_base}/jobs/{encoded_urn}"
-        
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        data = await _fetch_job(headers, job_urn)
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-from typing import Optional
+async def get_job_details_batch(
+    job_urns: List[str], fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
+    """
+    Fetch details for several job postings at once, with bounded concurrency.
+    Returns one map of results and per-URN errors.
+    """
+    try:
+        headers = await get_headers()
+        urns = list(dict.fromkeys(job_urns))
+        result = await batch_fetch(urns, lambda urn: _fetch_job(headers, urn))
+        return tool_result(project_results(result, fields), compact)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def _fetch_job(headers: Dict[str, str], job_urn: str) -> Any:
+    encoded_urn = quote(job_urn)
+    url = f"{settings.api_base}/jobs/{encoded_urn}"
+    return await cached_get_json(url, headers, "jobs")
@@ -1,9 +1,22 @@
-import json
+import asyncio
+import hashlib
+import tempfile
 import httpx
+from ..client import get_client
 import os
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field, ConfigDict
-from ..utils import get_headers, handle_api_error
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Optional, List, Tuple, Type, TypeVar
+from pydantic import BaseModel, Field, ConfigDict, ValidationError
+from ..errors import ApiError, LinkedInError, NotFound, api_error
+from ..results import BatchResult, CommentCreated, CommentPage, Deleted, PostCreated, PostPage, PostUpdated
+from ..utils import batch_fetch, gather_limited, get_headers, handle_api_error
+from ..assets import get_asset_cache, hash_file
+from ..backends import token_scope
+from ..comment_store import get_comment_store
+from ..identity import get_person_urn
+from ..idempotency import idempotent
+from ..paging import Pager
+from ..singleflight import SingleFlight
+from ..tasks import report_progress
 from ..config import settings
 from urllib.parse import quote
 
@@ -13,31 +26,56 @@ class PostParams(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
     text: str = Field(..., description="The commentary/text content of the post.")
     visibility: str = Field(default="PUBLIC", description="Post visibility: PUBLIC or CONNECTIONS.")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first result.")
 
 class ImagePostParams(BaseModel):
     text: str = Field(..., description="The text content.")
     image_source: str = Field(..., description="Local file path or public URL of the image.")
     visibility: str = Field(default="PUBLIC")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first result.")
+
+class MultiImagePostParams(BaseModel):
+    text: str = Field(..., description="The text content.")
+    image_sources: List[str] = Field(
+        ..., min_length=2, max_length=20, description="Local file paths or public URLs of the images (2-20)."
+    )
+    visibility: str = Field(default="PUBLIC")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first result.")
 
 class CommentParams(BaseModel):
     object_urn: str = Field(..., description="The URN of the post/share to comment on (e.g., urn:li:share:123)")
     text: str = Field(..., description="The text content of the comment.")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first result.")
 
 class UpdatePostParams(BaseModel):
     post_urn: str = Field(..., description="The URN of the post to update.")
     text: str = Field(..., description="The new text content.")
     visibility: str = Field(default="PUBLIC", description="Visibility for the new post: PUBLIC or CONNECTIONS.")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first result.")
 
 # --- Helper: Image Upload ---
 
-async def upload_image(client: httpx.AsyncClient, headers: dict, person_urn: str, image_source: str) -> str:
-    """
-    Handles the 3-step image upload process:
-    1. Register Upload -> Get upload URL and Asset URN.
-    2. Upload Image Binary.
-    3. Return Asset URN.
-    """
-    # Step 1: Register
+_asset_uploads = SingleFlight()
+
+async def _iter_fileobj(f: BinaryIO, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield an open binary file in fixed-size chunks without blocking the event loop."""
+    while True:
+        chunk = await asyncio.to_thread(f.read, chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+async def _iter_file(path: str, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield a local file in fixed-size chunks without blocking the event loop."""
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        async for chunk in _iter_fileobj(f, chunk_size):
+            yield chunk
+    finally:
+        f.close()
+
+async def _register_upload(client: httpx.AsyncClient, headers: dict, person_urn: str) -> Tuple[str, str]:
+    """Register an image asset; returns (upload URL, asset URN)."""
     reg_url = f"{settings.api_base}/assets?action=registerUpload"
     reg_body = {
         "registerUploadRequest": {
@@ -52,174 +90,460 @@ async def upload_image(client: httpx.AsyncClient, headers: dict, person_urn: str
     reg_data = reg_resp.json()
     
     upload_url = reg_data['value']['uploadMechanism']['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest']['uploadUrl']
-    asset_urn = reg_data['value']['asset']
-    
-    # Step 2: Get Image Data
-    if image_source.startswith("http"):
-        # Download from URL
-        img_resp = await client.get(image_source)
-        img_resp.raise_for_status()
-        image_data = img_resp.content
-    else:
-        # Read from local file
-        if not os.path.exists(image_source):
-            raise FileNotFoundError(f"Image file not found: {image_source}")
-        with open(image_source, "rb") as f:
-            image_data = f.read()
-            
-    # Step 3: Upload Binary
+    return upload_url, reg_data['value']['asset']
+
+async def _put_binary(
+    client: httpx.AsyncClient, headers: dict, upload_url: str, content: AsyncIterator[bytes], size: Optional[int]
+) -> None:
     # Use the same token for upload if required, though typically it's a signed URL
     upload_headers = {"Authorization": headers["Authorization"]}
-    upload_resp = await client.put(upload_url, headers=upload_headers, content=image_data)
+    if size is not None:
+        upload_headers["Content-Length"] = str(size)
+    upload_resp = await client.put(upload_url, headers=upload_headers, content=content)
     upload_resp.raise_for_status()
-    
+
+async def _stream_upload(client: httpx.AsyncClient, headers: dict, person_urn: str, image_source: str) -> str:
+    """Register, then stream the image from its source straight into the upload URL."""
+    upload_url, asset_urn = await _register_upload(client, headers, person_urn)
+    # Peak memory is one chunk, whatever the image size
+    chunk_size = settings.upload_chunk_size
+    if image_source.startswith("http"):
+        # Pipe the download into the upload as it arrives
+        async with client.stream("GET", image_source) as img_resp:
+            img_resp.raise_for_status()
+            # Decoded bytes only match Content-Length when the body isn't compressed
+            size = None
+            if "Content-Length" in img_resp.headers and "Content-Encoding" not in img_resp.headers:
+                size = int(img_resp.headers["Content-Length"])
+            await _put_binary(client, headers, upload_url, img_resp.aiter_bytes(chunk_size), size)
+    else:
+        size = os.path.getsize(image_source)
+        await _put_binary(client, headers, upload_url, _iter_file(image_source, chunk_size), size)
+    return asset_urn
+
+async def _cached_upload(
+    client: httpx.AsyncClient, headers: dict, person_urn: str, image_source: str, reuse: bool
+) -> Tuple[str, bool]:
+    """Hash the image first; reuse this owner's asset for identical bytes, else upload once."""
+    chunk_size = settings.upload_chunk_size
+    cache = await asyncio.to_thread(get_asset_cache)
+    spool = None
+    # Set once the shared upload task owns the spool and will close it
+    owned = False
+    try:
+        if image_source.startswith("http"):
+            # Spool to disk while hashing, so memory stays at one chunk as in _stream_upload
+            spool = await asyncio.to_thread(tempfile.TemporaryFile)
+            digest = hashlib.sha256()
+            size = 0
+            async with client.stream("GET", image_source) as img_resp:
+                img_resp.raise_for_status()
+                async for chunk in img_resp.aiter_bytes(chunk_size):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(spool.write, chunk)
+            content_hash = digest.hexdigest()
+        else:
+            content_hash, size = await asyncio.to_thread(hash_file, image_source, chunk_size)
+
+        if reuse:
+            cached = await asyncio.to_thread(cache.get, content_hash, person_urn, settings.asset_cache_ttl)
+            if cached is not None:
+                return cached, True
+
+        async def upload() -> str:
+            try:
+                upload_url, asset_urn = await _register_upload(client, headers, person_urn)
+                if spool is not None:
+                    spool.seek(0)
+                    content = _iter_fileobj(spool, chunk_size)
+                else:
+                    content = _iter_file(image_source, chunk_size)
+                await _put_binary(client, headers, upload_url, content, size)
+                await asyncio.to_thread(cache.put, content_hash, person_urn, asset_urn, size)
+                return asset_urn
+            finally:
+                if spool is not None:
+                    spool.close()
+
+        # Identical images uploaded concurrently (e.g. within one carousel) share one upload.
+        # The upload outlives a cancelled caller, so only it may close the spool it reads;
+        # a caller that joins another's upload still closes its own.
+        key = (content_hash, person_urn, reuse)
+        owned = not _asset_uploads.running(key)
+        return await _asset_uploads.do(key, upload), False
+    finally:
+        if spool is not None and not owned:
+            spool.close()
+
+async def _upload_image(
+    client: httpx.AsyncClient, headers: dict, person_urn: str, image_source: str, reuse: bool = True
+) -> Tuple[str, bool]:
+    """Upload (or reuse) an image; returns (asset URN, whether a cached asset was reused)."""
+    # Fail before registering an asset that could never be uploaded
+    if not image_source.startswith("http") and not os.path.exists(image_source):
+        raise FileNotFoundError(f"Image file not found: {image_source}")
+    if settings.asset_cache_enabled:
+        return await _cached_upload(client, headers, person_urn, image_source, reuse)
+    return await _stream_upload(client, headers, person_urn, image_source), False
+
+async def upload_image(client: httpx.AsyncClient, headers: dict, person_urn: str, image_source: str) -> str:
+    """
+    Handles the 3-step image upload process:
+    1. Register Upload -> Get upload URL and Asset URN.
+    2. Stream Image Binary from its source into the upload URL.
+    3. Return Asset URN.
+    With the asset cache on, an image already uploaded by this owner skips steps 1 and 2.
+    """
+    asset_urn, _ = await _upload_image(client, headers, person_urn, image_source)
     return asset_urn
 
+async def forget_assets(asset_urns: List[str]) -> None:
+    """Stop reusing assets that LinkedIn rejected or that were deleted."""
+    if settings.asset_cache_enabled and asset_urns:
+        cache = await asyncio.to_thread(get_asset_cache)
+        await asyncio.to_thread(cache.forget, asset_urns)
+
+def _created_id(resp: httpx.Response) -> str:
+    """ID of what a create call made: the X-RestLi-Id header, else the body's 'id' (a 201 may have no body)."""
+    created = resp.headers.get("X-RestLi-Id")
+    if created is None and resp.content:
+        created = resp.json().get("id")
+    if created is None:
+        raise ApiError(f"LinkedIn accepted the request ({resp.status_code}) but returned no ID.", resp.status_code)
+    return created
+
+def _asset_rejected(resp: httpx.Response, asset_urns: List[str]) -> bool:
+    """Whether a failed post creation names one of its (possibly stale) image assets."""
+    if resp.status_code not in (400, 404, 422):
+        return False
+    return any(urn in resp.text or urn.rsplit(":", 1)[-1] in resp.text for urn in asset_urns)
+
 # --- Post Implementation ---
 
-async def create_image_post(params: ImagePostParams) -> str:
+async def delete_asset(client: httpx.AsyncClient, headers: dict, asset_urn: str) -> None:
+    """Delete an uploaded image asset that never made it into a post."""
+    asset_id = asset_urn.rsplit(":", 1)[-1]
+    resp = await client.delete(f"{settings.api_base}/assets/{asset_id}", headers=headers)
+    resp.raise_for_status()
+    await forget_assets([asset_urn])
+
+def _image_post_payload(author_urn: str, text: str, asset_urns: List[str], visibility: str) -> dict:
+    return {
+        "author": author_urn,
+        "lifecycleState": "PUBLISHED",
+        "specificContent": {"com.linkedin.ugc.ShareContent": {
+            "shareCommentary": {"text": text},
+            "shareMediaCategory": "IMAGE",
+            "media": [{
+                "status": "READY",
+                "description": {"text": "Image"},
+                "media": asset_urn,
+                "title": {"text": "Image Post"}
+            } for asset_urn in asset_urns]
+        }},
+        "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility}
+    }
+
+W = TypeVar("W", bound=BaseModel)
+
+async def _once(tool: str, params: BaseModel, fn: Callable[[], Awaitable[W]], model: Type[W]) -> W:
+    """Run a write tool, or replay its stored result when params.idempotency_key was seen before."""
+    if not params.idempotency_key:
+        return await fn()
+    try:
+        # Keys belong to the member, so they survive token refreshes (URN is cached per token)
+        owner = await get_person_urn(await get_headers())
+    except Exception as e:
+        raise api_error(e) from e
+    return await idempotent(
+        params.idempotency_key, owner, tool, params.model_dump(exclude={"idempotency_key"}), fn, model
+    )
+
+async def create_image_post(params: ImagePostParams) -> PostCreated:
     """Create a post with an image."""
+    return await _once("create_image_post", params, lambda: _create_image_post(params), PostCreated)
+
+async def _create_image_post(params: ImagePostParams) -> PostCreated:
     try:
         headers = await get_headers()
-        async with httpx.AsyncClient() as client:
-            # 1. Get User ID
-            user_resp = await client.get(f"{settings.api_base}/userinfo", headers=headers)
-            user_resp.raise_for_status()
-            person_id = user_resp.json().get("sub")
-            author_urn = f"urn:li:person:{person_id}"
+        client = get_client()
+        # 1. Resolve Author URN (cached per token)
+        await report_progress("Resolving author", 0, 3)
+        author_urn = await get_person_urn(headers)
             
-            # 2. Upload Image
-            asset_urn = await upload_image(client, headers, author_urn, params.image_source)
-            
-            # 3. Create Post
-            payload = {
-                "author": author_urn,
-                "lifecycleState": "PUBLISHED",
-                "specificContent": {"com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {"text": params.text},
-                    "shareMediaCategory": "IMAGE",
-                    "media": [{
-                        "status": "READY",
-                        "description": {"text": "Image"},
-                        "media": asset_urn,
-                        "title": {"text": "Image Post"}
-                    }]
-                }},
-                "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": params.visibility}
-            }
+        # 2. Upload Image (or reuse an identical one)
+        await report_progress("Uploading image", 1, 3)
+        asset_urn, reused = await _upload_image(client, headers, author_urn, params.image_source)
             
+        # 3. Create Post
+        await report_progress("Creating post", 2, 3)
+        payload = _image_post_payload(author_urn, params.text, [asset_urn], params.visibility)
+        resp = await client.post(f"{settings.api_base}/ugcPosts", headers=headers, json=payload)
+        if reused and _asset_rejected(resp, [asset_urn]):
+            # The cached asset is gone on LinkedIn's side: forget it and upload afresh
+            await forget_assets([asset_urn])
+            asset_urn, _ = await _upload_image(client, headers, author_urn, params.image_source, reuse=False)
+            payload = _image_post_payload(author_urn, params.text, [asset_urn], params.visibility)
             resp = await client.post(f"{settings.api_base}/ugcPosts", headers=headers, json=payload)
-            resp.raise_for_status()
+        resp.raise_for_status()
             
-            post_id = resp.json().get("id")
-            return f"✅ Image Post created successfully.\nID: {post_id}"
+        return PostCreated(id=_created_id(resp), asset_urns=[asset_urn])
 
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def create_post(params: PostParams) -> str:
-    """Create a new text-based update on the user LinkedIn feed."""
+async def create_multi_image_post(params: MultiImagePostParams) -> PostCreated:
+    """
+    Create one post with several images. Uploads run concurrently (settings.upload_concurrency);
+    if any fails, no post is created and the images uploaded for it are deleted again.
+    """
+    return await _once("create_multi_image_post", params, lambda: _create_multi_image_post(params), PostCreated)
+
+async def _create_multi_image_post(params: MultiImagePostParams) -> PostCreated:
     try:
         headers = await get_headers()
-        async with httpx.AsyncClient() as client:
-            # 1. Get User ID (sub) to construct Author URN
-            user_resp = await client.get(f"{settings.api_base}/userinfo", headers=headers)
-            user_resp.raise_for_status()
-            person_id = user_resp.json().get("sub")
-            author = f"urn:li:person:{person_id}"
-
-            # 2. Construct Payload
-            payload = {
-                "author": author, 
-                "lifecycleState": "PUBLISHED",
-                "specificContent": {"com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {"text": params.text}, 
-                    "shareMediaCategory": "NONE"
-                }},
-                "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": params.visibility}
-            }
-            
-            # 3. Send Request
+        client = get_client()
+        total = len(params.image_sources)
+        await report_progress("Resolving author", 0, total + 1)
+        author_urn = await get_person_urn(headers)
+
+        async def upload_all(reuse: bool) -> List[Tuple[str, bool]]:
+            done = 0
+            await report_progress(f"Uploading images (0 of {total})", 0, total + 1)
+
+            async def upload(source: str) -> tuple:
+                nonlocal done
+                try:
+                    outcome = source, await _upload_image(client, headers, author_urn, source, reuse), None
+                except Exception as e:
+                    outcome = source, None, handle_api_error(e)
+                done += 1
+                await report_progress(f"Uploading images ({done} of {total})", done, total + 1)
+                return outcome
+
+            outcomes = await gather_limited(params.image_sources, upload, settings.upload_concurrency)
+            failed = [(source, error) for source, asset, error in outcomes if error is not None]
+            assets = [asset for source, asset, error in outcomes if error is None]
+            if not failed:
+                return assets
+
+            # Reused assets may back earlier posts; only delete the ones uploaded for this post
+            fresh = [asset_urn for asset_urn, reused in assets if not reused]
+
+            async def discard(asset_urn: str) -> Optional[str]:
+                try:
+                    await delete_asset(client, headers, asset_urn)
+                    return None
+                except Exception:
+                    return asset_urn
+
+            leftovers = [urn for urn in await gather_limited(fresh, discard, settings.upload_concurrency) if urn]
+            lines = [f"{len(failed)} of {len(outcomes)} image uploads failed; no post was created."]
+            lines += [f"- {source}: {error}" for source, error in failed]
+            if fresh:
+                lines.append(f"Cleaned up {len(fresh) - len(leftovers)} of {len(fresh)} uploaded images.")
+            if leftovers:
+                lines.append(f"Could not delete: {', '.join(leftovers)}")
+            raise LinkedInError("\n".join(lines))
+
+        assets = await upload_all(reuse=True)
+        uploaded = [asset_urn for asset_urn, reused in assets]
+
+        await report_progress("Creating post", total, total + 1)
+        payload = _image_post_payload(author_urn, params.text, uploaded, params.visibility)
+        resp = await client.post(f"{settings.api_base}/ugcPosts", headers=headers, json=payload)
+        if any(reused for _, reused in assets) and _asset_rejected(resp, uploaded):
+            # A cached asset is gone on LinkedIn's side: forget them all and upload afresh
+            await forget_assets(uploaded)
+            assets = await upload_all(reuse=False)
+            uploaded = [asset_urn for asset_urn, reused in assets]
+            payload = _image_post_payload(author_urn, params.text, uploaded, params.visibility)
             resp = await client.post(f"{settings.api_base}/ugcPosts", headers=headers, json=payload)
-            resp.raise_for_status()
-            
-            post_id = resp.json().get("id")
-            return f"✅ Post created successfully.\nID: {post_id}"
+        resp.raise_for_status()
+
+        return PostCreated(id=_created_id(resp), asset_urns=uploaded)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def _publish_text(client: httpx.AsyncClient, headers: dict, author: str, text: str, visibility: str) -> str:
+    """Create a text post and return its ID."""
+    payload = {
+        "author": author, 
+        "lifecycleState": "PUBLISHED",
+        "specificContent": {"com.linkedin.ugc.ShareContent": {
+            "shareCommentary": {"text": text}, 
+            "shareMediaCategory": "NONE"
+        }},
+        "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": visibility}
+    }
+    resp = await client.post(f"{settings.api_base}/ugcPosts", headers=headers, json=payload)
+    resp.raise_for_status()
+    return _created_id(resp)
+
+async def _delete(client: httpx.AsyncClient, headers: dict, post_urn: str) -> None:
+    # Ensure URN is URL encoded for the path
+    resp = await client.delete(f"{settings.api_base}/ugcPosts/{quote(post_urn)}", headers=headers)
+    if resp.status_code == 404:
+        raise NotFound(f"Post {post_urn} not found.", 404)
+    resp.raise_for_status()
+
+async def create_post(params: PostParams) -> PostCreated:
+    """Create a new text-based update on the user LinkedIn feed."""
+    return await _once("create_post", params, lambda: _create_post(params), PostCreated)
+
+async def _create_post(params: PostParams) -> PostCreated:
+    try:
+        headers = await get_headers()
+        client = get_client()
+        # 1. Resolve Author URN (cached per token)
+        author = await get_person_urn(headers)
+
+        # 2. Send Request
+        post_id = await _publish_text(client, headers, author, params.text, params.visibility)
+        return PostCreated(id=post_id)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def update_post(params: UpdatePostParams) -> str:
+async def _replace(client: httpx.AsyncClient, headers: dict, author: str, params: UpdatePostParams) -> Dict[str, Any]:
+    """Create the new post first, then delete the old one, so a failure never loses the post."""
+    new_id = await _publish_text(client, headers, author, params.text, params.visibility)
+    try:
+        await _delete(client, headers, params.post_urn)
+    except Exception as e:
+        return {"new_id": new_id, "old_deleted": False, "error": handle_api_error(e)}
+    return {"new_id": new_id, "old_deleted": True}
+
+async def update_post(params: UpdatePostParams) -> PostUpdated:
     """
-    Update a post by deleting the old one and creating a new one.
+    Update a post by creating a new one and then deleting the old one.
     (LinkedIn API does not support direct text edits).
     """
+    return await _once("update_post", params, lambda: _update_post(params), PostUpdated)
+
+async def _update_post(params: UpdatePostParams) -> PostUpdated:
     try:
-        # 1. Delete the old post
-        delete_result = await delete_post(params.post_urn)
-        
-        if "Error" in delete_result:
-            return f"Update Failed during deletion step: {delete_result}"
-            
-        # 2. Create the new post
-        create_params = PostParams(text=params.text, visibility=params.visibility)
-        create_result = await create_post(create_params)
-        
-        if "Error" in create_result:
-            return f"⚠️ Old post deleted, but creation failed: {create_result}"
-            
-        return f"✅ Post updated (Re-created).\nOld ID: {params.post_urn}\n{create_result}"
+        headers = await get_headers()
+        client = get_client()
+        author = await get_person_urn(headers)
+
+        outcome = await _replace(client, headers, author, params)
+        return PostUpdated(old_id=params.post_urn, **outcome)
 
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
+
+def _invalid_item(e: ValidationError) -> str:
+    problems = "; ".join(f"{'.'.join(map(str, err['loc'])) or 'item'}: {err['msg']}" for err in e.errors())
+    return f"Error: Invalid item ({problems})."
+
+def _update_batch(items: List[Dict[str, Any]]) -> Tuple[List[UpdatePostParams], Dict[str, str]]:
+    """
+    Validate each item on its own and drop repeated URNs, so one bad entry never fails the batch.
+    A URN listed twice with different text or visibility is rejected rather than posted twice.
+    """
+    valid: Dict[str, UpdatePostParams] = {}
+    errors: Dict[str, str] = {}
+    for index, item in enumerate(items):
+        try:
+            params = UpdatePostParams(**item)
+        except ValidationError as e:
+            urn = item.get("post_urn") if isinstance(item.get("post_urn"), str) else None
+            errors[urn or f"items[{index}]"] = _invalid_item(e)
+            continue
+        first = valid.get(params.post_urn)
+        if first is not None and (first.text, first.visibility) != (params.text, params.visibility):
+            errors[params.post_urn] = "Error: post_urn appears more than once with different text or visibility."
+        elif params.post_urn not in errors:
+            valid[params.post_urn] = params
+    return [params for urn, params in valid.items() if urn not in errors], errors
 
-async def delete_post(post_urn: str) -> str:
+async def update_posts(items: List[Dict[str, Any]]) -> BatchResult:
+    """
+    Re-create many posts with new text, with bounded concurrency (settings.batch_concurrency).
+    Returns {"results": {old urn: {"new_id", "old_deleted"}}, "errors": {old urn: message}};
+    a post whose old copy could not be deleted appears in both. Invalid items are reported
+    under their URN (or 'items[<index>]') without stopping the rest.
+    """
+    batch, invalid = _update_batch(items)
+    if not batch:
+        return BatchResult(errors=invalid)
+    try:
+        headers = await get_headers()
+        client = get_client()
+        author = await get_person_urn(headers)
+
+        async def run(params: UpdatePostParams) -> tuple:
+            try:
+                return params.post_urn, await _replace(client, headers, author, params), None
+            except Exception as e:
+                return params.post_urn, None, handle_api_error(e)
+
+        result = BatchResult(errors=invalid)
+        for urn, outcome, error in await gather_limited(batch, run, settings.batch_concurrency):
+            if outcome is not None:
+                error = outcome.pop("error", None)
+                result.results[urn] = outcome
+            if error is not None:
+                result.errors[urn] = error
+        return result
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def delete_post(post_urn: str) -> Deleted:
     """Delete a LinkedIn post by its URN."""
     try:
         headers = await get_headers()
-        # Ensure URN is URL encoded for the path
-        encoded_urn = quote(post_urn)
-        
-        async with httpx.AsyncClient() as client:
-            resp = await client.delete(f"{settings.api_base}/ugcPosts/{encoded_urn}", headers=headers)
-            
-            if resp.status_code == 404:
-                return f"Error: Post {post_urn} not found."
-                
-            resp.raise_for_status()
-            return f"✅ Post {post_urn} deleted successfully."
+        await _delete(get_client(), headers, post_urn)
+        return Deleted(urn=post_urn)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def get_recent_posts() -> str:
+async def delete_posts(post_urns: List[str]) -> BatchResult:
+    """
+    Delete many posts with bounded concurrency (settings.batch_concurrency).
+    Returns {"results": {urn: "deleted"}, "errors": {urn: message}}.
     """
-    List the user's recent posts. 
+    try:
+        headers = await get_headers()
+        client = get_client()
+
+        async def delete(urn: str) -> str:
+            await _delete(client, headers, urn)
+            return "deleted"
+
+        return BatchResult(**await batch_fetch(list(dict.fromkeys(post_urns)), delete))
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def get_recent_posts(start: int = 0, count: Optional[int] = None, max_items: Optional[int] = None) -> PostPage:
+    """
+    List the user's recent posts, following LinkedIn's paging.
+    `next_start` in the result is the cursor for the following call (null when exhausted).
     Note: Requires 'r_member_social' permission which is often restricted.
     """
     try:
         headers = await get_headers()
-        async with httpx.AsyncClient() as client:
-            # 1. Get Author URN
-            user_resp = await client.get(f"{settings.api_base}/userinfo", headers=headers)
-            user_resp.raise_for_status()
-            person_id = user_resp.json().get("sub")
-            author_urn = f"urn:li:person:{person_id}"
-            
-            # 2. Search
-            encoded_author = quote(author_urn)
-            url = f"{settings.api_base}/ugcPosts?q=authors&authors=List({encoded_author})"
+        # 1. Resolve Author URN (cached per token)
+        author_urn = await get_person_urn(headers)
             
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
+        # 2. Search
+        encoded_author = quote(author_urn)
+        url = f"{settings.api_base}/ugcPosts?q=authors&authors=List({encoded_author})"
             
-            data = resp.json()
-            posts = []
-            for item in data.get("elements", []):
+        pager = Pager(url, headers, start=start, count=count, max_items=max_items)
+        posts = []
+        async for page in pager.pages():
+            for item in page:
                 # Extract text
                 content = item.get("specificContent", {}).get("com.linkedin.ugc.ShareContent", {})
                 text = content.get("shareCommentary", {}).get("text", "")
-                
+                    
                 posts.append({
                     "id": item.get("id"),
                     "text": text,
@@ -227,72 +551,121 @@ async def get_recent_posts() -> str:
                     "visibility": item.get("visibility", {}).get("com.linkedin.ugc.MemberNetworkVisibility")
                 })
             
-            return json.dumps(posts, indent=2)
+        return PostPage(posts=posts, next_start=pager.next_start)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
 # --- Comment Implementation ---
 
-async def create_comment(params: CommentParams) -> str:
+async def create_comment(params: CommentParams) -> CommentCreated:
     """Create a comment on a share, UGC post, or article."""
+    return await _once("create_comment", params, lambda: _create_comment(params), CommentCreated)
+
+async def _create_comment(params: CommentParams) -> CommentCreated:
     try:
         headers = await get_headers()
-        async with httpx.AsyncClient() as client:
-            # 1. Get User ID
-            user_resp = await client.get(f"{settings.api_base}/userinfo", headers=headers)
-            user_resp.raise_for_status()
-            person_id = user_resp.json().get("sub")
-            actor_urn = f"urn:li:person:{person_id}"
+        client = get_client()
+        # 1. Resolve Author URN (cached per token)
+        actor_urn = await get_person_urn(headers)
             
-            # 2. Payload
-            # LinkedIn Social Actions API uses 'socialActions' endpoint
-            # Path: /socialActions/{objectUrn}/comments
-            encoded_object = quote(params.object_urn)
-            url = f"{settings.api_base}/socialActions/{encoded_object}/comments"
+        # 2. Payload
+        # LinkedIn Social Actions API uses 'socialActions' endpoint
+        # Path: /socialActions/{objectUrn}/comments
+        encoded_object = quote(params.object_urn)
+        url = f"{settings.api_base}/socialActions/{encoded_object}/comments"
             
-            payload = {
-                "actor": actor_urn,
-                "message": {
-                    "text": params.text
-                }
+        payload = {
+            "actor": actor_urn,
+            "message": {
+                "text": params.text
             }
+        }
             
-            resp = await client.post(url, headers=headers, json=payload)
-            resp.raise_for_status()
+        resp = await client.post(url, headers=headers, json=payload)
+        resp.raise_for_status()
             
-            comment_id = resp.json().get("id")
-            return f"✅ Comment created successfully.\nID: {comment_id}"
+        return CommentCreated(id=_created_id(resp))
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def get_post_comments(object_urn: str) -> str:
-    """Get comments for a specific post/share."""
+async def get_post_comments(
+    object_urn: str, start: int = 0, count: Optional[int] = None, max_items: Optional[int] = None
+) -> CommentPage:
+    """
+    Get comments for a specific post/share, following LinkedIn's paging.
+    `next_start` in the result is the cursor for the following call (null when exhausted).
+    """
     try:
         headers = await get_headers()
         encoded_object = quote(object_urn)
         url = f"{settings.api_base}/socialActions/{encoded_object}/comments"
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            
-            data = resp.json()
-            comments = []
-            for item in data.get("elements", []):
-                comments.append({
-                    "id": item.get("id"),
-                    "actor": item.get("actor"),
-                    "text": item.get("message", {}).get("text"),
-                    "created": item.get("created", {}).get("time")
-                })
-            return json.dumps(comments, indent=2)
+        pager = Pager(url, headers, start=start, count=count, max_items=max_items)
+        comments = []
+        async for page in pager.pages():
+            comments.extend(_comment_summary(item) for item in page)
+        return CommentPage(comments=comments, next_start=pager.next_start)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
+
+def _comment_summary(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": item.get("id"),
+        "actor": item.get("actor"),
+        "text": item.get("message", {}).get("text"),
+        "created": item.get("created", {}).get("time")
+    }
+
+_comment_syncs = SingleFlight()
+
+async def _sync_comments(headers: Dict[str, str], object_urn: str, max_items: Optional[int]) -> Dict[str, Any]:
+    store = await asyncio.to_thread(get_comment_store)
+    scope = token_scope(headers["Authorization"])
+    state = await asyncio.to_thread(store.state, scope, object_urn)
+    # Resume where the last sync stopped, re-reading a few comments in case earlier ones were deleted
+    start = max(0, state["cursor"] - settings.comment_sync_overlap) if state["synced_at"] else 0
+    url = f"{settings.api_base}/socialActions/{quote(object_urn)}/comments"
+
+    pager = Pager(url, headers, start=start, max_items=max_items)
+    fetched = []
+    async for page in pager.pages():
+        fetched.extend(_comment_summary(item) for item in page if item.get("id") is not None)
+    cursor = pager.next_start if pager.next_start is not None else start + len(fetched)
+
+    new = await asyncio.to_thread(store.save, scope, object_urn, fetched, cursor)
+    saved = await asyncio.to_thread(store.state, scope, object_urn)
+    return {
+        "new": new,
+        "new_count": len(new),
+        "stored": await asyncio.to_thread(store.count, scope, object_urn),
+        "high_water": saved["high_water"],
+        "more": pager.next_start is not None,
+    }
+
+async def sync_comments(object_urns: List[str], max_items: Optional[int] = None) -> BatchResult:
+    """
+    Bring the local comment store up to date for each post and return only the comments
+    that are new since the previous sync. Posts sync concurrently (settings.batch_concurrency).
+    Returns {"results": {urn: {"new", "new_count", "stored", "high_water", "more"}}, "errors": {urn: message}};
+    "more" means max_items stopped the sync early and the next call continues from there.
+    """
+    try:
+        headers = await get_headers()
+
+        async def sync(urn: str) -> Dict[str, Any]:
+            # One sync per post and token at a time, so two callers never store the same delta twice
+            key = (token_scope(headers["Authorization"]), urn, max_items)
+            return await _comment_syncs.do(key, lambda: _sync_comments(headers, urn, max_items))
+
+        return BatchResult(**await batch_fetch(list(dict.fromkeys(object_urns)), sync))
+
+    except Exception as e:
+        raise api_error(e) from e
 
-async def delete_comment(comment_urn: str, object_urn: str) -> str:
+async def delete_comment(comment_urn: str, object_urn: str) -> Deleted:
     """
     Delete a comment. 
     Note: Requires the parent object URN as well for the endpoint context in some versions, 
@@ -315,13 +688,13 @@ async def delete_comment(comment_urn: str, object_urn: str) -> str:
         
         url = f"{settings.api_base}/socialActions/{encoded_object}/comments/{encoded_comment_id}"
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.delete(url, headers=headers)
-            if resp.status_code == 404:
-                return "Error: Comment or Object not found."
-            resp.raise_for_status()
-            return "✅ Comment deleted successfully."
+        client = get_client()
+        resp = await client.delete(url, headers=headers)
+        if resp.status_code == 404:
+            raise NotFound("Comment or Object not found.", 404)
+        resp.raise_for_status()
+        return Deleted(urn=comment_urn)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
@@ -1,33 +1,29 @@
-import json
-import httpx
-from ..utils import get_headers, handle_api_error
-from ..config import settings
+from ..errors import api_error
+from ..results import Profile
+from ..utils import get_headers
+from ..identity import get_userinfo
 
-async def get_my_profile(params=None) -> str:
+async def get_my_profile(params=None) -> Profile:
     """
     Fetch the authenticated user's profile information.
     Uses OIDC UserInfo endpoint for reliable access to Name, Email, and Photo.
     """
     try:
         headers = await get_headers()
-        async with httpx.AsyncClient() as client:
-            # Use OpenID Connect userinfo endpoint
-            response = await client.get(f"{settings.api_base}/userinfo", headers=headers, timeout=30.0)
-            response.raise_for_status()
-            user_info = response.json()
+        # OpenID Connect userinfo, shared with the post tools' author lookup
+        user_info = await get_userinfo(headers)
             
-            # Map standard OIDC fields to a friendly format
-            profile = {
-                "id": user_info.get("sub"),
-                "name": user_info.get("name"),
-                "given_name": user_info.get("given_name"),
-                "family_name": user_info.get("family_name"),
-                "email": user_info.get("email"),
-                "email_verified": user_info.get("email_verified"),
-                "picture": user_info.get("picture"),
-                "locale": user_info.get("locale")
-            }
-            return json.dumps(profile, indent=2)
+        # Map standard OIDC fields to a friendly format
+        return Profile(
+            id=user_info.get("sub"),
+            name=user_info.get("name"),
+            given_name=user_info.get("given_name"),
+            family_name=user_info.get("family_name"),
+            email=user_info.get("email"),
+            email_verified=user_info.get("email_verified"),
+            picture=user_info.get("picture"),
+            locale=user_info.get("locale")
+        )
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
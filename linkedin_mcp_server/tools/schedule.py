@@ -0,0 +1,107 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from pydantic import BaseModel, Field
+from ..config import settings
+from ..errors import InvalidRequest, NotFound, api_error
+from ..idempotency import idempotent
+from ..results import ScheduledPost, ScheduledPosts, ScheduleReceipt
+from ..scheduler import get_queue, scheduler
+
+# --- Models ---
+
+class SchedulePostParams(BaseModel):
+    text: str = Field(..., description="The commentary/text content of the post.")
+    publish_at: Optional[str] = Field(default=None, description="ISO 8601 publish time (naive times are UTC). Omit to publish as soon as possible.")
+    image_source: Optional[str] = Field(default=None, description="Optional local file path or public URL of an image.")
+    visibility: str = Field(default="PUBLIC", description="Post visibility: PUBLIC or CONNECTIONS.")
+    idempotency_key: Optional[str] = Field(default=None, description="Repeat calls with this key return the first schedule ID.")
+
+def _parse_time(value: Optional[str]) -> float:
+    if not value:
+        return time.time()
+    moment = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+# The queue is published with the process-wide token, so it can't serve several tenants
+MULTI_TENANT_ERROR = "Scheduled posts are not available when the server runs in multi-tenant mode."
+
+# --- Implementation ---
+
+async def schedule_post(params: SchedulePostParams) -> ScheduleReceipt:
+    """Queue a text or image post for publishing at `publish_at`."""
+    if settings.multi_tenant:
+        raise InvalidRequest(MULTI_TENANT_ERROR)
+    try:
+        publish_at = _parse_time(params.publish_at)
+    except ValueError as e:
+        raise InvalidRequest(f"Invalid publish_at ({str(e)}). Use ISO 8601, e.g. 2025-01-31T09:00:00Z.") from e
+    # Single-tenant only, so the queue's keys need no per-member owner
+    return await idempotent(
+        params.idempotency_key, "schedule", "schedule_post", params.model_dump(exclude={"idempotency_key"}),
+        lambda: _enqueue(params, publish_at), ScheduleReceipt,
+    )
+
+async def _enqueue(params: SchedulePostParams, publish_at: float) -> ScheduleReceipt:
+    try:
+        if params.image_source:
+            kind = "image"
+            payload = {"text": params.text, "image_source": params.image_source, "visibility": params.visibility}
+        else:
+            kind = "text"
+            payload = {"text": params.text, "visibility": params.visibility}
+
+        queue = await asyncio.to_thread(get_queue)
+        schedule_id = await asyncio.to_thread(queue.add, kind, payload, publish_at)
+        scheduler.notify()
+
+        warning = None if scheduler.running else "The publishing workers only run inside the MCP server process."
+        return ScheduleReceipt(schedule_id=schedule_id, status="pending", publish_at=_iso(publish_at), warning=warning)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def list_scheduled_posts(status: Optional[str] = None, limit: int = 100) -> ScheduledPosts:
+    """List queued posts, optionally filtered by status (pending, running, published, failed, cancelled)."""
+    if settings.multi_tenant:
+        raise InvalidRequest(MULTI_TENANT_ERROR)
+    try:
+        queue = await asyncio.to_thread(get_queue)
+        items = await asyncio.to_thread(queue.list, status, limit)
+        posts = []
+        for item in items:
+            posts.append(ScheduledPost(
+                schedule_id=item["id"],
+                status=item["status"],
+                publish_at=_iso(item["publish_at"]),
+                kind=item["kind"],
+                text=item["payload"].get("text"),
+                image_source=item["payload"].get("image_source"),
+                visibility=item["payload"].get("visibility"),
+                result=item["result"],
+            ))
+        return ScheduledPosts(posts=posts)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def cancel_scheduled_post(schedule_id: int) -> ScheduleReceipt:
+    """Cancel a queued post that has not started publishing."""
+    if settings.multi_tenant:
+        raise InvalidRequest(MULTI_TENANT_ERROR)
+    try:
+        queue = await asyncio.to_thread(get_queue)
+        cancelled = await asyncio.to_thread(queue.cancel, schedule_id)
+    except Exception as e:
+        raise api_error(e) from e
+    if not cancelled:
+        raise NotFound(f"Scheduled post {schedule_id} not found or no longer pending.")
+    return ScheduleReceipt(schedule_id=schedule_id, status="cancelled")
@@ -1,41 +1,67 @@
-import json
-import httpx
-from ..utils import get_headers, handle_api_error
+from typing import Any, Dict, List, Optional
+from fastmcp.tools.tool import ToolResult
+from ..errors import api_error
+from ..utils import get_headers, batch_fetch, project, project_results, tool_result
+from ..cache import cached_get_json
+from ..search_index import indexed_search
 from ..config import settings
 from urllib.parse import quote
 
-async def search_people(keywords: str) -> str:
+async def search_people(
+    keywords: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    local_only: bool = False,
+    max_age: Optional[float] = None,
+) -> ToolResult:
     """
     Search for people on LinkedIn by keywords.
     Note: Requires specific LinkedIn API permissions (e.g., r_basicprofile).
+    `local_only`/`max_age` answer from the local search index (see search_index.indexed_search).
     """
     try:
         headers = await get_headers()
         # V2 people search is often restricted, but this is the standard endpoint
         url = f"{settings.api_base}/peopleSearch?q=keywords&keywords={quote(keywords)}"
         
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        data = await indexed_search("person", url, headers, "peopleSearch", keywords, local_only, max_age)
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
 
-async def get_member_profile(member_urn: str) -> str:
+async def get_member_profile(
+    member_urn: str, fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
     """
     Fetch a specific member's profile by their URN.
     Requires permission to view the member's profile.
     """
     try:
         headers = await get_headers()
-        encoded_urn = quote(member_urn)
-        url = f"{settings.api_base}/people/{encoded_urn}"
-        
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers)
-            resp.raise_for_status()
-            return json.dumps(resp.json(), indent=2)
+        data = await _fetch_member(headers, member_urn)
+        return tool_result(project(data, fields), compact)
             
     except Exception as e:
-        return handle_api_error(e)
+        raise api_error(e) from e
+
+async def get_member_profiles(
+    member_urns: List[str], fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> ToolResult:
+    """
+    Fetch several members' profiles at once, with bounded concurrency.
+    Returns one map of results and per-URN errors.
+    """
+    try:
+        headers = await get_headers()
+        urns = list(dict.fromkeys(member_urns))
+        result = await batch_fetch(urns, lambda urn: _fetch_member(headers, urn))
+        return tool_result(project_results(result, fields), compact)
+
+    except Exception as e:
+        raise api_error(e) from e
+
+async def _fetch_member(headers: Dict[str, str], member_urn: str) -> Any:
+    encoded_urn = quote(member_urn)
+    url = f"{settings.api_base}/people/{encoded_urn}"
+    return await cached_get_json(url, headers, "people")
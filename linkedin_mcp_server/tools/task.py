@@ -0,0 +1,58 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from ..config import settings
+from ..errors import InvalidRequest, NotFound, Unavailable
+from ..results import TaskCancelled, TaskList, TaskProgress, TaskStarted, TaskStatus
+from ..tasks import FINISHED, task_manager
+from ..tenants import current_tenant
+from .schedule import _iso
+
+def _owner() -> Optional[str]:
+    """Tasks belong to the calling tenant (None with a single process-wide token)."""
+    tenant = current_tenant()
+    return tenant.id if tenant is not None else None
+
+def _status(snapshot: Dict[str, Any]) -> TaskStatus:
+    return TaskStatus(
+        task_id=snapshot["task_id"],
+        tool=snapshot["tool"],
+        status=snapshot["status"],
+        progress=TaskProgress(**snapshot["progress"]),
+        result=snapshot["result"],
+        error=snapshot.get("error"),
+        created_at=_iso(snapshot["created_at"]),
+        started_at=_iso(snapshot["started_at"]),
+        finished_at=_iso(snapshot["finished_at"]),
+    )
+
+async def _snapshot(task_id: str) -> Dict[str, Any]:
+    snapshot = await task_manager.get(task_id)
+    if snapshot is None or snapshot["owner"] != _owner():
+        raise NotFound(f"Task {task_id} not found.")
+    return snapshot
+
+# --- Implementation ---
+
+async def start_task(tool: str, fn: Callable[[], Awaitable[Any]]) -> TaskStarted:
+    """Run a tool call in the background and return its task ID straight away."""
+    task = task_manager.submit(tool, fn, _owner())
+    if task is None:
+        raise Unavailable(f"Too many background tasks ({settings.task_max_active} unfinished). Try again later.")
+    return TaskStarted(task_id=task.id)
+
+async def get_task_status(task_id: str) -> TaskStatus:
+    """Status, progress and (once finished) result or error of a background task."""
+    return _status(await _snapshot(task_id))
+
+async def list_tasks(status: Optional[str] = None) -> TaskList:
+    """This server process's background tasks, newest first, optionally filtered by status."""
+    return TaskList(tasks=[_status(snapshot) for snapshot in task_manager.list(_owner(), status)])
+
+async def cancel_task(task_id: str) -> TaskCancelled:
+    """Cancel a background task that hasn't finished."""
+    snapshot = await _snapshot(task_id)
+    if snapshot["status"] in FINISHED:
+        raise InvalidRequest(f"Task {task_id} already {snapshot['status']}.")
+    outcome = await task_manager.cancel(task_id)
+    if outcome is None:
+        raise InvalidRequest(f"Task {task_id} could not be cancelled.")
+    return TaskCancelled(task_id=task_id, status=outcome)
@@ -1,43 +1,109 @@
-import httpx
-import os
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+import asyncio
+import json
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Iterable, TypeVar
+from fastmcp.tools.tool import ToolResult
+from pydantic import BaseModel
 from .config import settings
+from .errors import api_error
+from .tenants import tenant_headers
+from .tokens import token_store
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar("T")
 
 async def get_headers() -> Dict[str, str]:
-    """Retrieve and format headers for LinkedIn API requests."""
-    token = settings.linkedin_access_token
-    # Reload .env if token is missing (in case it was just updated)
-    if not token:
-        load_dotenv()
-        token = os.getenv("LINKEDIN_ACCESS_TOKEN")
-    
-    if not token:
-        raise ValueError("LinkedIn Access Token missing. Please use the auth tools to login first.")
-        
-    return {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-        "X-Restli-Protocol-Version": "2.0.0"
-    }
+    """Retrieve and format headers for LinkedIn API requests (served from memory)."""
+    if settings.multi_tenant:
+        return tenant_headers()
+    return await token_store.get_headers()
 
 def handle_api_error(e: Exception) -> str:
-    """Standardized error handling for API calls."""
-    if isinstance(e, httpx.HTTPStatusError):
-        status = e.response.status_code
+    """Message for one failed item of a batch tool (whole-call failures raise errors.api_error instead)."""
+    return f"Error: {api_error(e)}"
+
+async def gather_limited(items: Iterable[Any], fn: Callable[[Any], Awaitable[T]], limit: int) -> List[T]:
+    """Run `fn` over `items` with at most `limit` calls in flight, preserving order."""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(item: Any) -> T:
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+async def batch_fetch(urns: List[str], fetch: Callable[[str], Awaitable[Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch every URN with bounded concurrency (settings.batch_concurrency).
+    Returns {"results": {urn: document}, "errors": {urn: message}}.
+    """
+    async def run(urn: str) -> tuple:
         try:
-            error_details = e.response.json()
-            message = error_details.get("message", e.response.text)
-        except:
-            message = e.response.text
-            
-        if status == 401:
-            return "Error: Unauthorized (401). Your access token might be invalid or expired. Please re-authenticate."
-        if status == 403:
-            return f"Error: Forbidden (403). You lack permissions for this action. Message: {message}"
-        if status == 429:
-            return "Error: Rate limit exceeded. Please wait a moment."
-            
-        return f"Error: API request failed ({status}): {message}"
-        
-    return f"Error: {str(e)}"
+            return urn, await fetch(urn), None
+        except Exception as e:
+            return urn, None, handle_api_error(e)
+
+    outcomes = await gather_limited(urns, run, settings.batch_concurrency)
+    return {
+        "results": {urn: doc for urn, doc, error in outcomes if error is None},
+        "errors": {urn: error for urn, doc, error in outcomes if error is not None},
+    }
+
+def _field_tree(fields: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        for part in path.strip().split("."):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+def _project(data: Any, tree: Dict[str, Any]) -> Any:
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [_project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: _project(data[key], sub) for key, sub in tree.items() if key in data}
+    return data
+
+def project(data: Any, fields: Optional[List[str]]) -> Any:
+    """
+    Keep only the requested dotted paths (e.g. ['name', 'locations.address.city']).
+    Lists are projected element by element, so 'elements.title' keeps every element's title.
+    """
+    if not fields:
+        return data
+    return _project(data, _field_tree(fields))
+
+def project_results(result: Dict[str, Dict[str, Any]], fields: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Apply `project` to each document of a batch {results, errors} map."""
+    if fields:
+        result["results"] = {urn: project(doc, fields) for urn, doc in result["results"].items()}
+    return result
+
+def dump_json(data: Any, compact: Optional[bool] = None) -> str:
+    """
+    Serialize a tool result. Compact mode (default: settings.compact_json) drops
+    indentation and uses orjson when it is installed.
+    """
+    if compact is None:
+        compact = settings.compact_json
+    if not compact:
+        return json.dumps(data, indent=2)
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+def tool_result(data: Any, compact: Optional[bool] = None) -> ToolResult:
+    """
+    Structured tool output (MCP structuredContent) plus the same data as JSON text for
+    clients that only read text. The text is compact by default, so the second copy adds
+    as little as possible; `compact=False` indents it.
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+    return ToolResult(content=dump_json(data, compact), structured_content=data)
@@ -0,0 +1,112 @@
+import asyncio
+from collections import OrderedDict
+from typing import Callable, List, Optional
+import httpx
+import pytest
+from benchmarks.mock_api import MockOptions, create_app
+from linkedin_mcp_server import assets, backends, client, comment_store, idempotency, scheduler, search_index
+from linkedin_mcp_server.cache import response_cache
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.identity import identity_cache
+from linkedin_mcp_server.ratelimit import rate_limiter
+from linkedin_mcp_server.resilience import circuit_breakers
+from linkedin_mcp_server.singleflight import SingleFlight
+from linkedin_mcp_server.tasks import task_manager
+from linkedin_mcp_server.tokens import token_store
+
+API_BASE = "http://linkedin.test/v2"
+
+class Hold:
+    """Gate for matching requests: `arrived` is set when one reaches it, `release` lets them through."""
+
+    def __init__(self) -> None:
+        self.arrived = asyncio.Event()
+        self.release = asyncio.Event()
+
+class MockAPI(httpx.AsyncBaseTransport):
+    """
+    Sends requests to the stand-in API in benchmarks/mock_api.py in process, recording
+    those it handled. `fail(...)` makes matching requests raise instead, either before
+    they are sent or, with sent=True, after the mock API has handled them (a lost response).
+    `hold(...)` keeps matching requests waiting, unsent, until the hold is released.
+    """
+
+    def __init__(self, options: Optional[MockOptions] = None) -> None:
+        self._app = httpx.ASGITransport(app=create_app(options or MockOptions()))
+        self.received: List[httpx.Request] = []
+        self._faults: List[tuple] = []
+        self._holds: List[tuple] = []
+
+    def fail(self, method: str, path: str, error: Callable[[httpx.Request], Exception], sent: bool = False, times: int = 1) -> None:
+        self._faults.append([method, path, error, sent, times])
+
+    def hold(self, method: str, path: str) -> Hold:
+        hold = Hold()
+        self._holds.append((method, path, hold))
+        return hold
+
+    def count(self, method: str, path: str) -> int:
+        return sum(1 for r in self.received if r.method == method and r.url.path.endswith(path))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for method, path, hold in self._holds:
+            if request.method == method and request.url.path.endswith(path):
+                hold.arrived.set()
+                await hold.release.wait()
+        for fault in self._faults:
+            method, path, error, sent, times = fault
+            if times and request.method == method and request.url.path.endswith(path):
+                fault[4] -= 1
+                if sent:
+                    await self._forward(request)
+                raise error(request)
+        return await self._forward(request)
+
+    async def _forward(self, request: httpx.Request) -> httpx.Response:
+        response = await self._app.handle_async_request(request)
+        self.received.append(request)
+        return response
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """Keep every test's settings, databases and caches to itself."""
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "api_base", API_BASE)
+    monkeypatch.setattr(settings, "linkedin_access_token", "test-token")
+    monkeypatch.setattr(settings, "token_env_path", str(tmp_path / ".env"))
+    monkeypatch.setattr(settings, "state_backend", "memory")
+    monkeypatch.setattr(settings, "multi_tenant", False)
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    monkeypatch.setattr(settings, "retry_backoff_base", 0.01)
+    for name in ("idempotency_db_path", "schedule_db_path", "comment_store_db_path", "search_index_db_path", "asset_cache_db_path"):
+        monkeypatch.setattr(settings, name, None)
+    monkeypatch.setattr(assets.get_asset_cache, "_instance", None)
+    monkeypatch.setattr(idempotency.get_idempotency_store, "_instance", None)
+    monkeypatch.setattr(scheduler.get_queue, "_instance", None)
+    monkeypatch.setattr(comment_store.get_comment_store, "_instance", None)
+    monkeypatch.setattr(search_index.get_search_index, "_instance", None)
+    monkeypatch.setattr(token_store, "_loaded", False)
+    monkeypatch.setattr(token_store, "_headers", None)
+    monkeypatch.setattr(token_store, "_background", None)
+    monkeypatch.setattr(circuit_breakers, "_breakers", {})
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(response_cache, "_entries", OrderedDict())
+    monkeypatch.setattr(response_cache, "upstream", SingleFlight())
+    for counter in ("hits", "misses", "revalidations", "evictions"):
+        monkeypatch.setattr(response_cache, counter, 0)
+    monkeypatch.setattr(backends, "_backend", None)
+    monkeypatch.setattr(backends, "_loaded", False)
+    monkeypatch.setattr(task_manager, "_tasks", {})
+    monkeypatch.setattr(task_manager, "_slots", None)
+    identity_cache.invalidate()
+
+@pytest.fixture
+async def mock_api():
+    """Route the shared HTTP client to the mock API; yields the recording transport."""
+    transport = MockAPI()
+    client._client = httpx.AsyncClient(transport=client._wrap_transport(transport))
+    try:
+        yield transport
+    finally:
+        await client.close_client()
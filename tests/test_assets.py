@@ -0,0 +1,51 @@
+import asyncio
+from linkedin_mcp_server.assets import get_asset_cache
+from linkedin_mcp_server.client import get_client
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.tools.post import _asset_uploads, upload_image
+
+PERSON = "urn:li:person:me"
+HEADERS = {"Authorization": "Bearer test-token"}
+
+def image_url(name: str) -> str:
+    return f"{settings.api_base.rsplit('/v2', 1)[0]}/images/{name}"
+
+async def uploads_settled() -> None:
+    while _asset_uploads.in_flight():
+        await asyncio.sleep(0.01)
+
+async def test_identical_image_is_uploaded_once(mock_api, tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image bytes" * 1000)
+
+    first = await upload_image(get_client(), HEADERS, PERSON, str(path))
+    second = await upload_image(get_client(), HEADERS, PERSON, str(path))
+
+    assert first == second
+    assert mock_api.count("POST", "/assets") == 1
+    assert get_asset_cache().stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+async def test_concurrent_callers_share_one_upload(mock_api):
+    hold = mock_api.hold("PUT", "/upload/1")
+    joined = _asset_uploads.coalesced
+    callers = asyncio.gather(*(upload_image(get_client(), HEADERS, PERSON, image_url("a.png")) for _ in range(3)))
+    await hold.arrived.wait()
+    while _asset_uploads.coalesced < joined + 2:
+        await asyncio.sleep(0.01)
+    hold.release.set()
+
+    assert len(set(await callers)) == 1
+    assert mock_api.count("PUT", "/upload/1") == 1
+
+async def test_upload_outlives_a_cancelled_caller(mock_api):
+    hold = mock_api.hold("PUT", "/upload/1")
+    caller = asyncio.create_task(upload_image(get_client(), HEADERS, PERSON, image_url("a.png")))
+    await hold.arrived.wait()
+    caller.cancel()
+    hold.release.set()
+    await uploads_settled()
+
+    # The spooled download was still readable, so the upload finished and was cached
+    assert mock_api.count("PUT", "/upload/1") == 1
+    assert await upload_image(get_client(), HEADERS, PERSON, image_url("a.png")) == "urn:li:digitalmediaAsset:1"
+    assert mock_api.count("POST", "/assets") == 1
@@ -0,0 +1,51 @@
+import httpx
+from linkedin_mcp_server.tools.post import delete_posts, update_posts
+
+OLD = "urn:li:share:old"
+
+def timeout(request: httpx.Request) -> Exception:
+    return httpx.ReadTimeout("timed out", request=request)
+
+async def test_update_creates_the_new_post_before_deleting_the_old(mock_api):
+    result = await update_posts([{"post_urn": OLD, "text": "New text"}])
+
+    assert result.results == {OLD: {"new_id": "urn:li:share:1", "old_deleted": True}}
+    assert [(r.method, r.url.path) for r in mock_api.received if "ugcPosts" in r.url.path] == [
+        ("POST", "/v2/ugcPosts"), ("DELETE", f"/v2/ugcPosts/{OLD}"),
+    ]
+
+async def test_failed_delete_keeps_the_new_post(mock_api):
+    mock_api.fail("DELETE", f"/ugcPosts/{OLD}", timeout, times=10)
+    result = await update_posts([{"post_urn": OLD, "text": "New text"}])
+
+    assert result.results == {OLD: {"new_id": "urn:li:share:1", "old_deleted": False}}
+    assert OLD in result.errors
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_failed_create_leaves_the_old_post(mock_api):
+    mock_api.fail("POST", "/ugcPosts", lambda r: httpx.ConnectError("refused", request=r))
+    result = await update_posts([{"post_urn": OLD, "text": "New text"}])
+
+    assert result.results == {}
+    assert OLD in result.errors
+    assert mock_api.count("DELETE", f"/ugcPosts/{OLD}") == 0
+
+async def test_repeated_urns_are_updated_once(mock_api):
+    result = await update_posts([
+        {"post_urn": OLD, "text": "New text"},
+        {"post_urn": OLD, "text": "New text"},
+        {"post_urn": "urn:li:share:other", "text": "A"},
+        {"post_urn": "urn:li:share:other", "text": "B"},
+        {"text": "no urn"},
+    ])
+
+    assert list(result.results) == [OLD]
+    assert set(result.errors) == {"urn:li:share:other", "items[4]"}
+    assert mock_api.count("POST", "/ugcPosts") == 1
+    assert mock_api.count("DELETE", "/ugcPosts/urn:li:share:other") == 0
+
+async def test_repeated_urns_are_deleted_once(mock_api):
+    result = await delete_posts([OLD, OLD, "urn:li:share:2"])
+
+    assert result.results == {OLD: "deleted", "urn:li:share:2": "deleted"}
+    assert mock_api.count("DELETE", f"/ugcPosts/{OLD}") == 1
@@ -0,0 +1,67 @@
+import pytest
+from linkedin_mcp_server.cache import CacheEntry, ResponseCache, cached_get_json, response_cache
+from linkedin_mcp_server.config import settings
+
+HEADERS = {"Authorization": "Bearer test-token"}
+COMPANY = f"{settings.api_base}/organizations/urn%3Ali%3Aorganization%3A1"
+JOB = f"{settings.api_base}/jobs/urn%3Ali%3Ajob%3A1"
+
+@pytest.fixture
+def cached(monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(settings, "cache_ttls", {"organizations": 300.0, "jobs": 300.0})
+
+async def test_fresh_entry_is_served_from_memory(mock_api, cached):
+    first = await cached_get_json(JOB, HEADERS, "jobs")
+    second = await cached_get_json(JOB, HEADERS, "jobs")
+
+    assert second == first
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 1
+    assert (response_cache.hits, response_cache.misses) == (1, 1)
+
+async def test_expired_entry_is_fetched_again(mock_api, cached, monkeypatch):
+    monkeypatch.setattr(settings, "cache_ttls", {"jobs": 0.0})
+    await cached_get_json(JOB, HEADERS, "jobs")
+    await cached_get_json(JOB, HEADERS, "jobs")
+
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 2
+    assert response_cache.misses == 2
+
+async def test_expired_entry_with_etag_is_revalidated(mock_api, cached, monkeypatch):
+    monkeypatch.setattr(settings, "cache_ttls", {"organizations": 0.0})
+    first = await cached_get_json(COMPANY, HEADERS, "organizations")
+    second = await cached_get_json(COMPANY, HEADERS, "organizations")
+
+    assert second == first
+    revalidation = mock_api.received[-1]
+    assert revalidation.headers["If-None-Match"] == '"org-urn:li:organization:1"'
+    assert response_cache.revalidations == 1
+    assert response_cache.hits == 1
+
+async def test_entries_are_kept_per_token(mock_api, cached):
+    other = {"Authorization": "Bearer other-token"}
+    await cached_get_json(JOB, HEADERS, "jobs")
+    await cached_get_json(JOB, other, "jobs")
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 2
+
+    response_cache.invalidate(other["Authorization"])
+    await cached_get_json(JOB, HEADERS, "jobs")
+    await cached_get_json(JOB, other, "jobs")
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 3
+
+async def test_disabled_cache_always_fetches(mock_api):
+    await cached_get_json(JOB, HEADERS, "jobs")
+    await cached_get_json(JOB, HEADERS, "jobs")
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 2
+    assert response_cache.stats()["entries"] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    for url in ("a", "b"):
+        cache.put(("token", url), CacheEntry(data=url, etag=None, expires_at=0.0))
+    cache.get(("token", "a"))
+    cache.put(("token", "c"), CacheEntry(data="c", etag=None, expires_at=0.0))
+
+    assert cache.get(("token", "b")) is None
+    assert cache.get(("token", "a")).data == "a"
+    assert cache.stats()["evictions"] == 1
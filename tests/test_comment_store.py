@@ -0,0 +1,57 @@
+import sqlite3
+from linkedin_mcp_server.comment_store import CommentStore
+from linkedin_mcp_server.tools import post
+
+POST = "urn:li:share:1"
+
+def comment(i, created):
+    return {"id": str(i), "actor": "urn:li:person:a", "text": f"Comment {i}", "created": created}
+
+def test_comment_store_returns_only_new_comments(tmp_path):
+    store = CommentStore(str(tmp_path / "comments.db"))
+    assert store.state("s", POST) == {"cursor": 0, "high_water": None, "synced_at": None}
+
+    first = store.save("s", POST, [comment(2, 200), comment(1, 100)], cursor=2)
+    assert [c["id"] for c in first] == ["1", "2"]
+    assert store.state("s", POST)["high_water"] == 200
+
+    # Re-read overlap: seen comments are skipped, an unseen one at the mark is new
+    second = store.save("s", POST, [comment(1, 100), comment(2, 200), comment(3, 200), comment(4, 300)], cursor=4)
+    assert [c["id"] for c in second] == ["3", "4"]
+    assert store.count("s", POST) == 4
+    assert store.state("s", POST)["cursor"] == 4
+
+def test_comment_store_keeps_scopes_apart(tmp_path):
+    store = CommentStore(str(tmp_path / "comments.db"))
+    store.save("token-a", POST, [comment(1, 100)], cursor=1)
+
+    assert store.state("token-b", POST)["synced_at"] is None
+    assert len(store.save("token-b", POST, [comment(1, 100)], cursor=1)) == 1
+    assert store.count("token-a", POST) == 1
+    assert store.count("token-b", POST) == 1
+
+def test_comment_store_from_before_scopes_starts_over(tmp_path):
+    path = str(tmp_path / "comments.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE comments (object_urn TEXT, id TEXT, actor TEXT, text TEXT, created INTEGER, "
+        "PRIMARY KEY (object_urn, id));"
+        "CREATE TABLE comment_sync (object_urn TEXT PRIMARY KEY, cursor INTEGER, high_water INTEGER, synced_at REAL);"
+        f"INSERT INTO comment_sync VALUES ('{POST}', 5, 500, 0);"
+    )
+    conn.close()
+
+    store = CommentStore(path)
+    assert store.state("s", POST)["synced_at"] is None
+    assert len(store.save("s", POST, [comment(1, 100)], cursor=1)) == 1
+
+async def test_sync_comments_returns_deltas(mock_api):
+    first = await post.sync_comments([POST])
+    assert first.results[POST]["new_count"] == 120
+    assert not first.results[POST]["more"]
+
+    second = await post.sync_comments([POST])
+    assert second.results[POST]["new_count"] == 0
+    assert second.results[POST]["stored"] == 120
+    # The second sync only re-read the overlap, not the whole collection
+    assert mock_api.count("GET", "/comments") == 4
@@ -0,0 +1,58 @@
+import httpx
+import pytest
+from linkedin_mcp_server import client
+from linkedin_mcp_server.cache import CacheEntry, response_cache
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.errors import (
+    ApiError, Forbidden, InvalidRequest, LinkedInError, NotFound, RateLimited, Unauthorized, Unavailable, api_error,
+)
+
+def status_error(status: int, **kwargs) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", f"{settings.api_base}/me", headers={"Authorization": "Bearer test-token"})
+    response = httpx.Response(status, request=request, **kwargs)
+    return httpx.HTTPStatusError("failed", request=request, response=response)
+
+@pytest.mark.parametrize("status, error_type", [
+    (401, Unauthorized), (403, Forbidden), (404, NotFound), (429, RateLimited), (500, ApiError), (503, ApiError),
+])
+def test_status_codes_map_to_typed_errors(status, error_type):
+    error = api_error(status_error(status, json={"message": "nope"}))
+    assert type(error) is error_type
+    assert error.status == status
+
+def test_mapping_keeps_the_linkedin_message_and_retry_after():
+    assert "Member is restricted" in str(api_error(status_error(403, json={"message": "Member is restricted"})))
+    assert "plain text" in str(api_error(status_error(404, text="plain text")))
+    assert api_error(status_error(429, headers={"Retry-After": "30"})).retry_after == 30.0
+
+def test_other_failures_map_by_kind():
+    request = httpx.Request("GET", f"{settings.api_base}/me")
+    assert isinstance(api_error(httpx.ConnectError("refused", request=request)), Unavailable)
+    assert isinstance(api_error(ValueError("Token missing")), InvalidRequest)
+    assert isinstance(api_error(FileNotFoundError("image.png")), InvalidRequest)
+    assert type(api_error(RuntimeError("odd"))) is LinkedInError
+    original = NotFound("gone", 404)
+    assert api_error(original) is original
+
+def test_mapping_a_401_changes_nothing():
+    key = ("Bearer test-token", f"{settings.api_base}/me")
+    response_cache.put(key, CacheEntry(data={}, etag=None, expires_at=0.0))
+    api_error(status_error(401))
+    assert response_cache.get(key) is not None
+
+async def test_rejected_token_is_forgotten_by_the_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401 if request.headers["Authorization"] == "Bearer old-token" else 200, json={})
+
+    rejected = ("Bearer old-token", f"{settings.api_base}/jobs/1")
+    valid = ("Bearer test-token", f"{settings.api_base}/jobs/1")
+    for key in (rejected, valid):
+        response_cache.put(key, CacheEntry(data={}, etag=None, expires_at=0.0))
+
+    async with httpx.AsyncClient(transport=client._wrap_transport(httpx.MockTransport(handler))) as http:
+        await http.get(f"{settings.api_base}/me", headers={"Authorization": "Bearer test-token"})
+        assert response_cache.get(rejected) is not None
+        await http.get(f"{settings.api_base}/me", headers={"Authorization": "Bearer old-token"})
+
+    assert response_cache.get(rejected) is None
+    assert response_cache.get(valid) is not None
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import time
+import httpx
+import pytest
+from pydantic import ValidationError
+from linkedin_mcp_server import client
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.errors import ApiError, Conflict, InvalidRequest, NotFound, Unavailable, api_error
+from linkedin_mcp_server.idempotency import IdempotencyStore, never_sent
+from linkedin_mcp_server.resilience import CircuitOpenError
+from linkedin_mcp_server.tools import post
+
+def read_timeout(request):
+    return httpx.ReadTimeout("timed out", request=request)
+
+def connect_error(request):
+    return httpx.ConnectError("connection refused", request=request)
+
+async def test_repeated_key_replays_first_result(mock_api):
+    params = post.PostParams(text="Hello", idempotency_key="k1")
+    first = await post.create_post(params)
+    second = await post.create_post(params)
+
+    assert not first.replayed
+    assert second.replayed
+    assert second.id == first.id
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_concurrent_calls_with_one_key_publish_once(mock_api):
+    params = post.PostParams(text="Hello", idempotency_key="k1")
+    results = await asyncio.gather(*(post.create_post(params) for _ in range(3)))
+
+    assert len({r.id for r in results}) == 1
+    assert sum(not r.replayed for r in results) == 1
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_key_reused_with_other_arguments_is_rejected(mock_api):
+    await post.create_post(post.PostParams(text="Hello", idempotency_key="k1"))
+    with pytest.raises(InvalidRequest):
+        await post.create_post(post.PostParams(text="Goodbye", idempotency_key="k1"))
+
+async def test_timeout_then_retry_conflicts_without_second_post(mock_api):
+    # The post reaches LinkedIn but the response is lost
+    mock_api.fail("POST", "/ugcPosts", read_timeout, sent=True)
+    params = post.PostParams(text="Hello", idempotency_key="k1")
+
+    with pytest.raises(Unavailable):
+        await post.create_post(params)
+    with pytest.raises(Conflict):
+        await post.create_post(params)
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_failure_before_sending_releases_the_key(mock_api):
+    mock_api.fail("POST", "/ugcPosts", connect_error)
+    params = post.PostParams(text="Hello", idempotency_key="k1")
+
+    with pytest.raises(Unavailable):
+        await post.create_post(params)
+    created = await post.create_post(params)
+    assert not created.replayed
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_rejected_write_releases_the_key(mock_api, monkeypatch):
+    calls = []
+
+    async def rejected(params):
+        calls.append(params)
+        if len(calls) == 1:
+            raise NotFound("Not found (404): no such member", 404)
+        return post.PostCreated(id="urn:li:share:1")
+
+    monkeypatch.setattr(post, "_create_post", rejected)
+    params = post.PostParams(text="Hello", idempotency_key="k1")
+    with pytest.raises(NotFound):
+        await post.create_post(params)
+    assert (await post.create_post(params)).id == "urn:li:share:1"
+    assert len(calls) == 2
+
+async def test_unreadable_created_response_is_not_posted_again():
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/userinfo"):
+            return httpx.Response(200, json={"sub": "me"})
+        posts.append(request)
+        # Created, but neither an X-RestLi-Id header nor a JSON body to read the ID from
+        return httpx.Response(201, content=b"<html>Created</html>")
+
+    client._client = httpx.AsyncClient(transport=client._wrap_transport(httpx.MockTransport(handler)))
+    try:
+        params = post.PostParams(text="Hello", idempotency_key="k1")
+        with pytest.raises(InvalidRequest):
+            await post.create_post(params)
+        with pytest.raises(Conflict):
+            await post.create_post(params)
+    finally:
+        await client.close_client()
+    assert len(posts) == 1
+
+def test_stale_pending_claim_becomes_unknown(tmp_path):
+    store = IdempotencyStore(str(tmp_path / "idempotency.db"))
+    assert store.claim("owner", "k", "fp", window=3600, lease=300) == ("claimed", None)
+    assert store.claim("owner", "k", "fp", window=3600, lease=300) == ("pending", None)
+    # A worker that died mid-call can't say whether it published
+    assert store.claim("owner", "k", "fp", window=3600, lease=0) == ("unknown", None)
+    assert store.claim("owner", "k", "fp", window=3600, lease=300) == ("unknown", None)
+
+def test_results_expire_after_the_window(tmp_path):
+    store = IdempotencyStore(str(tmp_path / "idempotency.db"))
+    store.claim("owner", "k", "fp", window=3600, lease=300)
+    store.complete("owner", "k", '{"id": "urn:li:share:1"}')
+    assert store.claim("owner", "k", "fp", window=3600, lease=300) == ("done", '{"id": "urn:li:share:1"}')
+    assert store.replays == 1
+
+    time.sleep(0.01)
+    assert store.claim("owner", "k", "other", window=0.001, lease=300) == ("claimed", None)
+    store.release("owner", "k")
+    assert store.stats()["entries"] == 0
+
+def test_purge_keeps_pending_claims(tmp_path):
+    store = IdempotencyStore(str(tmp_path / "idempotency.db"))
+    store.claim("owner", "done", "fp", window=3600, lease=300)
+    store.complete("owner", "done", "{}")
+    store.claim("owner", "running", "fp", window=3600, lease=300)
+    time.sleep(0.01)
+    assert store.purge(0.001) == 1
+    assert store.claim("owner", "running", "fp", window=3600, lease=300) == ("pending", None)
+
+def _status_error(status):
+    request = httpx.Request("POST", f"{settings.api_base}/ugcPosts")
+    return httpx.HTTPStatusError("failed", request=request, response=httpx.Response(status, request=request))
+
+def _validation_error():
+    try:
+        post.PostCreated.model_validate({})
+    except ValidationError as e:
+        return e
+
+def _mapped(e):
+    # What a tool raises: `raise api_error(e) from e`
+    error = api_error(e)
+    error.__cause__ = e
+    return error
+
+@pytest.mark.parametrize("error, expected", [
+    (InvalidRequest("bad input"), True),
+    (NotFound("missing", 404), True),
+    (_status_error(422), True),
+    (_status_error(503), False),
+    (CircuitOpenError("open"), True),
+    (httpx.ConnectError("refused"), True),
+    (FileNotFoundError("image.png"), True),
+    (httpx.ReadTimeout("timed out"), False),
+    (httpx.RemoteProtocolError("dropped"), False),
+    (asyncio.CancelledError(), False),
+    (ApiError("LinkedIn accepted the request (201) but returned no ID.", 201), False),
+    (_mapped(json.JSONDecodeError("Expecting value", "<html>", 0)), False),
+    (_mapped(_validation_error()), False),
+    (_mapped(RuntimeError("unexpected")), False),
+])
+def test_never_sent(error, expected):
+    assert never_sent(error) is expected
+
+def test_never_sent_looks_through_mapped_errors():
+    timeout = httpx.ReadTimeout("timed out")
+    mapped = Unavailable("timed out")
+    mapped.__cause__ = timeout
+    assert not never_sent(mapped)
@@ -0,0 +1,79 @@
+import time
+from email.utils import formatdate
+import httpx
+import pytest
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.ratelimit import RateLimiter, RateLimitTransport, TokenBucket, retry_after_seconds
+
+class Sequence(httpx.AsyncBaseTransport):
+    """Answers with the given status codes in turn, then 200s."""
+
+    def __init__(self, *responses: httpx.Response) -> None:
+        self.responses = list(responses)
+        self.sent = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.sent += 1
+        return self.responses.pop(0) if self.responses else httpx.Response(200, json={})
+
+async def test_bucket_allows_a_burst_then_refills_at_rate():
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    started = time.monotonic()
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.04
+
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.04
+
+async def test_pause_holds_every_caller():
+    bucket = TokenBucket(rate=1000.0, capacity=10)
+    bucket.pause(0.1)
+    assert bucket.stats()["paused_for"] > 0
+
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+    assert bucket.waiting == 0
+
+def test_retry_after_parses_seconds_and_dates():
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "3"})) == 3.0
+    date = formatdate(time.time() + 60, usegmt=True)
+    assert 55 <= retry_after_seconds(httpx.Response(429, headers={"Retry-After": date})) <= 60
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+def test_families_group_endpoints():
+    limiter = RateLimiter()
+    assert limiter.family_for(httpx.URL(f"{settings.api_base}/ugcPosts")) == "posts"
+    assert limiter.family_for(httpx.URL(f"{settings.api_base}/jobSearch?keywords=x")) == "search"
+    assert limiter.family_for(httpx.URL(f"{settings.api_base}/me")) == "default"
+    assert limiter.family_for(httpx.URL("https://www.linkedin.com/oauth/v2/accessToken")) is None
+
+@pytest.fixture
+def limited(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "rate_limit_max_retries", 2)
+    monkeypatch.setattr(settings, "rate_limit_max_wait", 1.0)
+
+async def test_throttled_request_is_resent_after_retry_after(limited):
+    upstream = Sequence(httpx.Response(429, headers={"Retry-After": "0.05"}))
+    limiter = RateLimiter()
+    async with httpx.AsyncClient(transport=RateLimitTransport(upstream, limiter)) as client:
+        started = time.monotonic()
+        resp = await client.get(f"{settings.api_base}/ugcPosts")
+    assert resp.status_code == 200
+    assert upstream.sent == 2
+    assert time.monotonic() - started >= 0.05
+    assert limiter.stats()["families"]["posts"]["queue_depth"] == 0
+
+async def test_streamed_upload_is_not_resent(limited):
+    upstream = Sequence(httpx.Response(429, headers={"Retry-After": "0"}))
+
+    async def body():
+        yield b"image bytes"
+
+    async with httpx.AsyncClient(transport=RateLimitTransport(upstream, RateLimiter())) as client:
+        resp = await client.post(f"{settings.api_base}/assets", content=body())
+    assert resp.status_code == 429
+    assert upstream.sent == 1
@@ -0,0 +1,80 @@
+import time
+import httpx
+import pytest
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.resilience import CircuitBreaker, CircuitBreakers, CircuitOpenError, ResilienceTransport
+
+class Sequence(httpx.AsyncBaseTransport):
+    """Answers with the given status codes (or raises the given errors) in turn, then 200s."""
+
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.sent = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.sent += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, type):
+            raise outcome("injected", request=request)
+        return httpx.Response(outcome, json={})
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(threshold=5, reset_timeout=0.01)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+@pytest.fixture
+def breakers(monkeypatch):
+    monkeypatch.setattr(settings, "retry_max_attempts", 3)
+    monkeypatch.setattr(settings, "circuit_failure_threshold", 3)
+    monkeypatch.setattr(settings, "circuit_reset_timeout", 60.0)
+    return CircuitBreakers()
+
+async def test_reads_are_retried_on_5xx_and_transport_errors(breakers):
+    upstream = Sequence(503, httpx.ReadError)
+    async with httpx.AsyncClient(transport=ResilienceTransport(upstream, breakers)) as client:
+        resp = await client.get(f"{settings.api_base}/ugcPosts")
+    assert resp.status_code == 200
+    assert upstream.sent == 3
+    assert breakers.for_host("linkedin.test").state == "closed"
+
+async def test_writes_are_not_retried(breakers):
+    upstream = Sequence(503)
+    async with httpx.AsyncClient(transport=ResilienceTransport(upstream, breakers)) as client:
+        resp = await client.post(f"{settings.api_base}/ugcPosts", json={})
+    assert resp.status_code == 503
+    assert upstream.sent == 1
+
+async def test_open_circuit_fails_fast(breakers):
+    upstream = Sequence(503, 503, 503)
+    async with httpx.AsyncClient(transport=ResilienceTransport(upstream, breakers)) as client:
+        assert (await client.get(f"{settings.api_base}/ugcPosts")).status_code == 503
+        with pytest.raises(CircuitOpenError):
+            await client.get(f"{settings.api_base}/ugcPosts")
+    assert upstream.sent == 3
+    assert breakers.stats()["linkedin.test"]["state"] == "open"
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+from fastmcp import Client
+from linkedin_mcp_server import client
+from linkedin_mcp_server.errors import ApiError
+from linkedin_mcp_server.server import mcp
+from linkedin_mcp_server.tools.post import CommentParams, PostParams, create_comment, create_post
+
+@pytest.fixture
+async def created(request):
+    """LinkedIn stand-in whose create calls answer 201 with the given headers and body."""
+    headers, body = request.param
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        if req.url.path.endswith("/userinfo"):
+            return httpx.Response(200, json={"sub": "me"})
+        return httpx.Response(201, headers=headers, content=body)
+
+    client._client = httpx.AsyncClient(transport=client._wrap_transport(httpx.MockTransport(handler)))
+    try:
+        yield
+    finally:
+        await client.close_client()
+
+@pytest.mark.parametrize("created", [({"X-RestLi-Id": "urn:li:share:7"}, b"")], indirect=True)
+async def test_empty_201_takes_the_id_from_the_header(created):
+    assert (await create_post(PostParams(text="Hello"))).id == "urn:li:share:7"
+    assert (await create_comment(CommentParams(object_urn="urn:li:share:7", text="Hi"))).id == "urn:li:share:7"
+
+@pytest.mark.parametrize("created", [({}, b'{"id": "urn:li:share:8"}')], indirect=True)
+async def test_id_falls_back_to_the_body(created):
+    assert (await create_post(PostParams(text="Hello"))).id == "urn:li:share:8"
+
+@pytest.mark.parametrize("created", [({}, b"")], indirect=True)
+async def test_created_without_an_id_is_an_error(created):
+    with pytest.raises(ApiError):
+        await create_post(PostParams(text="Hello"))
+
+async def test_tools_return_structured_results(mock_api):
+    async with Client(mcp) as session:
+        result = await session.call_tool("linkedin_create_post", {"text": "Hello"})
+
+    assert result.structured_content == {"id": "urn:li:share:1", "asset_urns": [], "replayed": False}
+    assert result.content[0].text == '{"id":"urn:li:share:1","asset_urns":[],"replayed":false}'
+
+async def test_failures_are_error_results(mock_api):
+    async with Client(mcp) as session:
+        result = await session.call_tool(
+            "linkedin_delete_post", {"post_urn": "urn:li:share:1"}, raise_on_error=False
+        )
+        mock_api.fail("POST", "/ugcPosts", lambda r: httpx.ConnectError("refused", request=r))
+        failed = await session.call_tool("linkedin_create_post", {"text": "Hello"}, raise_on_error=False)
+
+    assert not result.is_error
+    assert failed.is_error
+    assert "refused" in failed.content[0].text
@@ -0,0 +1,136 @@
+import asyncio
+import sqlite3
+import time
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.scheduler import PostQueue, Scheduler, get_queue
+
+LEASE = 600.0
+
+def test_live_lease_is_not_taken_over(tmp_path):
+    path = str(tmp_path / "queue.db")
+    worker_a, worker_b = PostQueue(path), PostQueue(path)
+    post_id = worker_a.add("text", {"text": "Hello"}, time.time())
+
+    item = worker_a.claim_due(time.time(), "a", LEASE)
+    assert item["id"] == post_id
+    # A second process starting up, or polling, leaves the running post alone
+    assert worker_b.recover(LEASE) == 0
+    assert worker_b.claim_due(time.time(), "b", LEASE) is None
+    assert worker_a.renew(post_id, "a")
+
+def test_expired_lease_moves_to_another_worker(tmp_path):
+    path = str(tmp_path / "queue.db")
+    worker_a, worker_b = PostQueue(path), PostQueue(path)
+    post_id = worker_a.add("text", {"text": "Hello"}, time.time() - 2 * LEASE)
+    # Worker a claimed the post long ago and stopped renewing (crashed or hung)
+    worker_a.claim_due(time.time() - 2 * LEASE, "a", LEASE)
+
+    item = worker_b.claim_due(time.time(), "b", LEASE)
+    assert item["id"] == post_id
+    assert not worker_a.renew(post_id, "a")
+
+    # The old worker's late outcome doesn't overwrite the new owner's
+    worker_a.finish(post_id, "a", "failed", "stale")
+    worker_b.finish(post_id, "b", "published", "urn:li:share:1")
+    [row] = worker_b.list()
+    assert (row["status"], row["result"]) == ("published", "urn:li:share:1")
+
+def test_recover_resets_only_expired_leases(tmp_path):
+    queue = PostQueue(str(tmp_path / "queue.db"))
+    live = queue.add("text", {"text": "live"}, time.time())
+    queue.claim_due(time.time(), "alive", LEASE)
+    stale = queue.add("text", {"text": "stale"}, time.time() - 2 * LEASE)
+    queue.claim_due(time.time() - 2 * LEASE, "dead", LEASE)
+
+    assert queue.recover(LEASE) == 1
+    statuses = {row["id"]: (row["status"], row["claimed_by"]) for row in queue.list()}
+    assert statuses[stale] == ("pending", None)
+    assert statuses[live] == ("running", "alive")
+
+def test_queue_created_before_leases_is_migrated(tmp_path):
+    path = str(tmp_path / "queue.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE scheduled_posts (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+        "payload TEXT NOT NULL, publish_at REAL NOT NULL, status TEXT NOT NULL DEFAULT 'pending', "
+        "result TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL);"
+        "INSERT INTO scheduled_posts (kind, payload, publish_at, status, created_at, updated_at) "
+        "VALUES ('text', '{\"text\": \"old\"}', 0, 'running', 0, 0);"
+    )
+    conn.close()
+
+    queue = PostQueue(path)
+    assert queue.recover(LEASE) == 1
+    assert queue.claim_due(time.time(), "a", LEASE)["claimed_by"] is None
+
+async def _wait_for_status(post_id, status, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        row = next(row for row in get_queue().list() if row["id"] == post_id)
+        if row["status"] == status:
+            return row
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"post {post_id} stayed {row['status']}")
+
+async def test_crashed_worker_post_is_published_once(mock_api, monkeypatch):
+    monkeypatch.setattr(settings, "schedule_lease", LEASE)
+    monkeypatch.setattr(settings, "schedule_poll_interval", 0.05)
+    queue = get_queue()
+    post_id = queue.add("text", {"text": "Hello"}, time.time() - 2 * LEASE)
+
+    # Worker a publishes, then its process dies before recording the outcome
+    crashed = Scheduler()
+    item = queue.claim_due(time.time() - 2 * LEASE, crashed.id, LEASE)
+    status, first_id = await crashed._publish(item)
+    assert status == "published"
+
+    survivor = Scheduler()
+    await survivor.start()
+    try:
+        row = await _wait_for_status(post_id, "published")
+    finally:
+        await survivor.stop()
+    assert row["result"] == first_id
+    assert row["claimed_by"] == survivor.id
+    assert mock_api.count("POST", "/ugcPosts") == 1
+
+async def test_workers_in_two_processes_publish_each_post_once(mock_api, monkeypatch):
+    monkeypatch.setattr(settings, "schedule_poll_interval", 0.05)
+    queue = get_queue()
+    post_ids = [queue.add("text", {"text": f"Post {i}"}, time.time()) for i in range(6)]
+
+    workers = [Scheduler(), Scheduler()]
+    for worker in workers:
+        await worker.start()
+    try:
+        rows = [await _wait_for_status(post_id, "published") for post_id in post_ids]
+    finally:
+        for worker in workers:
+            await worker.stop()
+    assert len({row["result"] for row in rows}) == len(post_ids)
+    assert mock_api.count("POST", "/ugcPosts") == len(post_ids)
+
+async def test_worker_survives_queue_errors(mock_api, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "schedule_poll_interval", 0.01)
+    monkeypatch.setattr(settings, "schedule_workers", 1)
+    queue = get_queue()
+    post_id = queue.add("text", {"text": "Hello"}, time.time())
+    claim_due = PostQueue.claim_due
+    failures = []
+
+    def locked_twice(self, *args):
+        if len(failures) < 2:
+            failures.append(args)
+            raise sqlite3.OperationalError("database is locked")
+        return claim_due(self, *args)
+
+    monkeypatch.setattr(PostQueue, "claim_due", locked_twice)
+    worker = Scheduler()
+    await worker.start()
+    try:
+        row = await _wait_for_status(post_id, "published")
+    finally:
+        await worker.stop()
+    assert row["claimed_by"] == worker.id
+    assert len(failures) == 2
+    assert "database is locked" in caplog.text
@@ -0,0 +1,46 @@
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.search_index import SearchIndex, indexed_search
+
+def test_search_index_prefers_all_terms(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.add("s", "job", "url-1", [
+        {"id": "urn:li:job:1", "title": "Python developer", "location": "Berlin"},
+        {"id": "urn:li:job:2", "title": "Python developer", "location": "Paris"},
+        {"id": "urn:li:job:3", "title": "Rust engineer", "location": "Berlin"},
+    ])
+
+    assert [hit["urn"] for hit in index.search("s", "job", "python berlin", 10)] == ["urn:li:job:1"]
+    # Prefix terms: 'dev' matches 'developer'
+    assert {hit["urn"] for hit in index.search("s", "job", "dev", 10)} == {"urn:li:job:1", "urn:li:job:2"}
+    # No document has both terms: any-term fallback only when asked for
+    assert len(index.search("s", "job", "rust paris", 10)) == 2
+    assert index.search("s", "job", "rust paris", 10, any_term=False) == []
+
+def test_search_index_keeps_scopes_and_kinds_apart(tmp_path):
+    index = SearchIndex(str(tmp_path / "search.db"))
+    index.add("token-a", "job", "url", [{"id": "urn:li:job:1", "title": "Python developer"}])
+    index.add("token-a", "job", "url", [{"id": "urn:li:job:1", "title": "Go developer"}])
+
+    assert index.search("token-b", "job", "developer", 10) == []
+    assert index.search("token-a", "person", "developer", 10) == []
+    assert index.search("token-a", "job", "python", 10, any_term=False) == []
+    assert index.stats()["job"]["entries"] == 1
+
+async def test_indexed_search_answers_from_the_index(mock_api):
+    url = f"{settings.api_base}/companySearch?q=search&keywords=acme"
+    headers = {"Authorization": "Bearer test-token"}
+    live = await indexed_search("organization", url, headers, "companySearch", "acme")
+    assert len(live["elements"]) == 10
+    assert mock_api.count("GET", "/companySearch") == 1
+
+    local = await indexed_search("organization", url, headers, "companySearch", "acme widgets", local_only=True)
+    assert local["index"]["source"] == "local"
+    assert len(local["elements"]) == 10
+
+    fresh = await indexed_search("organization", url, headers, "companySearch", "acme organization", max_age=3600)
+    assert fresh["index"]["stale"] == 0
+    assert mock_api.count("GET", "/companySearch") == 1
+
+    # A partial match can't stand in for a live search
+    await indexed_search("organization", url, headers, "companySearch", "acme widgets", max_age=3600)
+    assert mock_api.count("GET", "/companySearch") == 2
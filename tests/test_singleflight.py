@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+from linkedin_mcp_server.cache import cached_get_json, response_cache
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.singleflight import SingleFlight
+
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+    assert results == [1] * 5
+    assert calls == 1
+    assert flight.coalesced == 4
+    assert flight.in_flight() == 0
+
+async def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", fetch))
+    second = asyncio.ensure_future(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    assert flight.running("k")
+
+    first.cancel()
+    release.set()
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+async def test_call_finishes_after_every_caller_is_cancelled():
+    flight = SingleFlight()
+    finished = asyncio.Event()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        finished.set()
+        raise RuntimeError("nobody is waiting")
+
+    caller = asyncio.ensure_future(flight.do("k", fetch))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.wait_for(finished.wait(), 1.0)
+    await asyncio.sleep(0)
+    assert not flight.running("k")
+
+async def test_failure_reaches_every_caller_and_frees_the_key():
+    flight = SingleFlight()
+    attempts = 0
+
+    async def fetch():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise ValueError("boom")
+        return "ok"
+
+    results = await asyncio.gather(flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert await flight.do("k", fetch) == "ok"
+    assert attempts == 2
+
+async def test_identical_concurrent_gets_share_one_request(mock_api):
+    url = f"{settings.api_base}/jobs/urn%3Ali%3Ajob%3A1"
+    headers = {"Authorization": "Bearer test-token"}
+    results = await asyncio.gather(*(cached_get_json(url, headers, "jobs") for _ in range(5)))
+
+    assert all(result == results[0] for result in results)
+    assert mock_api.count("GET", "/jobs/urn:li:job:1") == 1
+    assert response_cache.upstream.coalesced == 4
+
+async def test_abandoned_call_is_cancelled_when_asked():
+    flight = SingleFlight(cancel_abandoned=True)
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def write():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(flight.do("k", write))
+    second = asyncio.ensure_future(flight.do("k", write))
+    await started.wait()
+
+    # Another caller is still waiting: the call carries on
+    first.cancel()
+    await asyncio.wait([first])
+    assert flight.running("k")
+
+    second.cancel()
+    await asyncio.wait([second])
+    assert cancelled.is_set()
+    assert not flight.running("k")
@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+from linkedin_mcp_server import backends, idempotency
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.errors import Conflict
+from linkedin_mcp_server.tasks import FINISHED, report_progress
+from linkedin_mcp_server.tools.post import PostParams, create_post
+from linkedin_mcp_server.tools.task import cancel_task, get_task_status, start_task
+
+async def finished(task_id: str):
+    while True:
+        status = await get_task_status(task_id)
+        if status.status in FINISHED:
+            return status
+        await asyncio.sleep(0.01)
+
+async def test_progress_is_reported_while_running():
+    step, go = asyncio.Event(), asyncio.Event()
+
+    async def work():
+        await report_progress("Uploading images", 1, 3)
+        step.set()
+        await go.wait()
+        return {"ok": True}
+
+    started = await start_task("work", work)
+    await step.wait()
+    status = await get_task_status(started.task_id)
+    assert status.status == "running"
+    assert (status.progress.done, status.progress.total, status.progress.message) == (1, 3, "Uploading images")
+
+    go.set()
+    status = await finished(started.task_id)
+    assert status.status == "completed"
+    assert status.result == {"ok": True}
+
+async def test_cancelled_keyed_write_is_not_sent(mock_api):
+    hold = mock_api.hold("POST", "/ugcPosts")
+    started = await start_task("create_post", lambda: create_post(PostParams(text="Hello", idempotency_key="k1")))
+    await hold.arrived.wait()
+
+    assert (await cancel_task(started.task_id)).status == "cancelled"
+    # The shared write was cancelled with its only caller, not left to publish on its own
+    assert idempotency._calls.in_flight() == 0
+    hold.release.set()
+    await asyncio.sleep(0.01)
+    assert (await get_task_status(started.task_id)).status == "cancelled"
+    assert mock_api.count("POST", "/ugcPosts") == 0
+
+    # It might have reached LinkedIn, so the key isn't silently reusable
+    with pytest.raises(Conflict):
+        await create_post(PostParams(text="Hello", idempotency_key="k1"))
+
+async def test_cancel_from_another_worker_stops_at_the_next_step(monkeypatch):
+    monkeypatch.setattr(settings, "state_backend", "sqlite")
+    step = asyncio.Event()
+
+    async def work():
+        await report_progress("Step 1")
+        step.set()
+        await asyncio.sleep(0.05)
+        await report_progress("Step 2")
+        await asyncio.sleep(10)
+
+    started = await start_task("work", work)
+    await step.wait()
+    # What cancel_task records when the task runs on another worker
+    await backends.get_shared_backend().set("task_cancel", started.task_id, True, settings.task_retention)
+
+    status = await finished(started.task_id)
+    assert status.status == "cancelled"
+    assert status.progress.message == "Step 2"
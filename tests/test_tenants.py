@@ -0,0 +1,81 @@
+from collections import OrderedDict
+import pytest
+from linkedin_mcp_server.cache import cached_get_json, response_cache
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.identity import get_person_urn
+from linkedin_mcp_server.tenants import tenant_registry, use_tenant
+from linkedin_mcp_server.utils import get_headers
+
+def job_url() -> str:
+    return f"{settings.api_base}/jobs/urn%3Ali%3Ajob%3A1"
+
+@pytest.fixture
+def multi_tenant(monkeypatch):
+    monkeypatch.setattr(settings, "multi_tenant", True)
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(tenant_registry, "_tenants", OrderedDict())
+    monkeypatch.setattr(tenant_registry, "_sessions", OrderedDict())
+
+async def test_each_tenant_uses_its_own_token(multi_tenant):
+    alice, bob = tenant_registry.resolve("alice-token"), tenant_registry.resolve("bob-token")
+    with use_tenant(alice):
+        assert (await get_headers())["Authorization"] == "Bearer alice-token"
+    with use_tenant(bob):
+        assert (await get_headers())["Authorization"] == "Bearer bob-token"
+    with use_tenant(None):
+        with pytest.raises(ValueError):
+            await get_headers()
+
+async def test_tenants_never_share_cached_responses(multi_tenant, mock_api):
+    alice, bob = tenant_registry.resolve("alice-token"), tenant_registry.resolve("bob-token")
+    for tenant in (alice, bob, alice, bob):
+        with use_tenant(tenant):
+            await cached_get_json(job_url(), await get_headers(), "jobs")
+            await get_person_urn(await get_headers())
+
+    jobs = [r for r in mock_api.received if r.url.path.endswith("/jobs/urn:li:job:1")]
+    assert [r.headers["Authorization"] for r in jobs] == ["Bearer alice-token", "Bearer bob-token"]
+    assert mock_api.count("GET", "/userinfo") == 2
+
+async def test_tenants_spend_their_own_rate_limit_budget(multi_tenant, mock_api):
+    alice, bob = tenant_registry.resolve("alice-token"), tenant_registry.resolve("bob-token")
+    for tenant in (alice, bob):
+        with use_tenant(tenant):
+            await cached_get_json(job_url(), await get_headers(), "jobs")
+
+    assert alice.limiter is not bob.limiter
+    assert list(alice.limiter.stats()["families"]) == ["default"]
+    assert list(bob.limiter.stats()["families"]) == ["default"]
+
+async def test_idle_tenant_is_dropped_with_its_cache(multi_tenant, mock_api, monkeypatch):
+    alice = tenant_registry.resolve("alice-token")
+    with use_tenant(alice):
+        await cached_get_json(job_url(), await get_headers(), "jobs")
+    assert response_cache.stats()["entries"] == 1
+
+    alice.last_used -= 2 * settings.tenant_idle_timeout
+    tenant_registry.resolve("bob-token")
+    assert tenant_registry.stats()["tenants"] == 1
+    assert tenant_registry.evictions == 1
+    assert response_cache.stats()["entries"] == 0
+
+def test_session_logins_expire_when_idle(multi_tenant, monkeypatch):
+    tenant_registry.bind_session("session-1", "alice-token")
+    assert tenant_registry.session_token("session-1") == "alice-token"
+    assert tenant_registry.session_token("other-session") is None
+
+    monkeypatch.setattr(settings, "tenant_idle_timeout", 0.0)
+    assert tenant_registry.session_token("session-1") is None
+    assert tenant_registry.stats()["sessions_with_login"] == 0
+
+def test_session_logins_are_bounded(multi_tenant, monkeypatch):
+    monkeypatch.setattr(settings, "tenant_max_tenants", 2)
+    for i in range(3):
+        tenant_registry.bind_session(f"session-{i}", f"token-{i}")
+    # Looking up session-1 makes session-2 the least recently used
+    assert tenant_registry.session_token("session-1") == "token-1"
+    tenant_registry.bind_session("session-3", "token-3")
+
+    assert tenant_registry.session_token("session-0") is None
+    assert tenant_registry.session_token("session-2") is None
+    assert tenant_registry.session_token("session-1") == "token-1"
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import stat
+import time
+import httpx
+import pytest
+from linkedin_mcp_server import client
+from linkedin_mcp_server.config import settings
+from linkedin_mcp_server.tokens import TOKEN_URL, _write_env, token_store
+
+def test_env_update_keeps_other_lines(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("# LinkedIn\nLINKEDIN_CLIENT_ID=abc\nLINKEDIN_ACCESS_TOKEN=old\nLINKEDIN_REFRESH_TOKEN=r\n")
+    os.chmod(path, 0o600)
+
+    _write_env(str(path), {"LINKEDIN_ACCESS_TOKEN": "new", "LINKEDIN_REFRESH_TOKEN": None, "LINKEDIN_TOKEN_EXPIRES_AT": "99"})
+
+    assert path.read_text().splitlines() == [
+        "# LinkedIn", "LINKEDIN_CLIENT_ID=abc", "LINKEDIN_ACCESS_TOKEN=new", "LINKEDIN_TOKEN_EXPIRES_AT=99",
+    ]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")) == [".env"]
+
+def test_failed_env_write_leaves_the_old_file(tmp_path, monkeypatch):
+    path = tmp_path / ".env"
+    path.write_text("LINKEDIN_ACCESS_TOKEN=old\n")
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", broken_replace)
+    with pytest.raises(OSError):
+        _write_env(str(path), {"LINKEDIN_ACCESS_TOKEN": "new"})
+    assert path.read_text() == "LINKEDIN_ACCESS_TOKEN=old\n"
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")) == [".env"]
+
+@pytest.fixture
+async def token_endpoint(monkeypatch):
+    """Stand-in OAuth token endpoint on the shared client; yields the refresh requests it got."""
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"access_token": f"fresh-{len(requests)}", "expires_in": 3600})
+
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        yield requests
+    finally:
+        await client.close_client()
+
+async def test_concurrent_callers_share_one_refresh(token_endpoint, monkeypatch):
+    monkeypatch.setattr(settings, "linkedin_refresh_token", "refresh-1")
+    monkeypatch.setattr(settings, "linkedin_token_expires_at", time.time() - 10)
+
+    headers = await asyncio.gather(*(token_store.get_headers() for _ in range(5)))
+
+    assert len(token_endpoint) == 1
+    assert str(token_endpoint[0].url) == TOKEN_URL
+    assert {h["Authorization"] for h in headers} == {"Bearer fresh-1"}
+    assert "LINKEDIN_ACCESS_TOKEN=fresh-1" in open(settings.token_env_path).read()
+
+async def test_token_close_to_expiry_is_refreshed_in_the_background(token_endpoint, monkeypatch):
+    monkeypatch.setattr(settings, "linkedin_refresh_token", "refresh-1")
+    monkeypatch.setattr(settings, "linkedin_token_expires_at", time.time() + 60)
+
+    # Still valid: served straight away while the refresh runs
+    assert (await token_store.get_headers())["Authorization"] == "Bearer test-token"
+    await token_store._background
+    assert (await token_store.get_headers())["Authorization"] == "Bearer fresh-1"
+    assert len(token_endpoint) == 1